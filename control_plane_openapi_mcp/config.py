@@ -49,6 +49,56 @@ def get_control_plane_url() -> str:
 CONTROL_PLANE_URL = get_control_plane_url()
 CACHE_TTL = int(os.getenv('CACHE_TTL', '3600'))  # 1 hour default
 SPEC_ID = "facets-control-plane"
+# OpenAPI document as a file:// URL or local path instead of fetching it from the control plane;
+# several comma-separated URLs or paths are merged into one catalog
+OPENAPI_SPEC_SOURCE = os.getenv('OPENAPI_SPEC_SOURCE', '')
+# springdoc API groups merged into one catalog: comma-separated group names, or * to discover them
+OPENAPI_GROUPS = os.getenv('OPENAPI_GROUPS', '').strip()
+SPEC_WATCH_INTERVAL = float(os.getenv('SPEC_WATCH_INTERVAL', '2'))  # Seconds between checks of a local spec (0 disables)
+SPEC_ARTIFACT_PATH = os.getenv('SPEC_ARTIFACT_PATH', '')  # Precompiled spec index (optional)
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'fuzzy').lower()  # fuzzy, fts or tfidf
+SEARCH_DB_PATH = os.path.expanduser(os.getenv('SEARCH_DB_PATH', ''))  # Persisted FTS index (optional, in memory if empty)
+# Compiled specs shared by server processes on this machine (optional)
+SHARED_SPEC_CACHE_DIR = os.path.expanduser(os.getenv('SHARED_SPEC_CACHE_DIR', ''))
+
+# Schema rendering bounds for load_api_schema_by_schemaName
+SCHEMA_MAX_DEPTH = int(os.getenv('SCHEMA_MAX_DEPTH', '2'))
+SCHEMA_MAX_BYTES = int(os.getenv('SCHEMA_MAX_BYTES', '50000'))
+
+# Cache of rendered schemas, filled ahead of time for schemas of loaded operations
+SCHEMA_RENDER_CACHE_BYTES = int(os.getenv('SCHEMA_RENDER_CACHE_BYTES', '8000000'))
+SCHEMA_PREFETCH_WORKERS = int(os.getenv('SCHEMA_PREFETCH_WORKERS', '2'))  # 0 disables prefetching
+
+# Anonymized access counts used to warm caches on startup (optional)
+HOT_SET_PATH = os.path.expanduser(os.getenv('HOT_SET_PATH', ''))
+HOT_SET_WARM_ENTRIES = int(os.getenv('HOT_SET_WARM_ENTRIES', '30'))
+
+# Default per-call token budget for tool responses (0 disables shaping)
+OUTPUT_TOKEN_BUDGET = int(os.getenv('OUTPUT_TOKEN_BUDGET', '20000'))
+
+# Worker threads for blocking tool work (spec processing, search, rendering)
+TOOL_WORKERS = int(os.getenv('TOOL_WORKERS', '4'))
+
+# Resilience of call_control_plane_api requests
+API_RATE_LIMIT = float(os.getenv('API_RATE_LIMIT', '10'))  # Requests per second per control plane (0 disables)
+API_RATE_BURST = int(os.getenv('API_RATE_BURST', '20'))
+API_MAX_RETRIES = int(os.getenv('API_MAX_RETRIES', '3'))
+API_REQUEST_DEADLINE = float(os.getenv('API_REQUEST_DEADLINE', '60'))  # Seconds per call including retries
+API_MAX_CONCURRENCY = int(os.getenv('API_MAX_CONCURRENCY', '16'))
+API_BREAKER_ERROR_RATE = float(os.getenv('API_BREAKER_ERROR_RATE', '0.5'))
+API_BREAKER_COOLDOWN = float(os.getenv('API_BREAKER_COOLDOWN', '15'))
+
+# Auto-pagination of list endpoints by call_control_plane_api
+AUTO_PAGINATE_MAX_ITEMS = int(os.getenv('AUTO_PAGINATE_MAX_ITEMS', '1000'))
+AUTO_PAGINATE_CONCURRENCY = int(os.getenv('AUTO_PAGINATE_CONCURRENCY', '4'))
+
+# Transport: stdio (one process per assistant session) or streamable-http/sse (shared server)
+MCP_TRANSPORT = os.getenv('MCP_TRANSPORT', 'stdio').lower()
+MCP_HOST = os.getenv('MCP_HOST', '127.0.0.1')
+MCP_PORT = int(os.getenv('MCP_PORT', '8000'))
+MCP_SHUTDOWN_TIMEOUT = int(os.getenv('MCP_SHUTDOWN_TIMEOUT', '10'))  # Seconds to drain requests on shutdown
+# Let HTTP sessions without their own credentials fall back to the server's credentials
+MCP_HTTP_SHARED_CREDENTIALS = os.getenv('MCP_HTTP_SHARED_CREDENTIALS', 'false').lower() in ('1', 'true', 'yes')
 
 # Authentication configuration (optional)
 FACETS_USERNAME = os.getenv('FACETS_USERNAME', '')
@@ -56,7 +106,16 @@ FACETS_TOKEN = os.getenv('FACETS_TOKEN', '')
 FACETS_PROFILE = os.getenv('FACETS_PROFILE', 'default')
 
 # Derived URLs
-OPENAPI_URL = f"{CONTROL_PLANE_URL}/v3/api-docs"
+if OPENAPI_SPEC_SOURCE:
+    OPENAPI_URL = OPENAPI_SPEC_SOURCE
+elif OPENAPI_GROUPS == '*':
+    OPENAPI_URL = f"{CONTROL_PLANE_URL}/v3/api-docs/swagger-config"
+elif OPENAPI_GROUPS:
+    OPENAPI_URL = ','.join(
+        f"{CONTROL_PLANE_URL}/v3/api-docs/{group.strip()}" for group in OPENAPI_GROUPS.split(',') if group.strip()
+    )
+else:
+    OPENAPI_URL = f"{CONTROL_PLANE_URL}/v3/api-docs"
 
 # Initialize MCP server
 mcp = FastMCP("Facets Control Plane OpenAPI")
@@ -0,0 +1,395 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import logging
+
+from .field_index import FieldIndex
+from .models import SpecCatalogEntry
+from .schema_graph import SchemaGraph
+from .spec_loader import SpecLoader
+from .spec_processor import SpecProcessor
+from ..utils.compression import DictionaryCodec
+from ..utils.schema_extractor import create_safe_operation_output, index_component_properties
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MAGIC = b"CPOAIDX\0"
+ARTIFACT_FORMAT_VERSION = 7
+
+# magic, format version, index offset, index length
+_HEADER = struct.Struct("<8sIQQ")
+
+# Key table record: key offset, key length, value offset, value length
+_RECORD = struct.Struct("<QIQI")
+# Key table slot: record number, in key order
+_SLOT = struct.Struct("<I")
+
+# Lookup maps stored as key tables rather than in the JSON index
+_TABLES = ('paths', 'schemas', 'raw_schemas', 'rendered_operations', 'operation_ids')
+
+
+def _operation_key(path: str, method: str) -> str:
+    """Key used for per-operation entries in the artifact index."""
+    return f"{method.upper()} {path}"
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _pack_table(items: Dict[str, Any], position: int) -> Tuple[bytes, List[int]]:
+    """
+    Pack a lookup map into a key table placed at a file position.
+
+    Keys are stored next to fixed-size records in insertion order, followed
+    by the record numbers sorted by key, so readers binary-search the table
+    in place. Values are (offset, length) pairs of entries, or strings that
+    are stored next to the keys.
+
+    Returns:
+        The packed bytes and the table descriptor [records offset, slots offset, count]
+    """
+    strings = bytearray()
+    records = []
+    for key, value in items.items():
+        key_bytes = key.encode('utf-8')
+        key_offset = position + len(strings)
+        strings += key_bytes
+        if isinstance(value, str):
+            value_bytes = value.encode('utf-8')
+            value = [position + len(strings), len(value_bytes)]
+            strings += value_bytes
+        records.append((key_bytes, _RECORD.pack(key_offset, len(key_bytes), value[0], value[1])))
+    records_offset = position + len(strings)
+    slots_offset = records_offset + len(records) * _RECORD.size
+    order = sorted(range(len(records)), key=lambda number: records[number][0])
+    packed = bytes(strings) + b''.join(record for _, record in records) + b''.join(_SLOT.pack(n) for n in order)
+    return packed, [records_offset, slots_offset, len(records)]
+
+
+def compile_artifact(
+    spec: Dict[str, Any],
+    output_path: str,
+    spec_id: str,
+    source_url: str = '',
+    schema_graph: Optional[SchemaGraph] = None,
+    raw_schemas: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Compile a processed OpenAPI spec into a binary index artifact.
+
+    The artifact is a fixed header followed by JSON-encoded entries, binary
+    key tables mapping paths, schema names and operation IDs to their
+    entries, and a small trailing JSON index, so readers can memory-map the
+    file and decode only the entries they touch. Opening an artifact parses
+    only the trailing index; lookups binary-search the key tables in place.
+    Entries are compressed individually against a dictionary trained on the
+    entries themselves (zstd when available, zlib otherwise), which is
+    stored in the artifact.
+
+    Args:
+        spec: The processed (dereferenced) OpenAPI specification
+        output_path: Where to write the artifact
+        spec_id: Identifier of the spec
+        source_url: URL the spec was fetched from, recorded for reference
+        schema_graph: Schema reference graph built from the raw spec, if available
+        raw_schemas: Component schemas with their $refs intact, for bounded rendering
+
+    Returns:
+        The artifact index metadata (without the entry offsets)
+    """
+    processor = SpecProcessor(spec_id)
+    catalog = processor.build_catalog(spec)
+    components_schemas = spec.get('components', {}).get('schemas', {})
+
+    blobs: List[bytes] = []
+    entries: List[List[int]] = []
+
+    def add(value: Any) -> List[int]:
+        # Offsets are filled in once the blobs are compressed
+        entry = [len(blobs), 0]
+        blobs.append(_encode(value))
+        entries.append(entry)
+        return entry
+
+    index: Dict[str, Any] = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "spec_id": spec_id,
+        "source_url": source_url,
+        "spec_version": spec.get('info', {}).get('version', ''),
+        "spec_hash": hashlib.sha256(_encode(spec)).hexdigest(),
+        "created_at": time.time(),
+        "info": spec.get('info', {}),
+        "catalog": add(catalog.model_dump()),
+        "schema_graph": add(schema_graph.to_dict()) if schema_graph else None,
+        "field_index": add(FieldIndex.from_spec(spec, raw_schemas or components_schemas).to_dict()),
+        "paths": {},
+        "schemas": {},
+        "raw_schemas": {},
+        "rendered_operations": {},
+        "operation_ids": {},
+    }
+
+    for path, path_item in spec.get('paths', {}).items():
+        index["paths"][path] = add(path_item)
+
+    for name, schema in components_schemas.items():
+        index["schemas"][name] = add(schema)
+
+    for name, schema in (raw_schemas or {}).items():
+        index["raw_schemas"][name] = add(schema)
+
+    property_index = index_component_properties(components_schemas)
+    for operation in catalog.operations:
+        op_data = processor.find_operation_by_path_and_method(spec, operation.path, operation.method)
+        if not op_data:
+            continue
+        key = _operation_key(operation.path, operation.method)
+        index["rendered_operations"][key] = add(
+            create_safe_operation_output(op_data['operation'], components_schemas, property_index)
+        )
+        if operation.operation_id:
+            index["operation_ids"][operation.operation_id] = f"{operation.method} {operation.path}"
+
+    codec = DictionaryCodec.train(blobs)
+    raw_size = sum(len(blob) for blob in blobs)
+    position = _HEADER.size + len(codec.dictionary)
+    index["codec"] = {
+        "name": codec.name,
+        "dictionary": [_HEADER.size, len(codec.dictionary)] if codec.dictionary else None,
+    }
+    for number, entry in enumerate(entries):
+        blobs[number] = codec.compress(blobs[number])
+        entry[0], entry[1] = position, len(blobs[number])
+        position += len(blobs[number])
+
+    counts = {name: len(index[name]) for name in _TABLES}
+    for name in _TABLES:
+        packed, index[name] = _pack_table(index[name], position)
+        blobs.append(packed)
+        position += len(packed)
+
+    index_data = _encode(index)
+
+    # Write to a temporary file and rename so readers never observe a partial artifact
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, position, len(index_data)))
+            f.write(codec.dictionary)
+            for blob in blobs:
+                f.write(blob)
+            f.write(index_data)
+        os.replace(tmp_path, output_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(
+        f"Compiled spec artifact {output_path} "
+        f"({counts['paths']} paths, {counts['schemas']} schemas, "
+        f"{position + len(index_data)} bytes, {raw_size} bytes before {codec.name} compression)"
+    )
+    return {k: v for k, v in index.items() if k not in _TABLES}
+
+
+def compile_spec_artifact(loader: SpecLoader, output_path: str, spec_id: str) -> Dict[str, Any]:
+    """
+    Fetch (if needed) and compile the spec of a loader into an artifact.
+
+    Returns:
+        The artifact index metadata, as returned by compile_artifact
+    """
+    spec = loader.get_processed_spec()
+    raw_spec = loader.get_raw_spec()
+    return compile_artifact(
+        spec,
+        output_path,
+        spec_id,
+        source_url=loader.url,
+        schema_graph=SchemaGraph.from_spec(raw_spec),
+        raw_schemas=raw_spec.get('components', {}).get('schemas', {})
+    )
+
+
+class _KeyTable(Mapping):
+    """Read-only mapping from keys to (offset, length) pairs, binary-searched in the mapped file."""
+
+    def __init__(self, buffer: mmap.mmap, descriptor: List[int]):
+        self._buffer = buffer
+        self._records, self._slots, self._count = descriptor
+
+    def _record(self, number: int) -> Tuple[int, int, int, int]:
+        return _RECORD.unpack_from(self._buffer, self._records + number * _RECORD.size)
+
+    def _key(self, record: Tuple[int, int, int, int]) -> bytes:
+        return self._buffer[record[0]:record[0] + record[1]]
+
+    def _find(self, key: object) -> Optional[Tuple[int, int, int, int]]:
+        if not isinstance(key, str):
+            return None
+        target = key.encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = self._record(_SLOT.unpack_from(self._buffer, self._slots + mid * _SLOT.size)[0])
+            found = self._key(record)
+            if found < target:
+                lo = mid + 1
+            elif found > target:
+                hi = mid
+            else:
+                return record
+        return None
+
+    def __getitem__(self, key: str) -> List[int]:
+        record = self._find(key)
+        if record is None:
+            raise KeyError(key)
+        return [record[2], record[3]]
+
+    def read_value(self, key: str) -> Optional[bytes]:
+        """The raw bytes a key points to, for tables with string values."""
+        record = self._find(key)
+        return self._buffer[record[2]:record[2] + record[3]] if record else None
+
+    def __iter__(self) -> Iterator[str]:
+        for number in range(self._count):
+            yield self._key(self._record(number)).decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+
+class _LazyEntries(Mapping):
+    """Read-only mapping that decodes artifact entries on first access."""
+
+    def __init__(self, artifact: 'SpecArtifact', offsets: Mapping):
+        self._artifact = artifact
+        self._offsets = offsets
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._decoded:
+            return self._decoded[key]
+        entry = self._offsets[key]
+        value = self._artifact.read_entry(entry)
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+
+class SpecArtifact:
+    """Memory-mapped, lazily decoded view of a compiled spec artifact."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_offset, index_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != ARTIFACT_MAGIC:
+                raise ValueError(f"{path} is not a spec artifact")
+            if version != ARTIFACT_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported artifact format version {version} (expected {ARTIFACT_FORMAT_VERSION})"
+                )
+            self.index: Dict[str, Any] = json.loads(self._mmap[index_offset:index_offset + index_length])
+            codec = self.index['codec']
+            dictionary = b''
+            if codec['dictionary']:
+                dict_offset, dict_length = codec['dictionary']
+                dictionary = self._mmap[dict_offset:dict_offset + dict_length]
+            self._codec = DictionaryCodec(codec['name'], dictionary)
+        except Exception:
+            self.close()
+            raise
+
+        self._catalog: Optional[SpecCatalogEntry] = None
+        self._operation_ids = _KeyTable(self._mmap, self.index['operation_ids'])
+        self._paths = _LazyEntries(self, _KeyTable(self._mmap, self.index['paths']))
+        self._schemas = _LazyEntries(self, _KeyTable(self._mmap, self.index['schemas']))
+        self._raw_schemas = _LazyEntries(self, _KeyTable(self._mmap, self.index['raw_schemas']))
+        self._rendered_operations = _LazyEntries(self, _KeyTable(self._mmap, self.index['rendered_operations']))
+        logger.info(f"Memory-mapped spec artifact {path} (spec version {self.index.get('spec_version', '')})")
+
+    @property
+    def spec_hash(self) -> str:
+        return self.index.get('spec_hash', '')
+
+    def read_entry(self, entry: List[int]) -> Any:
+        """Decode a single entry by its (offset, length) pair."""
+        offset, length = entry
+        return json.loads(self._codec.decompress(self._mmap[offset:offset + length]))
+
+    def get_catalog(self) -> SpecCatalogEntry:
+        """Get the precompiled catalog."""
+        if self._catalog is None:
+            self._catalog = SpecCatalogEntry(**self.read_entry(self.index['catalog']))
+        return self._catalog
+
+    def get_schema_graph(self) -> Optional[SchemaGraph]:
+        """Get the precomputed schema reference graph, if the artifact has one."""
+        entry = self.index.get('schema_graph')
+        return SchemaGraph.from_dict(self.read_entry(entry)) if entry else None
+
+    def get_field_index(self) -> FieldIndex:
+        """Get the precomputed property, parameter and enum index."""
+        return FieldIndex.from_dict(self.read_entry(self.index['field_index']))
+
+    def get_raw_schemas(self) -> Mapping:
+        """Get the component schemas with their $refs intact, decoded lazily."""
+        return self._raw_schemas
+
+    def get_spec_view(self) -> Dict[str, Any]:
+        """
+        Get a spec-shaped view whose paths and schemas are decoded lazily.
+
+        The view can be passed anywhere a processed spec is expected.
+        """
+        return {
+            'info': self.index.get('info', {}),
+            'paths': self._paths,
+            'components': {'schemas': self._schemas}
+        }
+
+    def locate_operation(self, operation_id: str) -> Optional[Tuple[str, str]]:
+        """Get the (path, method) of an operation by its operationId."""
+        key = self._operation_ids.read_value(operation_id)
+        if key is None:
+            return None
+        method, path = key.decode('utf-8').split(' ', 1)
+        return path, method
+
+    def get_rendered_operation(self, path: str, method: str) -> Optional[Dict[str, Any]]:
+        """Get the pre-rendered tool output for an operation."""
+        return self._rendered_operations.get(_operation_key(path, method))
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file:
+            self._file.close()
+            self._file = None
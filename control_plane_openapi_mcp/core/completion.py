@@ -0,0 +1,142 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .models import SpecCatalogEntry
+
+logger = logging.getLogger(__name__)
+
+# Identifier kinds offered for completion
+COMPLETION_KINDS = ('operation_id', 'schema', 'path')
+
+# Sorts after every character a key can hold, closing a prefix range
+_PREFIX_END = '\U0010ffff'
+
+# At most this many branches are reported per lookup
+MAX_BRANCHES = 50
+
+
+def _branch_end(value: str, start: int, kind: str) -> int:
+    """
+    End of the branch a completion belongs to below a prefix of length start.
+
+    Paths branch at the next '/'; identifiers at the next word boundary
+    ('_', '-', '.' or a lowercase-to-uppercase change).
+    """
+    for i in range(start + 1, len(value)):
+        char = value[i]
+        if kind == 'path':
+            if char == '/':
+                return i + 1
+        elif char in '_-.' or (char.isupper() and value[i - 1].islower()):
+            return i
+    return len(value)
+
+
+class _SortedKeys:
+    """Case-folded keys in sorted order, with their original spelling."""
+
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, values: Iterable[str]):
+        pairs = sorted({(value.casefold(), value) for value in values if value})
+        self.keys: List[str] = [key for key, _ in pairs]
+        self.values: List[str] = [value for _, value in pairs]
+
+    def range(self, prefix: str, lo: int = 0) -> Tuple[int, int]:
+        """Index range of the keys starting with a (case-folded) prefix."""
+        start = bisect_left(self.keys, prefix, lo)
+        return start, bisect_left(self.keys, prefix + _PREFIX_END, start)
+
+
+class CompletionIndex:
+    """
+    Prefix completion over operationIds, schema names and path templates.
+
+    Each kind keeps its identifiers in one sorted array, so the completions
+    of a prefix are a contiguous slice found with two binary searches. The
+    top-k completions are read straight off the slice, and branch counts
+    (how many completions continue with each next word or path segment)
+    are found by jumping from branch to branch with further binary searches
+    instead of walking the slice.
+    """
+
+    def __init__(self, identifiers: Dict[str, Iterable[str]]):
+        self._kinds: Dict[str, _SortedKeys] = {
+            kind: _SortedKeys(values) for kind, values in identifiers.items()
+        }
+
+    @classmethod
+    def from_catalog(cls, catalog: SpecCatalogEntry) -> 'CompletionIndex':
+        index = cls({
+            'operation_id': (op.operation_id for op in catalog.operations),
+            'schema': (schema.name for schema in catalog.schemas),
+            'path': (op.path for op in catalog.operations),
+        })
+        logger.info(
+            "Built completion index ("
+            + ', '.join(f"{len(keys.keys)} {kind}s" for kind, keys in index._kinds.items())
+            + ")"
+        )
+        return index
+
+    def complete(self, prefix: str, kind: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+        """
+        Complete an identifier prefix.
+
+        Args:
+            prefix: Start of an operationId, schema name or path template (case-insensitive)
+            kind: 'operation_id', 'schema' or 'path'; by default paths when the
+                prefix starts with '/', otherwise operationIds and schema names
+            limit: Maximum number of completions to return
+
+        Returns:
+            dict with 'completions' (in sorted order), the 'total' number of
+            completions and 'branches' with the count of completions per next
+            word or path segment
+        """
+        if kind is None:
+            kinds = ['path'] if prefix.startswith('/') else ['operation_id', 'schema']
+        elif kind in self._kinds:
+            kinds = [kind]
+        else:
+            raise ValueError(f"Unknown identifier kind '{kind}'; expected one of {', '.join(COMPLETION_KINDS)}")
+
+        key = prefix.casefold()
+        completions: List[Dict[str, str]] = []
+        branches: List[Dict[str, Any]] = []
+        total = 0
+        for name in kinds:
+            keys = self._kinds[name]
+            start, end = keys.range(key)
+            total += end - start
+            completions.extend(
+                {'value': value, 'kind': name}
+                for value in keys.values[start:min(end, start + max(limit - len(completions), 0))]
+            )
+            branches.extend(self._branches(keys, name, len(key), start, end))
+
+        return {
+            'prefix': prefix,
+            'total': total,
+            'completions': completions,
+            'branches': branches[:MAX_BRANCHES],
+        }
+
+    @staticmethod
+    def _branches(keys: _SortedKeys, kind: str, depth: int, start: int, end: int) -> List[Dict[str, Any]]:
+        branches = []
+        position = start
+        while position < end and len(branches) < MAX_BRANCHES:
+            value = keys.values[position]
+            branch = value[:_branch_end(value, depth, kind)]
+            if len(branch) <= depth:
+                # The prefix is itself a complete identifier; it must not swallow longer ones
+                branch_stop = bisect_right(keys.keys, branch.casefold(), position)
+            else:
+                # Every key sharing the branch prefix sorts contiguously from here
+                _, branch_stop = keys.range(branch.casefold(), position)
+            branch_stop = min(branch_stop, end)
+            branches.append({'prefix': branch, 'kind': kind, 'count': branch_stop - position})
+            position = branch_stop
+        return branches
@@ -0,0 +1,126 @@
+from typing import Dict, Iterable, List, Optional, Sequence, TypeVar
+import logging
+
+from .models import SpecOperationEntry
+from .router import split_path
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yield the positions of the set bits of a bitset, lowest first."""
+    # One pass over the binary digits; clearing bits one by one is quadratic for wide ints
+    digits = bin(mask)[:1:-1]
+    position = digits.find('1')
+    while position != -1:
+        yield position
+        position = digits.find('1', position + 1)
+
+
+def _split_values(value: str) -> List[str]:
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+class FacetIndex:
+    """
+    Bitset indexes over the catalog operations for filtering by facet.
+
+    Every tag, HTTP method and path prefix (at segment boundaries) maps to a
+    Python int whose bit i is set when operation i has that facet value.
+    Filters are answered with bitwise AND/OR over these ints, so narrowing
+    the catalog costs a few big-integer operations instead of a scan.
+    """
+
+    def __init__(self, operations: Sequence[SpecOperationEntry]):
+        self.size = len(operations)
+        self.all = (1 << self.size) - 1
+        self.methods: Dict[str, int] = {}
+        self.tags: Dict[str, int] = {}
+        self.path_prefixes: Dict[str, int] = {}
+        # Display form of each tag, keyed by its case-folded form
+        self._tag_names: Dict[str, str] = {}
+
+        for position, operation in enumerate(operations):
+            bit = 1 << position
+            method = operation.method.upper()
+            self.methods[method] = self.methods.get(method, 0) | bit
+            for tag in operation.tags:
+                key = tag.casefold()
+                self.tags[key] = self.tags.get(key, 0) | bit
+                self._tag_names.setdefault(key, tag)
+            prefix = ''
+            for segment in split_path(operation.path):
+                prefix = f"{prefix}/{segment}"
+                self.path_prefixes[prefix] = self.path_prefixes.get(prefix, 0) | bit
+
+        logger.info(
+            f"Built facet bitsets ({len(self.methods)} methods, {len(self.tags)} tags, "
+            f"{len(self.path_prefixes)} path prefixes)"
+        )
+
+    def filter(
+        self,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Combine facet filters into a bitset of matching operation positions.
+
+        Each filter accepts a comma-separated list of alternatives, which are
+        ORed; different filters are ANDed. Tags match case-insensitively.
+
+        Returns:
+            The bitset, or None if no filter was given
+        """
+        masks = []
+        if method:
+            masks.append(self._any_of(self.methods, [m.upper() for m in _split_values(method)]))
+        if tag:
+            masks.append(self._any_of(self.tags, [t.casefold() for t in _split_values(tag)]))
+        if path_prefix:
+            masks.append(self._path_prefix_mask(path_prefix))
+        if not masks:
+            return None
+
+        mask = self.all
+        for value in masks:
+            mask &= value
+        return mask
+
+    def positions(self, mask: int) -> List[int]:
+        """Positions of the operations selected by a bitset."""
+        return list(iter_bits(mask))
+
+    def select(self, mask: int, items: Sequence[T]) -> List[T]:
+        """The items (in catalog order) selected by a bitset."""
+        return [items[position] for position in iter_bits(mask)]
+
+    def tag_names(self) -> List[str]:
+        """All tags, in their original spelling."""
+        return sorted(self._tag_names.values())
+
+    @staticmethod
+    def _any_of(index: Dict[str, int], values: List[str]) -> int:
+        mask = 0
+        for value in values:
+            mask |= index.get(value, 0)
+        return mask
+
+    def _path_prefix_mask(self, path_prefix: str) -> int:
+        mask = 0
+        for prefix in _split_values(path_prefix):
+            segments = split_path(prefix)
+            if not segments:
+                return self.all
+            key = '/' + '/'.join(segments)
+            if prefix.endswith('/'):
+                mask |= self.path_prefixes.get(key, 0)
+                continue
+            # The last segment may be partial: "/cc-ui/v1/clus" also matches "/cc-ui/v1/clusters"
+            for candidate, bits in self.path_prefixes.items():
+                if candidate.startswith(key) and candidate.count('/') == len(segments):
+                    mask |= bits
+        return mask
@@ -0,0 +1,250 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+import logging
+
+import requests
+
+from .schema_graph import HTTP_METHODS
+from .spec_loader import SectionCallback, SpecLoader, local_spec_path, escape_pointer_token
+from ..utils.compression import REQUESTS_ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+# springdoc endpoint listing the API groups of a control plane
+SWAGGER_CONFIG_SUFFIX = '/swagger-config'
+
+# Documents fetched at the same time
+MAX_FETCH_WORKERS = 8
+
+
+def split_sources(source: str) -> List[str]:
+    """Spec sources of a comma-separated source string."""
+    return [part.strip() for part in source.split(',') if part.strip()]
+
+
+def create_spec_loader(source: str) -> SpecLoader:
+    """
+    Create the loader for a spec source.
+
+    Several comma-separated URLs or paths, or a springdoc swagger-config URL
+    listing API groups, are loaded as one federated spec.
+    """
+    sources = split_sources(source)
+    if len(sources) > 1 or (sources and sources[0].endswith(SWAGGER_CONFIG_SUFFIX)):
+        return FederatedSpecLoader(source, sources)
+    return SpecLoader(source)
+
+
+def _namespace_of(source: str) -> str:
+    """Namespace for the names of a document, from its group name or file name."""
+    path = local_spec_path(source)
+    if path:
+        return os.path.splitext(os.path.basename(path))[0]
+    segment = urlparse(source).path.rstrip('/').rsplit('/', 1)[-1]
+    return 'default' if segment in ('', 'api-docs') else segment
+
+
+def _rewrite_refs(node: Any, ref_map: Dict[str, str]) -> Any:
+    """Copy of a node with renamed $ref targets; unchanged subtrees are shared, not copied."""
+    if isinstance(node, dict):
+        ref = node.get('$ref')
+        if isinstance(ref, str) and ref in ref_map:
+            return {**node, '$ref': ref_map[ref]}
+        changed = {}
+        for key, value in node.items():
+            result = _rewrite_refs(value, ref_map)
+            if result is not value:
+                changed[key] = result
+        return {**node, **changed} if changed else node
+    if isinstance(node, list):
+        items = [_rewrite_refs(item, ref_map) for item in node]
+        return items if any(new is not old for new, old in zip(items, node)) else node
+    return node
+
+
+def _ref_map(renames: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    return {
+        f"#/components/{kind}/{escape_pointer_token(name)}": f"#/components/{kind}/{escape_pointer_token(new_name)}"
+        for kind, names in renames.items()
+        for name, new_name in names.items()
+    }
+
+
+def merge_specs(documents: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Merge several OpenAPI documents into one.
+
+    Components with the same name and the same definition are kept once;
+    a component whose definition differs from an earlier document's is
+    renamed to '<namespace>.<name>' together with the references to it (and,
+    transitively, components that differ only by such a reference).
+    Operations are keyed by path and method, the first document defining
+    one wins, and clashing operationIds are namespaced the same way.
+
+    Args:
+        documents: (namespace, raw spec) pairs, in priority order
+    """
+    if len(documents) == 1:
+        return documents[0][1]
+
+    merged: Dict[str, Any] = {
+        key: value for key, value in documents[0][1].items() if key not in ('paths', 'components', 'tags')
+    }
+    paths: Dict[str, Dict[str, Any]] = {}
+    components: Dict[str, Any] = {}
+    tags: Dict[str, Dict[str, Any]] = {}
+    operation_ids: Dict[str, Tuple[str, str]] = {}
+    renamed = 0
+
+    for namespace, document in documents:
+        doc_components = document.get('components', {})
+        # Rename until no component differs only through a reference to a renamed one
+        renames: Dict[str, Dict[str, str]] = {}
+        while True:
+            ref_map = _ref_map(renames)
+            found = False
+            for kind, definitions in doc_components.items():
+                existing = components.get(kind)
+                if not isinstance(definitions, dict) or not isinstance(existing, dict):
+                    continue
+                for name, definition in definitions.items():
+                    if name in renames.get(kind, {}) or name not in existing:
+                        continue
+                    if existing[name] != _rewrite_refs(definition, ref_map):
+                        renames.setdefault(kind, {})[name] = f"{namespace}.{name}"
+                        found = True
+            if not found:
+                break
+        if renames:
+            document = _rewrite_refs(document, _ref_map(renames))
+            doc_components = document.get('components', {})
+            renamed += sum(len(names) for names in renames.values())
+
+        for kind, definitions in doc_components.items():
+            if not isinstance(definitions, dict):
+                components.setdefault(kind, definitions)
+                continue
+            target = components.setdefault(kind, {})
+            for name, definition in definitions.items():
+                target.setdefault(renames.get(kind, {}).get(name, name), definition)
+
+        for tag in document.get('tags') or []:
+            if isinstance(tag, dict) and tag.get('name'):
+                tags.setdefault(tag['name'], tag)
+
+        for path, path_item in document.get('paths', {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            target = paths.get(path)
+            if target is None:
+                target = {}
+                paths[path] = target
+            for key, value in path_item.items():
+                if key in target:
+                    if key in HTTP_METHODS and target[key] != value:
+                        logger.warning(f"{key.upper()} {path} of '{namespace}' differs from an earlier document; keeping the first")
+                    continue
+                if key in HTTP_METHODS and isinstance(value, dict) and value.get('operationId'):
+                    operation_id = value['operationId']
+                    if operation_id in operation_ids:
+                        value = {**value, 'operationId': f"{namespace}.{operation_id}"}
+                        renamed += 1
+                    operation_ids[value['operationId']] = (path, key)
+                target[key] = value
+
+    merged['paths'] = paths
+    merged['components'] = components
+    if tags:
+        merged['tags'] = list(tags.values())
+    logger.info(
+        f"Merged {len(documents)} spec documents into {len(paths)} paths and "
+        f"{len(components.get('schemas', {}))} schemas ({renamed} names namespaced)"
+    )
+    return merged
+
+
+class FederatedSpecLoader(SpecLoader):
+    """
+    Loads several OpenAPI documents concurrently and merges them into one spec.
+
+    Documents are fetched and parsed on a thread pool, so the load takes about
+    as long as the slowest document rather than the sum of all of them. The
+    merged spec is then processed like a single document, so the catalog and
+    search indexes cover every document.
+    """
+
+    def __init__(self, url: str, sources: Optional[List[str]] = None):
+        super().__init__(url)
+        self.sources = sources or split_sources(url)
+        # Only single local files are watched for changes
+        self.path = None
+        # (namespace, source) of the documents of the last fetch
+        self.documents: List[Tuple[str, str]] = []
+
+    def fetch_spec(
+        self,
+        on_path_item: Optional[SectionCallback] = None,
+        on_schema: Optional[SectionCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch and merge all documents.
+
+        The callbacks fire for the merged path items and schemas once every
+        document has been fetched.
+        """
+        documents: List[Tuple[str, str]] = []
+        for source in self.sources:
+            if source.endswith(SWAGGER_CONFIG_SUFFIX):
+                documents.extend(self._discover(source))
+            else:
+                documents.append((_namespace_of(source), source))
+        if not documents:
+            raise ValueError(f"No spec documents found at {self.url}")
+
+        # Namespaces must be unique so that namespaced names cannot clash
+        seen: Dict[str, int] = {}
+        for i, (namespace, source) in enumerate(documents):
+            seen[namespace] = seen.get(namespace, 0) + 1
+            if seen[namespace] > 1:
+                documents[i] = (f"{namespace}{seen[namespace]}", source)
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_FETCH_WORKERS, len(documents)), thread_name_prefix='spec-fetch'
+        ) as executor:
+            specs = list(executor.map(lambda document: SpecLoader(document[1]).fetch_spec(), documents))
+
+        self.documents = documents
+        self._raw_spec = merge_specs([(namespace, spec) for (namespace, _), spec in zip(documents, specs)])
+        for path, path_item in self._raw_spec.get('paths', {}).items():
+            if on_path_item:
+                on_path_item(path, path_item)
+        for name, schema in self._raw_spec.get('components', {}).get('schemas', {}).items():
+            if on_schema and isinstance(schema, dict):
+                on_schema(name, schema)
+        logger.info(f"Successfully fetched {len(documents)} OpenAPI spec documents")
+        return self._raw_spec
+
+    def _discover(self, config_url: str) -> List[Tuple[str, str]]:
+        """(group name, document URL) of the API groups listed by a springdoc swagger-config."""
+        try:
+            response = requests.get(
+                config_url,
+                timeout=30,
+                headers={'Accept': 'application/json', 'Accept-Encoding': REQUESTS_ACCEPT_ENCODING}
+            )
+            response.raise_for_status()
+            config = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Failed to discover spec documents from {config_url}: {e}")
+            raise
+
+        entries = config.get('urls') or ([{'url': config['url']}] if config.get('url') else [])
+        documents = [
+            (entry.get('name') or _namespace_of(entry['url']), urljoin(config_url, entry['url']))
+            for entry in entries
+            if isinstance(entry, dict) and entry.get('url')
+        ]
+        logger.info(f"Discovered {len(documents)} spec documents at {config_url}")
+        return documents
@@ -0,0 +1,185 @@
+import re
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Tuple
+import logging
+
+from .schema_graph import HTTP_METHODS
+from ..utils.schema_extractor import extract_schema_name_from_ref
+
+logger = logging.getLogger(__name__)
+
+# Kinds of names indexed
+FIELD_KINDS = ('properties', 'parameters', 'enums')
+
+# Inline object nesting followed below a component schema
+MAX_NESTING = 6
+
+_SEPARATORS = re.compile(r'[\s_\-]+')
+
+
+def normalize_field_name(name: Any) -> str:
+    """Case- and separator-insensitive form, so release_trace_id finds releaseTraceId."""
+    return _SEPARATORS.sub('', str(name)).casefold()
+
+
+def _iter_properties(schema: Any, prefix: str = '', depth: int = 0) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (dotted path, property schema) for the properties of a raw schema.
+
+    Inline objects, array items and allOf/anyOf/oneOf members are followed;
+    $refs are not, since the referenced component is indexed on its own.
+    """
+    if not isinstance(schema, dict) or depth > MAX_NESTING or '$ref' in schema:
+        return
+    properties = schema.get('properties')
+    if isinstance(properties, dict):
+        for name, prop in properties.items():
+            if not isinstance(prop, dict):
+                continue
+            path = f"{prefix}{name}"
+            yield path, prop
+            yield from _iter_properties(prop, f"{path}.", depth + 1)
+    items = schema.get('items')
+    if isinstance(items, dict):
+        yield from _iter_properties(items, f"{prefix[:-1]}[]." if prefix else '[].', depth + 1)
+    for key in ('allOf', 'anyOf', 'oneOf'):
+        for member in schema.get(key) or []:
+            yield from _iter_properties(member, prefix, depth + 1)
+    additional = schema.get('additionalProperties')
+    if isinstance(additional, dict):
+        yield from _iter_properties(additional, f"{prefix}*.", depth + 1)
+
+
+def _enum_values(schema: Any) -> List[Any]:
+    if not isinstance(schema, dict):
+        return []
+    values = schema.get('enum')
+    if not isinstance(values, list) and isinstance(schema.get('items'), dict):
+        values = schema['items'].get('enum')
+    return [value for value in values if isinstance(value, (str, int, float))] if isinstance(values, list) else []
+
+
+def _type_of(schema: Dict[str, Any]) -> str:
+    ref = extract_schema_name_from_ref(schema.get('$ref', ''))
+    if ref:
+        return ref
+    if schema.get('type') == 'array' and isinstance(schema.get('items'), dict):
+        return f"array<{_type_of(schema['items'])}>"
+    return schema.get('type', '')
+
+
+class FieldIndex:
+    """
+    Inverted index from field names to the schemas and operations declaring them.
+
+    Maps normalized property names (with their dotted path inside each
+    schema), operation parameter names and enum values to postings, so
+    reverse questions such as "which schemas have releaseTraceId" or
+    "which endpoints take clusterId" are a single dictionary lookup.
+    """
+
+    def __init__(self, terms: Dict[str, Dict[str, List[Dict[str, Any]]]]):
+        # kind -> normalized name -> postings
+        self.terms = terms
+
+    @classmethod
+    def from_spec(cls, spec: Mapping, raw_schemas: Mapping) -> 'FieldIndex':
+        """
+        Build the index from a processed spec and the raw component schemas.
+
+        Args:
+            spec: The processed (dereferenced) spec, for operation parameters
+            raw_schemas: Component schemas with $refs intact, so each property is indexed once
+        """
+        terms: Dict[str, Dict[str, List[Dict[str, Any]]]] = {kind: {} for kind in FIELD_KINDS}
+
+        def add(kind: str, name: Any, posting: Dict[str, Any]) -> None:
+            terms[kind].setdefault(normalize_field_name(name), []).append(posting)
+
+        for schema_name, schema in raw_schemas.items():
+            for path, prop in _iter_properties(schema):
+                leaf = path.rsplit('.', 1)[-1]
+                add('properties', leaf, {'schema': schema_name, 'path': path, 'type': _type_of(prop)})
+                for value in _enum_values(prop):
+                    add('enums', value, {'schema': schema_name, 'path': path, 'value': value})
+            for value in _enum_values(schema):
+                add('enums', value, {'schema': schema_name, 'path': '', 'value': value})
+
+        for path, path_item in spec.get('paths', {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            shared = path_item.get('parameters') or []
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, dict) or operation.get('deprecated', False):
+                    continue
+                key = f"{method.upper()} {path}"
+                # Operation parameters override path item parameters with the same name and location
+                params: Dict[Tuple[str, str], Dict[str, Any]] = {}
+                for param in list(shared) + list(operation.get('parameters') or []):
+                    if isinstance(param, dict) and param.get('name'):
+                        params[(param['name'], param.get('in', ''))] = param
+                for param in params.values():
+                    add('parameters', param['name'], {
+                        'operation': key,
+                        'parameter': param['name'],
+                        'in': param.get('in', ''),
+                        'required': bool(param.get('required', False)),
+                    })
+                    for value in _enum_values(param.get('schema')):
+                        add('enums', value, {'operation': key, 'parameter': param['name'], 'value': value})
+
+        index = cls(terms)
+        logger.info(
+            "Built field index ("
+            + ', '.join(f"{len(terms[kind])} {kind}" for kind in FIELD_KINDS)
+            + ")"
+        )
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form, used to store the index in spec artifacts."""
+        return self.terms
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FieldIndex':
+        return cls(data)
+
+    def lookup(self, kind: str, name: str) -> List[Dict[str, Any]]:
+        """
+        Postings of a field name.
+
+        A dotted name ('release.traceId') matches properties whose path ends with it.
+
+        Args:
+            kind: 'properties', 'parameters' or 'enums'
+            name: Field name or enum value (case- and separator-insensitive)
+        """
+        if kind not in self.terms:
+            raise ValueError(f"Unknown field kind '{kind}'; expected one of {', '.join(FIELD_KINDS)}")
+        name = name.strip()
+        if kind != 'properties' or '.' not in name:
+            return self.terms[kind].get(normalize_field_name(name), [])
+
+        suffix = [normalize_field_name(part) for part in name.split('.')]
+        postings = self.terms[kind].get(suffix[-1], [])
+        return [
+            posting for posting in postings
+            if [normalize_field_name(part) for part in posting['path'].split('.')][-len(suffix):] == suffix
+        ]
+
+    def schemas_with(self, kind: str, name: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Matching postings of schemas, grouped by schema name."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for posting in self.lookup(kind, name):
+            if 'schema' in posting:
+                grouped.setdefault(posting['schema'], []).append(posting)
+        return grouped
+
+    def operations_with(self, kind: str, name: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Matching postings of operations, grouped by "METHOD path"."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for posting in self.lookup(kind, name):
+            if 'operation' in posting:
+                grouped.setdefault(posting['operation'], []).append(posting)
+        return grouped
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+from .models import SpecCatalogEntry, SpecOperationEntry, SpecSchemaEntry
+
+logger = logging.getLogger(__name__)
+
+# bm25() column weights, in FTS column order
+OPERATION_WEIGHTS = {
+    'operation_id': 10.0,
+    'summary': 5.0,
+    'description': 1.0,
+    'tags': 3.0,
+    'path': 4.0,
+}
+SCHEMA_WEIGHTS = {
+    'name': 10.0,
+    'description': 1.0,
+}
+
+# Bumped when the tables below change; databases of another version are rebuilt
+FTS_SCHEMA_VERSION = 2
+
+# Indexes of catalogs no process has opened for this long are removed
+STALE_INDEX_SECONDS = 7 * 24 * 3600
+
+# Rows are scoped by catalog hash, so processes serving different catalogs share the file safely
+_SCHEMA_SQL = [
+    """CREATE TABLE IF NOT EXISTS catalog_meta (
+        catalog_hash TEXT PRIMARY KEY,
+        used_at REAL NOT NULL
+    )""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS operations_fts USING fts5(
+        operation_id, summary, description, tags, path,
+        method UNINDEXED, catalog_hash UNINDEXED, position UNINDEXED,
+        tokenize = 'trigram case_sensitive 0'
+    )""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS schemas_fts USING fts5(
+        name, description,
+        catalog_hash UNINDEXED, position UNINDEXED,
+        tokenize = 'trigram case_sensitive 0'
+    )""",
+]
+_TABLES = ('catalog_meta', 'operations_fts', 'schemas_fts')
+
+# Text searched for query terms too short for a trigram (e.g. 'v2', 'id')
+_OPERATION_TEXT = "(operation_id || ' ' || summary || ' ' || tags || ' ' || path)"
+_SCHEMA_TEXT = 'name'
+
+
+def _catalog_hash(catalog: SpecCatalogEntry) -> str:
+    """Stable hash of the catalog contents, used to detect stale indexes."""
+    payload = json.dumps(catalog.model_dump(), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_match_expression(query: str) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression for a trigram-tokenized table.
+
+    Every query term is broken into its trigrams and the trigrams are OR-ed,
+    so misspelled terms still match on their overlapping trigrams and bm25()
+    ranks documents sharing more of them higher.
+
+    Returns:
+        The MATCH expression or None if the query has no term of 3+ characters
+    """
+    trigrams = []
+    seen = set()
+    for term in re.findall(r'\w+', query.lower()):
+        for i in range(len(term) - 2):
+            trigram = term[i:i + 3]
+            if trigram not in seen:
+                seen.add(trigram)
+                trigrams.append(f'"{trigram}"')
+    return ' OR '.join(trigrams) if trigrams else None
+
+
+def short_terms(query: str) -> List[str]:
+    """Distinct query terms shorter than a trigram, which MATCH cannot see."""
+    return list(dict.fromkeys(term for term in re.findall(r'\w+', query.lower()) if len(term) < 3))
+
+
+def _like_pattern(term: str) -> str:
+    # Terms are word characters, so '_' is the only LIKE wildcard they can hold
+    return '%' + term.replace('_', '\\_') + '%'
+
+
+class FtsSearchEngine:
+    """SQLite FTS5 search backend for OpenAPI operations and schemas."""
+
+    def __init__(self, spec_id: str, db_path: str):
+        self.spec_id = spec_id
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._operations: List[SpecOperationEntry] = []
+        self._schemas: List[SpecSchemaEntry] = []
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # The connection is shared between threads and guarded by self._lock
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        if db_path != ':memory:':
+            # WAL lets several server processes read while one re-indexes
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] != FTS_SCHEMA_VERSION:
+            for table in _TABLES:
+                self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+            self._conn.execute(f'PRAGMA user_version = {FTS_SCHEMA_VERSION}')
+        for statement in _SCHEMA_SQL:
+            self._conn.execute(statement)
+        self._conn.commit()
+        # Hash of the indexed catalog; every query is scoped to its rows
+        self.catalog_hash = ''
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether the linked SQLite supports FTS5 with the trigram tokenizer."""
+        try:
+            conn = sqlite3.connect(':memory:')
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(a, tokenize = 'trigram')")
+            conn.close()
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def index_catalog(self, catalog: SpecCatalogEntry) -> None:
+        """
+        Index the catalog, reusing the persisted index if it is up to date.
+
+        Each catalog version is indexed under its own hash, so processes
+        serving other catalogs from the same database file are unaffected.
+        """
+        self._operations = catalog.operations
+        self._schemas = catalog.schemas
+        catalog_hash = _catalog_hash(catalog)
+        now = time.time()
+
+        with self._lock:
+            self.catalog_hash = catalog_hash
+            # BEGIN IMMEDIATE serializes concurrent indexers across processes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT 1 FROM catalog_meta WHERE catalog_hash = ?', (catalog_hash,)
+                ).fetchone()
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO catalog_meta (catalog_hash, used_at) VALUES (?, ?)',
+                    (catalog_hash, now)
+                )
+                if not row:
+                    self._insert_rows(catalog_hash)
+                stale = [
+                    stale_hash for (stale_hash,) in self._conn.execute(
+                        'SELECT catalog_hash FROM catalog_meta WHERE used_at < ?', (now - STALE_INDEX_SECONDS,)
+                    ).fetchall()
+                ]
+                for stale_hash in stale:
+                    for table in _TABLES:
+                        self._conn.execute(f'DELETE FROM {table} WHERE catalog_hash = ?', (stale_hash,))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        if row:
+            logger.info("Using persisted FTS search index")
+            return
+        logger.info(f"Indexed {len(self._operations)} operations and {len(self._schemas)} schemas into FTS")
+
+    def _insert_rows(self, catalog_hash: str) -> None:
+        self._conn.executemany(
+            'INSERT INTO operations_fts '
+            '(operation_id, summary, description, tags, path, method, catalog_hash, position) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (
+                    op.operation_id or '',
+                    op.summary or '',
+                    op.description or '',
+                    ' '.join(op.tags),
+                    op.path,
+                    op.method,
+                    catalog_hash,
+                    position
+                )
+                for position, op in enumerate(self._operations)
+            ]
+        )
+        self._conn.executemany(
+            'INSERT INTO schemas_fts (name, description, catalog_hash, position) VALUES (?, ?, ?, ?)',
+            [
+                (schema.name, schema.description or '', catalog_hash, position)
+                for position, schema in enumerate(self._schemas)
+            ]
+        )
+
+    def search_operations(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        candidates: Optional[Sequence[int]] = None
+    ) -> List[SpecOperationEntry]:
+        """
+        Search operations ranked by weighted bm25().
+
+        Args:
+            candidates: Catalog positions to restrict the search to (all operations if None)
+        """
+        match = build_match_expression(query)
+        short = short_terms(query)
+        if match is None and not short:
+            operations = self._operations if candidates is None else [self._operations[p] for p in candidates]
+            return operations[offset:offset + limit] if limit else operations[offset:]
+
+        sql, params = self._ranking_sql(
+            'operations_fts', OPERATION_WEIGHTS, _OPERATION_TEXT, match, short,
+            json.dumps(list(candidates)) if candidates is not None else None
+        )
+        positions = self._query(sql + ' LIMIT ? OFFSET ?', params + [limit if limit else -1, offset])
+        result = [self._operations[p] for p in positions]
+        logger.info(f"FTS found {len(result)} operations matching '{query}'")
+        return result
+
+    def search_operations_multi(
+        self,
+        queries: Sequence[str],
+        limit: int,
+        candidates: Optional[Sequence[int]] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Rank operations for several queries, sharing the candidate set.
+
+        Returns:
+            Per query, (catalog position, score) pairs of the best matches, best first
+        """
+        candidate_json = json.dumps(list(candidates)) if candidates is not None else None
+        ranked: List[List[Tuple[int, float]]] = []
+        with self._lock:
+            for query in queries:
+                match = build_match_expression(query)
+                short = short_terms(query)
+                if match is None and not short:
+                    ranked.append([])
+                    continue
+                sql, params = self._ranking_sql(
+                    'operations_fts', OPERATION_WEIGHTS, _OPERATION_TEXT, match, short, candidate_json
+                )
+                rows = self._conn.execute(sql + ' LIMIT ?', params + [limit]).fetchall()
+                ranked.append([(int(position), float(score)) for position, score in rows])
+        return ranked
+
+    def search_schemas(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[SpecSchemaEntry]:
+        """Search schemas ranked by weighted bm25()."""
+        match = build_match_expression(query)
+        short = short_terms(query)
+        if match is None and not short:
+            return self._schemas[offset:offset + limit] if limit else self._schemas[offset:]
+
+        sql, params = self._ranking_sql('schemas_fts', SCHEMA_WEIGHTS, _SCHEMA_TEXT, match, short)
+        positions = self._query(sql + ' LIMIT ? OFFSET ?', params + [limit if limit else -1, offset])
+        result = [self._schemas[p] for p in positions]
+        logger.info(f"FTS found {len(result)} schemas matching '{query}'")
+        return result
+
+    def _ranking_sql(
+        self,
+        table: str,
+        weights: Dict[str, float],
+        text: str,
+        match: Optional[str],
+        short: List[str],
+        candidate_json: Optional[str] = None
+    ) -> Tuple[str, List[object]]:
+        """
+        Ranked (position, score) query for the rows of this catalog.
+
+        Trigram MATCH ranks rows by weighted bm25(). Terms shorter than a
+        trigram cannot take part in MATCH, so rows containing more of them
+        (by LIKE) rank first; a query of short terms only is answered by
+        LIKE alone.
+
+        Candidates are filtered after MATCH on purpose: FTS5 cannot index
+        the UNINDEXED position column, and a rowid IN (...) constraint makes
+        SQLite re-run MATCH once per candidate, which measured slower than
+        filtering the matched rows. bm25() uses corpus-wide statistics, so
+        post-filtering does not change the ranking of the candidates.
+        """
+        hits = ' + '.join(f"({text} LIKE ? ESCAPE '\\')" for _ in short)
+        patterns = [_like_pattern(term) for term in short]
+        bm25 = f"bm25({table}, {', '.join(str(w) for w in weights.values())})" if match else '0'
+
+        score = f'({hits}) - {bm25}' if short else f'-{bm25}'
+        params: List[object] = list(patterns)
+        conditions = ['catalog_hash = ?']
+        if match:
+            conditions.insert(0, f'{table} MATCH ?')
+            params.append(match)
+        params.append(self.catalog_hash)
+        if candidate_json is not None:
+            conditions.append('position IN (SELECT value FROM json_each(?))')
+            params.append(candidate_json)
+        if not match:
+            conditions.append(f'({hits}) > 0')
+            params.extend(patterns)
+
+        order = ', '.join(([f'({hits}) DESC'] if short else []) + ([bm25] if match else []))
+        if short:
+            params.extend(patterns)
+        sql = f'SELECT position, {score} FROM {table} WHERE {" AND ".join(conditions)} ORDER BY {order}'
+        return sql, params
+
+    def _query(self, sql: str, params: List[object]) -> List[int]:
+        with self._lock:
+            rows: List[Tuple[int]] = self._conn.execute(sql, params).fetchall()
+        return [int(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
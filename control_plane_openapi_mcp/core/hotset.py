@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import secrets
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import logging
+
+from .models import SpecCatalogEntry
+
+logger = logging.getLogger(__name__)
+
+HOT_SET_FORMAT_VERSION = 1
+
+# Kinds of accesses counted
+HOT_SET_KINDS = ('operations', 'schemas', 'queries')
+
+# Counts are scaled by this factor at each start so past favorites fade out
+DECAY = 0.8
+
+# Search results longer than this are not persisted
+MAX_PERSISTED_RESULTS = 100
+
+
+def catalog_fingerprint(catalog: SpecCatalogEntry, search_backend: str = '') -> str:
+    """Identify a catalog version (and the backend ranking it) for persisted search results."""
+    digest = hashlib.sha256(search_backend.encode('utf-8'))
+    for op in catalog.operations:
+        digest.update(f"{op.method} {op.path} {op.operation_id}\n".encode('utf-8'))
+    for schema in catalog.schemas:
+        digest.update(f"{schema.name}\n".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class HotSet:
+    """
+    Access frequencies of operations, schemas and search queries, persisted locally.
+
+    Identifiers and query texts are stored only as salted hashes; the salt is
+    random per file, so the file reveals which entries are popular only to
+    someone who already has the catalog and the salt. Search results of the
+    most frequent queries are kept as catalog positions together with the
+    catalog fingerprint they belong to, so they can be reused after a restart
+    against the same spec version without knowing the query text.
+    """
+
+    def __init__(self, path: str, max_entries: int = 500, save_interval: float = 60):
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._counts: Dict[str, Dict[str, float]] = {kind: {} for kind in HOT_SET_KINDS}
+        # Query hash -> {'fingerprint': ..., 'results': [...]}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._salt = secrets.token_hex(16)
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable hot set {self.path}: {e}")
+            return
+        if data.get('version') != HOT_SET_FORMAT_VERSION or not data.get('salt'):
+            return
+        self._salt = data['salt']
+        for kind in HOT_SET_KINDS:
+            self._counts[kind] = {
+                key: count * DECAY for key, count in data.get(kind, {}).items() if count * DECAY >= 0.5
+            }
+        self._results = {
+            key: value for key, value in data.get('results', {}).items() if key in self._counts['queries']
+        }
+        logger.info(
+            f"Loaded hot set {self.path} ("
+            + ', '.join(f"{len(self._counts[kind])} {kind}" for kind in HOT_SET_KINDS)
+            + ")"
+        )
+
+    def key(self, value: str) -> str:
+        """Salted hash under which a value is counted."""
+        return hashlib.blake2b(value.encode('utf-8'), digest_size=8, key=self._salt.encode('ascii')).hexdigest()
+
+    def record(self, kind: str, value: str) -> None:
+        """Count an access to an operation ('METHOD /path'), schema name or query key."""
+        self.record_key(kind, self.key(value))
+
+    def record_key(self, kind: str, key: str, fingerprint: Optional[str] = None, results: Optional[List[int]] = None) -> None:
+        """Count an access by hash, optionally remembering the search results for it."""
+        with self._lock:
+            counts = self._counts[kind]
+            counts[key] = counts.get(key, 0) + 1
+            if results is not None and len(results) <= MAX_PERSISTED_RESULTS:
+                self._results[key] = {'fingerprint': fingerprint, 'results': results}
+            self._dirty = True
+            due = time.monotonic() - self._saved_at >= self.save_interval
+        if due:
+            self.save()
+
+    def top(self, kind: str, n: int) -> List[str]:
+        """Hashes of the n most frequently accessed entries of a kind."""
+        with self._lock:
+            counts = self._counts[kind]
+            return sorted(counts, key=counts.get, reverse=True)[:n]
+
+    def query_results(self, fingerprint: str, n: int) -> Dict[str, List[int]]:
+        """Persisted results of the n most frequent queries for a catalog version."""
+        results = {}
+        for key in self.top('queries', n):
+            entry = self._results.get(key)
+            if entry and entry.get('fingerprint') == fingerprint:
+                results[key] = entry['results']
+        return results
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {kind: len(counts) for kind, counts in self._counts.items()}
+
+    def save(self) -> None:
+        """Write the hot set if it changed, keeping the most frequent entries of each kind."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data: Dict[str, Any] = {'version': HOT_SET_FORMAT_VERSION, 'salt': self._salt}
+            for kind in HOT_SET_KINDS:
+                counts = self._counts[kind]
+                keep = sorted(counts, key=counts.get, reverse=True)[:self.max_entries]
+                data[kind] = {key: round(counts[key], 2) for key in keep}
+            data['results'] = {key: value for key, value in self._results.items() if key in data['queries']}
+            self._dirty = False
+            self._saved_at = time.monotonic()
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save hot set {self.path}: {e}")
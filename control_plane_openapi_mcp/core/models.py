@@ -35,6 +35,13 @@ class LoadOperationResult(BaseModel):
     uri: str
 
 
+class RouteMatch(BaseModel):
+    """Result of resolving a concrete request path to an operation template."""
+    path: str
+    method: str
+    path_parameters: Dict[str, str] = {}
+
+
 class LoadSchemaResult(BaseModel):
     """Result of loading a schema."""
     name: str
@@ -0,0 +1,303 @@
+import asyncio
+import math
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Query parameter names recognized for each pagination style
+PAGE_PARAMS = ('page', 'pageNumber', 'page_number', 'pageNo')
+OFFSET_PARAMS = ('offset', 'skip', 'start')
+CURSOR_PARAMS = ('cursor', 'pageToken', 'page_token', 'nextToken', 'continuationToken', 'after')
+SIZE_PARAMS = ('size', 'pageSize', 'page_size', 'limit', 'per_page', 'perPage', 'count')
+
+# Response fields recognized when the response schema does not settle them
+ITEMS_KEYS = ('content', 'items', 'data', 'results', 'records', 'elements')
+TOTAL_PAGES_KEYS = ('totalPages', 'total_pages', 'pageCount')
+TOTAL_ITEMS_KEYS = ('totalElements', 'total_elements', 'totalCount', 'total_count', 'total', 'totalItems')
+NEXT_CURSOR_KEYS = ('nextCursor', 'next_cursor', 'nextPageToken', 'nextToken', 'continuationToken')
+
+DEFAULT_PAGE_SIZE = 100
+
+# Page fetcher: takes a path with query string, returns (status code, parsed JSON body)
+PageFetcher = Callable[[str], Awaitable[Tuple[int, Any]]]
+
+
+class PaginationSpec:
+    """How a list operation is paginated, derived from its declared parameters."""
+
+    def __init__(
+        self,
+        style: str,
+        param: str,
+        size_param: Optional[str] = None,
+        first_page: int = 0,
+        max_page_size: Optional[int] = None,
+        items_key: Optional[str] = None
+    ):
+        # 'page', 'offset' or 'cursor'
+        self.style = style
+        self.param = param
+        self.size_param = size_param
+        self.first_page = first_page
+        self.max_page_size = max_page_size
+        self.items_key = items_key
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'style': self.style,
+            'param': self.param,
+            'size_param': self.size_param,
+            'items_key': self.items_key,
+        }
+
+
+def _query_parameters(operation: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {
+        param['name']: param
+        for param in operation.get('parameters', [])
+        if isinstance(param, dict) and param.get('in') == 'query' and param.get('name')
+    }
+
+
+def _first_present(names: Tuple[str, ...], available: Dict[str, Any]) -> Optional[str]:
+    return next((name for name in names if name in available), None)
+
+
+def _response_items_key(operation: Dict[str, Any]) -> Optional[str]:
+    """Name of the array property of the operation's success response schema."""
+    for status in ('200', '206', 'default'):
+        response = operation.get('responses', {}).get(status)
+        if not isinstance(response, dict):
+            continue
+        for media in response.get('content', {}).values():
+            properties = (media.get('schema') or {}).get('properties') if isinstance(media, dict) else None
+            if not isinstance(properties, dict):
+                continue
+            arrays = [name for name, prop in properties.items() if isinstance(prop, dict) and prop.get('type') == 'array']
+            preferred = [name for name in arrays if name in ITEMS_KEYS]
+            if preferred or arrays:
+                return (preferred or arrays)[0]
+    return None
+
+
+def detect_pagination(operation: Dict[str, Any]) -> Optional[PaginationSpec]:
+    """
+    Work out how an operation paginates from its declared query parameters.
+
+    Args:
+        operation: The (dereferenced) OpenAPI operation object
+
+    Returns:
+        The pagination spec, or None if the operation does not look paginated
+    """
+    params = _query_parameters(operation)
+    size_param = _first_present(SIZE_PARAMS, params)
+    items_key = _response_items_key(operation)
+
+    max_page_size = None
+    if size_param:
+        size_schema = params[size_param].get('schema', {})
+        if isinstance(size_schema.get('maximum'), int):
+            max_page_size = size_schema['maximum']
+
+    cursor_param = _first_present(CURSOR_PARAMS, params)
+    if cursor_param:
+        return PaginationSpec('cursor', cursor_param, size_param, max_page_size=max_page_size, items_key=items_key)
+
+    page_param = _first_present(PAGE_PARAMS, params)
+    if page_param:
+        page_schema = params[page_param].get('schema', {})
+        # Spring-style APIs count pages from 0; a declared minimum or default of 1 means 1-based
+        first_page = 1 if 1 in (page_schema.get('minimum'), page_schema.get('default')) else 0
+        return PaginationSpec('page', page_param, size_param, first_page, max_page_size, items_key)
+
+    offset_param = _first_present(OFFSET_PARAMS, params)
+    if offset_param:
+        return PaginationSpec('offset', offset_param, size_param, max_page_size=max_page_size, items_key=items_key)
+    return None
+
+
+def with_query(path: str, **updates: Any) -> str:
+    """Set query parameters on a path, keeping the ones already there."""
+    parts = urlsplit(path)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({key: str(value) for key, value in updates.items() if value is not None})
+    return urlunsplit(('', '', parts.path, urlencode(query), ''))
+
+
+def _first_int(body: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[int]:
+    for key in keys:
+        value = body.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def extract_page(body: Any, items_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Split a page response into its items and paging metadata.
+
+    Returns:
+        dict with 'items', 'total_pages', 'total_items' and 'next_cursor' (None when
+        unknown), or None if the body holds no recognizable list of items
+    """
+    if isinstance(body, list):
+        return {'items': body, 'total_pages': None, 'total_items': None, 'next_cursor': None}
+    if not isinstance(body, dict):
+        return None
+
+    key = items_key if isinstance(body.get(items_key), list) else \
+        next((k for k in ITEMS_KEYS if isinstance(body.get(k), list)), None)
+    if key is None:
+        return None
+    next_cursor = next((body[k] for k in NEXT_CURSOR_KEYS if isinstance(body.get(k), str) and body[k]), None)
+    return {
+        'items': body[key],
+        'total_pages': _first_int(body, TOTAL_PAGES_KEYS),
+        'total_items': _first_int(body, TOTAL_ITEMS_KEYS),
+        'next_cursor': next_cursor,
+    }
+
+
+class PageFetchError(Exception):
+    """A page other than the first could not be fetched."""
+
+    def __init__(self, path: str, status_code: int, body: Any):
+        super().__init__(f"Fetching {path} failed with status {status_code}")
+        self.path = path
+        self.status_code = status_code
+        self.body = body
+
+
+async def collect_pages(
+    fetch: PageFetcher,
+    path: str,
+    spec: PaginationSpec,
+    max_items: int,
+    page_size: Optional[int] = None,
+    concurrency: int = 4
+) -> Dict[str, Any]:
+    """
+    Fetch a paginated listing and merge the items in order.
+
+    The first page is fetched on its own to learn the totals; the remaining
+    pages are then fetched concurrently, at most `concurrency` at a time, and
+    merged as they arrive in page order. Fetching stops once max_items items
+    have been collected. Without totals, pages are fetched in concurrent
+    windows until a short page; cursor pagination is inherently sequential.
+    The page size is taken from the first page when the server returned
+    fewer items than requested, as servers cap or ignore the size parameter.
+
+    Returns:
+        dict with 'items' and 'pagination' describing what was fetched, or with
+        the 'status_code' and 'body' of a first page that failed or held no item list
+    """
+    if page_size is None:
+        page_size = DEFAULT_PAGE_SIZE
+    if spec.max_page_size:
+        page_size = min(page_size, spec.max_page_size)
+    page_size = max(page_size, 1)
+    size_args = {spec.size_param: page_size} if spec.size_param else {}
+
+    def page_path(index: int) -> str:
+        if spec.style == 'page':
+            return with_query(path, **{spec.param: spec.first_page + index}, **size_args)
+        return with_query(path, **{spec.param: index * page_size}, **size_args)
+
+    first_path = page_path(0) if spec.style != 'cursor' else with_query(path, **size_args)
+    status_code, body = await fetch(first_path)
+    first = extract_page(body, spec.items_key) if status_code == 200 else None
+    if first is None:
+        return {'status_code': status_code, 'body': body}
+
+    items: List[Any] = list(first['items'][:max_items])
+    pages_fetched = 1
+    received = len(first['items'])
+    total_items = first['total_items']
+    total_pages = first['total_pages']
+    totals_known = total_pages is not None or total_items is not None
+    more_known = (total_pages is not None and total_pages > 1) or (total_items is not None and total_items > received)
+    # Without totals, a short first page may be the whole list or a page capped by the server
+    probe = 0 < received < page_size and not totals_known
+    if 0 < received < page_size and (more_known or probe):
+        # The server capped or ignored the requested size; its pages hold as many items as the first one
+        page_size = received
+    if total_pages is None and total_items is not None:
+        total_pages = math.ceil(total_items / page_size)
+    cursor = None
+
+    if spec.style == 'cursor':
+        cursor = first['next_cursor']
+        while cursor and len(items) < max_items:
+            status_code, body = await fetch(with_query(path, **{spec.param: cursor}, **size_args))
+            if status_code != 200:
+                raise PageFetchError(path, status_code, body)
+            page = extract_page(body, spec.items_key) or {'items': [], 'next_cursor': None}
+            pages_fetched += 1
+            received += len(page['items'])
+            items.extend(page['items'][:max_items - len(items)])
+            sent = cursor
+            cursor = page['next_cursor'] if page['items'] else None
+            if cursor == sent:
+                # The server echoed the cursor back instead of advancing it
+                cursor = None
+    elif more_known or received >= page_size:
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch_page(index: int) -> Dict[str, Any]:
+            async with semaphore:
+                page_status, page_body = await fetch(page_path(index))
+            if page_status != 200:
+                raise PageFetchError(page_path(index), page_status, page_body)
+            return extract_page(page_body, spec.items_key) or {'items': []}
+
+        # Pages needed to reach the item cap, bounded by the known total
+        needed = math.ceil(max_items / page_size)
+        last_page = min(total_pages, needed) if total_pages is not None else needed
+        window = max(concurrency, 1) if total_pages is None else last_page
+        next_index = 1
+        exhausted = False
+        while next_index < last_page and not exhausted and len(items) < max_items:
+            # Probe a single page first when the first one may have held the whole list
+            stop = min(next_index + (1 if probe and next_index == 1 else window), last_page)
+            tasks = [asyncio.create_task(fetch_page(index)) for index in range(next_index, stop)]
+            try:
+                # Merge in page order as results arrive, stopping early at the item cap
+                for task in tasks:
+                    page = await task
+                    pages_fetched += 1
+                    received += len(page['items'])
+                    items.extend(page['items'][:max_items - len(items)])
+                    if len(items) >= max_items or len(page['items']) < page_size:
+                        exhausted = True
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            next_index = stop
+
+    if total_items is not None:
+        truncated = total_items > len(items)
+    elif spec.style == 'cursor':
+        truncated = bool(cursor)
+    elif total_pages is not None:
+        truncated = pages_fetched < total_pages or received > len(items)
+    else:
+        # Without a known total, hitting the cap means there may be more items
+        truncated = len(items) >= max_items
+    logger.info(f"Collected {len(items)} items from {pages_fetched} page(s) of {path}")
+    return {
+        'items': items,
+        'pagination': {
+            **spec.to_dict(),
+            'page_size': page_size,
+            'pages_fetched': pages_fetched,
+            'total_pages': total_pages,
+            'total_items': total_items,
+            'items_returned': len(items),
+            'truncated': truncated,
+        }
+    }
@@ -0,0 +1,167 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Set, Tuple, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Prefetch requests waiting beyond this many are dropped
+DEFAULT_MAX_PENDING = 64
+
+
+class RenderCache(Generic[T]):
+    """
+    LRU cache of rendered results bounded by their total size in bytes.
+
+    Entries remember whether they were filled by the prefetcher, so the
+    share of prefetched renders that were later used can be reported.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # key -> (value, size, prefetched and not yet used)
+        self._entries: 'OrderedDict[Hashable, Tuple[T, int, bool]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prefetch_hits = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, prefetched = entry
+            self.hits += 1
+            if prefetched:
+                self.prefetch_hits += 1
+                self._entries[key] = (value, size, False)
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: T, size: int, prefetched: bool = False) -> bool:
+        """
+        Store a value, evicting the least recently used entries to stay within budget.
+
+        Returns:
+            bool: Whether the value was stored (values larger than the budget are not)
+        """
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size, prefetched)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "prefetch_hits": self.prefetch_hits,
+                "evictions": self.evictions,
+            }
+
+
+class SchemaPrefetcher:
+    """
+    Renders schemas in the background ahead of the calls expected to need them.
+
+    A small worker pool bounds the CPU spent on speculation, and requests are
+    dropped rather than queued once max_pending renders are outstanding.
+    Results go to the shared RenderCache marked as prefetched.
+    """
+
+    def __init__(self, cache: RenderCache, workers: int, max_pending: int = DEFAULT_MAX_PENDING):
+        self.cache = cache
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='schema-prefetch')
+        self._pending: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def schedule(self, key: Hashable, render: Callable[[], Optional[Tuple[Any, int]]]) -> None:
+        """
+        Render a value in the background unless it is cached or already being rendered.
+
+        Args:
+            key: Cache key of the value
+            render: Returns (value, size in bytes), or None if there is nothing to cache
+        """
+        with self._lock:
+            if key in self._pending or key in self.cache:
+                self.skipped += 1
+                return
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending.add(key)
+            self.scheduled += 1
+        try:
+            self._executor.submit(self._run, key, render)
+        except RuntimeError:
+            # Shut down
+            with self._lock:
+                self._pending.discard(key)
+
+    def _run(self, key: Hashable, render: Callable[[], Optional[Tuple[Any, int]]]) -> None:
+        try:
+            result = render()
+            if result is not None and self.cache.put(key, result[0], result[1], prefetched=True):
+                with self._lock:
+                    self.rendered += 1
+        except Exception as e:
+            logger.debug(f"Prefetch of {key} failed: {e}")
+            with self._lock:
+                self.failed += 1
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        cache = self.cache.snapshot()
+        with self._lock:
+            return {
+                "scheduled": self.scheduled,
+                "rendered": self.rendered,
+                "skipped": self.skipped,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "pending": len(self._pending),
+                # Share of prefetched renders that a later call used
+                "hit_rate": round(cache["prefetch_hits"] / self.rendered, 3) if self.rendered else None,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .models import RouteMatch
+
+logger = logging.getLogger(__name__)
+
+
+def split_path(path: str) -> List[str]:
+    """Split a URL path into segments, ignoring query string and empty segments."""
+    path = path.split('?', 1)[0].split('#', 1)[0]
+    return [segment for segment in path.split('/') if segment]
+
+
+def _param_name(segment: str) -> Optional[str]:
+    """Return the parameter name if the segment is a whole '{param}' template."""
+    if len(segment) > 2 and segment.startswith('{') and segment.endswith('}'):
+        return segment[1:-1]
+    return None
+
+
+class _RouteNode:
+    """A node in the path segment trie."""
+
+    __slots__ = ('literals', 'param', 'methods')
+
+    def __init__(self):
+        self.literals: Dict[str, '_RouteNode'] = {}
+        self.param: Optional['_RouteNode'] = None
+        # HTTP method -> path template ending at this node
+        self.methods: Dict[str, str] = {}
+
+
+class PathRouter:
+    """Segment trie resolving concrete request paths to OpenAPI path templates."""
+
+    def __init__(self):
+        self._root = _RouteNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def from_operations(cls, operations: Iterable[Tuple[str, str]]) -> 'PathRouter':
+        """Build a router from (path template, HTTP method) pairs."""
+        router = cls()
+        for path, method in operations:
+            router.add(path, method)
+        logger.info(f"Built path router with {router._size} routes")
+        return router
+
+    def add(self, template: str, method: str) -> None:
+        """Register a path template for an HTTP method."""
+        node = self._root
+        for segment in split_path(template):
+            if _param_name(segment) is None:
+                node = node.literals.setdefault(segment, _RouteNode())
+            else:
+                # Templates may name the same wildcard differently, so names are
+                # read back from the matched template rather than stored here
+                if node.param is None:
+                    node.param = _RouteNode()
+                node = node.param
+        if method.upper() not in node.methods:
+            self._size += 1
+        node.methods[method.upper()] = template
+
+    def resolve(self, path: str, method: Optional[str] = None) -> Optional[RouteMatch]:
+        """
+        Resolve a concrete path (e.g. '/cc-ui/v1/stacks/prod-stack') to its template.
+
+        Literal segments win over '{param}' wildcards; the router only backtracks
+        to a wildcard when the literal branch has no route for the method.
+
+        Args:
+            path: Concrete or template request path
+            method: HTTP method the route must support (any method if omitted)
+
+        Returns:
+            The matched template, method and extracted path parameters, or None
+        """
+        method = method.upper() if method else None
+        segments = split_path(path)
+        # Iterative depth-first search over (node, depth) pairs
+        stack: List[Tuple[_RouteNode, int]] = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(segments):
+                if method:
+                    matched_method = method if method in node.methods else None
+                else:
+                    matched_method = next(iter(node.methods), None)
+                if matched_method is not None:
+                    template = node.methods[matched_method]
+                    return RouteMatch(
+                        path=template,
+                        method=matched_method,
+                        path_parameters=self._extract_parameters(template, segments)
+                    )
+                continue
+
+            # Push the wildcard first so the literal branch is explored first
+            if node.param is not None:
+                stack.append((node.param, depth + 1))
+            literal = node.literals.get(segments[depth])
+            if literal is not None:
+                stack.append((literal, depth + 1))
+        return None
+
+    @staticmethod
+    def _extract_parameters(template: str, segments: List[str]) -> Dict[str, str]:
+        parameters = {}
+        for template_segment, segment in zip(split_path(template), segments):
+            name = _param_name(template_segment)
+            if name is not None:
+                parameters[name] = segment
+        return parameters
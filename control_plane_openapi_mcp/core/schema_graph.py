@@ -0,0 +1,242 @@
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+import logging
+
+from ..utils.schema_extractor import extract_schema_name_from_ref
+
+logger = logging.getLogger(__name__)
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+
+def iter_schema_refs(node: Any) -> Iterator[str]:
+    """Yield the component schema names of every $ref inside a raw spec fragment."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str):
+                name = extract_schema_name_from_ref(ref)
+                if name:
+                    yield name
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+class SchemaGraph:
+    """
+    Precomputed reference graph between component schemas and operations.
+
+    Built once from the raw (non-dereferenced) spec, so that dependency and
+    usage queries never have to walk the spec.
+    """
+
+    def __init__(
+        self,
+        forward: Dict[str, List[str]],
+        operations: Dict[str, Dict[str, Any]]
+    ):
+        # schema -> schemas it references directly
+        self.forward: Dict[str, List[str]] = forward
+        # "METHOD path" -> {"path", "method", "operationId", "schemas"}
+        self.operations: Dict[str, Dict[str, Any]] = operations
+
+        self.reverse: Dict[str, List[str]] = {name: [] for name in forward}
+        for name, targets in forward.items():
+            for target in targets:
+                self.reverse.setdefault(target, []).append(name)
+
+        self.operations_by_schema: Dict[str, List[str]] = {}
+        for key, operation in operations.items():
+            for name in operation['schemas']:
+                self.operations_by_schema.setdefault(name, []).append(key)
+
+        self.components: List[List[str]] = []
+        self.component_of: Dict[str, int] = {}
+        self._compute_components()
+        self.depth: Dict[str, int] = self._compute_depths()
+
+    @classmethod
+    def from_spec(cls, raw_spec: Dict[str, Any]) -> 'SchemaGraph':
+        """Build the graph from the raw $refs of an OpenAPI spec."""
+        schemas = raw_spec.get('components', {}).get('schemas', {})
+        forward = {
+            name: sorted(set(iter_schema_refs(schema)))
+            for name, schema in schemas.items()
+        }
+
+        operations: Dict[str, Dict[str, Any]] = {}
+        for path, path_item in raw_spec.get('paths', {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            shared_refs = set(iter_schema_refs(path_item.get('parameters', [])))
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                if operation.get('deprecated', False):
+                    continue
+                operations[f"{method.upper()} {path}"] = {
+                    'path': path,
+                    'method': method.upper(),
+                    'operationId': operation.get('operationId', ''),
+                    'schemas': sorted(shared_refs | set(iter_schema_refs(operation))),
+                }
+
+        graph = cls(forward, operations)
+        logger.info(
+            f"Built schema graph ({len(forward)} schemas, "
+            f"{sum(len(t) for t in forward.values())} references, "
+            f"{sum(1 for c in graph.components if graph.is_cyclic_component(c))} cycles)"
+        )
+        return graph
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form, used to store the graph in spec artifacts."""
+        return {'forward': self.forward, 'operations': self.operations}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SchemaGraph':
+        return cls(data['forward'], data['operations'])
+
+    def _compute_components(self) -> None:
+        """Strongly connected components (iterative Tarjan)."""
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        counter = 0
+
+        for root in self.forward:
+            if root in index:
+                continue
+            work: List[Tuple[str, int]] = [(root, 0)]
+            while work:
+                node, edge = work.pop()
+                if edge == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                targets = self.forward.get(node, [])
+                if edge < len(targets):
+                    work.append((node, edge + 1))
+                    target = targets[edge]
+                    if target not in index:
+                        work.append((target, 0))
+                    elif target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                    continue
+
+                # All edges visited: propagate lowlink to the parent and pop the component
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        self.component_of[member] = len(self.components)
+                        component.append(member)
+                        if member == node:
+                            break
+                    self.components.append(sorted(component))
+
+    def is_cyclic_component(self, component: List[str]) -> bool:
+        return len(component) > 1 or component[0] in self.forward.get(component[0], [])
+
+    def _compute_depths(self) -> Dict[str, int]:
+        """
+        Topological depth of each schema in the condensed (acyclic) graph.
+
+        Leaf schemas have depth 0; every other schema is one deeper than its
+        deepest dependency outside its own cycle. Tarjan emits components in
+        reverse topological order, so dependencies are always computed first.
+        """
+        component_depth: List[int] = []
+        for position, component in enumerate(self.components):
+            depth = 0
+            for member in component:
+                for target in self.forward.get(member, []):
+                    target_component = self.component_of.get(target)
+                    if target_component is not None and target_component != position:
+                        depth = max(depth, component_depth[target_component] + 1)
+            component_depth.append(depth)
+        return {
+            name: component_depth[position]
+            for name, position in self.component_of.items()
+        }
+
+    def __contains__(self, schema_name: str) -> bool:
+        return schema_name in self.forward
+
+    def dependencies(self, schema_name: str, max_depth: int = 1) -> Dict[str, int]:
+        """
+        Schemas reachable from a schema within max_depth reference hops.
+
+        Returns:
+            Mapping of dependency name to its distance from the schema
+        """
+        distances: Dict[str, int] = {}
+        queue = deque([(schema_name, 0)])
+        seen = {schema_name}
+        while queue:
+            name, distance = queue.popleft()
+            if distance >= max_depth:
+                continue
+            for target in self.forward.get(name, []):
+                if target not in seen:
+                    seen.add(target)
+                    distances[target] = distance + 1
+                    queue.append((target, distance + 1))
+        return distances
+
+    def dependents(self, schema_name: str) -> Set[str]:
+        """All schemas that reference a schema directly or transitively."""
+        found: Set[str] = set()
+        queue = deque([schema_name])
+        while queue:
+            for source in self.reverse.get(queue.popleft(), []):
+                if source not in found:
+                    found.add(source)
+                    queue.append(source)
+        found.discard(schema_name)
+        return found
+
+    def operations_using(self, schema_name: str, transitive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Operations whose parameters, request body or responses use a schema.
+
+        Args:
+            schema_name: The schema to look up
+            transitive: Also include operations that use the schema through other schemas
+        """
+        names = {schema_name}
+        if transitive:
+            names |= self.dependents(schema_name)
+        keys: Set[str] = set()
+        for name in names:
+            keys.update(self.operations_by_schema.get(name, []))
+        return [
+            {
+                'path': self.operations[key]['path'],
+                'method': self.operations[key]['method'],
+                'operationId': self.operations[key]['operationId'],
+                'direct': schema_name in self.operations[key]['schemas'],
+            }
+            for key in sorted(keys)
+        ]
+
+    def describe(self, schema_name: str) -> Optional[Dict[str, Any]]:
+        """Graph facts about a single schema."""
+        if schema_name not in self.forward:
+            return None
+        component = self.components[self.component_of[schema_name]]
+        return {
+            'references': self.forward[schema_name],
+            'referenced_by': sorted(self.reverse.get(schema_name, [])),
+            'depth': self.depth[schema_name],
+            'cycle': component if self.is_cyclic_component(component) else [],
+        }
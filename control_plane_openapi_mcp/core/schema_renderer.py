@@ -0,0 +1,153 @@
+import json
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Set, Tuple
+import logging
+
+from ..utils.schema_extractor import extract_schema_name_from_ref
+
+logger = logging.getLogger(__name__)
+
+# Omitted property names listed after the byte budget runs out
+MAX_OMITTED_NAMES = 50
+
+# Keys whose values are themselves schemas
+_SCHEMA_KEYS = ('items', 'additionalProperties', 'not')
+_SCHEMA_LIST_KEYS = ('allOf', 'anyOf', 'oneOf')
+
+
+class SchemaRenderResult:
+    """Rendered schema plus accounting about what was cut."""
+
+    def __init__(self, schema: Dict[str, Any], size: int, truncated: bool, collapsed: List[str]):
+        self.schema = schema
+        # Approximate compact JSON size of the rendered schema
+        self.size = size
+        # Whether properties were omitted because the byte budget ran out
+        self.truncated = truncated
+        # Schemas that were left as {"schemaName": ...} references
+        self.collapsed = collapsed
+
+
+class _RenderState:
+    """Byte accounting shared across one render call."""
+
+    def __init__(self, max_depth: int, max_bytes: Optional[int]):
+        self.max_depth = max(max_depth, 0)
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self.used = 0
+        self.truncated = False
+        self.collapsed: Set[str] = set()
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_bytes is not None and self.used >= self.max_bytes
+
+    def charge(self, key: str, value: Any = None) -> None:
+        """Charge a key and, for leaf values, the value's serialized size."""
+        self.used += len(key) + 4
+        if value is not None:
+            self.used += len(json.dumps(value, separators=(',', ':')))
+
+
+class SchemaRenderer:
+    """
+    Renders component schemas from the raw spec with bounded depth and size.
+
+    Referenced object schemas are expanded inline only up to max_depth levels
+    of nesting; deeper ones become {"schemaName": ...} references, and
+    references back into a schema that is already being expanded are marked
+    as recursive. Once the byte budget is spent, remaining properties are
+    omitted and listed by name instead.
+    """
+
+    def __init__(self, schemas: Mapping):
+        self.schemas = schemas
+
+    def render(
+        self,
+        schema_name: str,
+        max_depth: int = 2,
+        max_bytes: Optional[int] = None
+    ) -> Optional[SchemaRenderResult]:
+        """
+        Render a component schema.
+
+        Args:
+            schema_name: Name of the component schema
+            max_depth: Levels of referenced object schemas to expand inline
+            max_bytes: Approximate budget for the compact JSON size of the result
+
+        Returns:
+            The render result, or None if the schema does not exist
+        """
+        schema = self.schemas.get(schema_name)
+        if not isinstance(schema, dict):
+            return None
+
+        state = _RenderState(max_depth, max_bytes)
+        rendered = self._render_node(schema, 0, (schema_name,), state)
+        return SchemaRenderResult(rendered, state.used, state.truncated, sorted(state.collapsed))
+
+    def _render_node(self, node: Any, depth: int, stack: Tuple[str, ...], state: _RenderState) -> Any:
+        if not isinstance(node, dict):
+            return node
+
+        ref_name = extract_schema_name_from_ref(node.get('$ref', ''))
+        if ref_name:
+            return self._render_reference(ref_name, depth, stack, state)
+
+        rendered: Dict[str, Any] = {}
+        for key, value in node.items():
+            if key == 'properties' and isinstance(value, dict):
+                state.charge(key)
+                rendered[key] = self._render_properties(value, depth, stack, state)
+            elif key in _SCHEMA_KEYS and isinstance(value, dict):
+                state.charge(key)
+                rendered[key] = self._render_node(value, depth, stack, state)
+            elif key in _SCHEMA_LIST_KEYS and isinstance(value, list):
+                state.charge(key)
+                rendered[key] = [self._render_node(item, depth, stack, state) for item in value]
+            else:
+                state.charge(key, value)
+                rendered[key] = value
+        return rendered
+
+    def _render_reference(self, name: str, depth: int, stack: Tuple[str, ...], state: _RenderState) -> Any:
+        if name in stack:
+            state.charge('schemaName', name)
+            return {'schemaName': name, 'recursive': True}
+
+        target = self.schemas.get(name)
+        # Only object schemas count as a nesting level; enums and aliases are inlined
+        is_object = isinstance(target, dict) and ('properties' in target or target.get('type') == 'object')
+        if not isinstance(target, dict) or (is_object and depth >= state.max_depth) or state.exhausted:
+            state.collapsed.add(name)
+            state.charge('schemaName', name)
+            return {'schemaName': name}
+
+        state.charge('schemaName', name)
+        rendered = self._render_node(target, depth + 1 if is_object else depth, stack + (name,), state)
+        return {'schemaName': name, **rendered}
+
+    def _render_properties(
+        self,
+        properties: Dict[str, Any],
+        depth: int,
+        stack: Tuple[str, ...],
+        state: _RenderState
+    ) -> Dict[str, Any]:
+        rendered: Dict[str, Any] = {}
+        omitted: List[str] = []
+        for name, value in properties.items():
+            if state.exhausted:
+                omitted.append(name)
+                continue
+            state.charge(name)
+            rendered[name] = self._render_node(value, depth, stack, state)
+
+        if omitted:
+            state.truncated = True
+            marker = {'omittedCount': len(omitted), 'omittedProperties': omitted[:MAX_OMITTED_NAMES]}
+            rendered['...'] = marker
+            state.charge('...', marker)
+        return rendered
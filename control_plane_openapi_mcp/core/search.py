@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from fuzzywuzzy import fuzz
 from .models import SpecOperationEntry, SpecSchemaEntry, LoadOperationResult
 import logging
@@ -26,18 +26,8 @@ class SearchEngine:
         query_lower = query.lower()
         
         for operation in operations:
-            # Create searchable text from operation fields
-            searchable_text = ' '.join(filter(None, [
-                operation.operation_id or '',
-                operation.summary or '',
-                operation.description or '',
-                ' '.join(operation.tags),
-                operation.path,
-                operation.method
-            ])).lower()
-            
             # Calculate fuzzy match score
-            score = fuzz.partial_ratio(query_lower, searchable_text)
+            score = fuzz.partial_ratio(query_lower, self._operation_text(operation))
             
             if score >= threshold:
                 scored_operations.append((score, operation))
@@ -49,6 +39,51 @@ class SearchEngine:
         logger.info(f"Found {len(result)} operations matching '{query}'")
         return result
     
+    def search_operations_multi(
+        self,
+        operations: List[SpecOperationEntry],
+        queries: Sequence[str],
+        limit: int,
+        candidates: Optional[Sequence[int]] = None,
+        threshold: int = 60
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Score several queries in one pass over the operations.
+
+        Each operation's searchable text is built once and matched against
+        every (normalized, deduplicated) query.
+
+        Returns:
+            Per query, (position in operations, score) pairs of the best matches, best first
+        """
+        normalized = [query.strip().lower() for query in queries]
+        distinct = [query for query in dict.fromkeys(normalized) if query]
+        scored: Dict[str, List[Tuple[int, float]]] = {query: [] for query in distinct}
+
+        positions = range(len(operations)) if candidates is None else candidates
+        for position in positions:
+            searchable_text = self._operation_text(operations[position])
+            for query in distinct:
+                score = fuzz.partial_ratio(query, searchable_text)
+                if score >= threshold:
+                    scored[query].append((position, float(score)))
+
+        for matches in scored.values():
+            matches.sort(key=lambda x: x[1], reverse=True)
+        return [scored[query][:limit] if query else [] for query in normalized]
+
+    @staticmethod
+    def _operation_text(operation: SpecOperationEntry) -> str:
+        """Searchable text from operation fields."""
+        return ' '.join(filter(None, [
+            operation.operation_id or '',
+            operation.summary or '',
+            operation.description or '',
+            ' '.join(operation.tags),
+            operation.path,
+            operation.method
+        ])).lower()
+
     def search_schemas(
         self, 
         schemas: List[SpecSchemaEntry], 
@@ -1,57 +1,312 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import copy
+import json
 import logging
-from .spec_loader import SpecLoader
-from .spec_processor import SpecProcessor
+import os
+import threading
+from .artifact import SpecArtifact
+from .federation import create_spec_loader
+from .spec_processor import CatalogBuilder, SpecProcessor
+from .completion import CompletionIndex
+from .facets import FacetIndex
+from .field_index import FieldIndex
+from .hotset import HotSet, catalog_fingerprint
+from .pagination import PaginationSpec, detect_pagination
+from .prefetch import RenderCache, SchemaPrefetcher
+from .router import PathRouter
+from .shared_cache import SharedSpecCache
+from .schema_graph import SchemaGraph
+from .schema_renderer import SchemaRenderer, SchemaRenderResult
 from .search import SearchEngine
+from .suggest import BKTree
+from .fts_search import FtsSearchEngine
+from .vector_search import TfidfSearchEngine
+from .watcher import SpecWatcher
 from .cache import SimpleCache
 from .models import (
     SpecCatalogEntry, 
     LoadOperationResult, 
     LoadSchemaResult,
+    RouteMatch,
     SpecOperationEntry,
     SpecSchemaEntry
 )
+from ..utils.schema_extractor import create_safe_operation_output, index_component_properties, referenced_schema_names
 
 logger = logging.getLogger(__name__)
 
+# Memory budget of the operation search result cache
+SEARCH_CACHE_BYTES = 1_000_000
+
+# Reciprocal rank fusion constant; damps the weight of top ranks when merging multi-query results
+RRF_K = 60
+
+
+# Attributes derived from one version of the spec, swapped together on reload
+_SPEC_STATE = (
+    'loader', 'cache', 'index_engine', '_spec', '_catalog', '_artifact', '_router', '_facets',
+    '_completions', '_suggestions', '_operation_positions', '_schemas_by_name', '_field_index',
+    '_fingerprint', '_schema_graph', '_streamed_catalog', '_generation', '_ready',
+)
+
+
+def _positions_size(positions: List[int]) -> int:
+    """Approximate memory held by a cached list of positions."""
+    return 64 + 8 * len(positions)
+
+
+def _paginate(items: List[Any], limit: Optional[int], offset: int) -> List[Any]:
+    """Apply limit/offset to an already ranked result list."""
+    if limit:
+        return items[offset:offset + limit]
+    return items[offset:]
+
 
 class OpenAPIService:
     """Main service for managing OpenAPI specifications."""
     
-    def __init__(self, url: str, spec_id: str, cache_ttl: int = 3600):
+    def __init__(
+        self,
+        url: str,
+        spec_id: str,
+        cache_ttl: int = 3600,
+        artifact_path: Optional[str] = None,
+        search_backend: str = 'fuzzy',
+        search_db_path: Optional[str] = None,
+        shared_cache_dir: Optional[str] = None,
+        render_cache_bytes: int = 8_000_000,
+        prefetch_workers: int = 2,
+        schema_max_depth: int = 2,
+        schema_max_bytes: Optional[int] = None,
+        hot_set_path: Optional[str] = None,
+        warm_entries: int = 30,
+        watch_interval: float = 0
+    ):
         self.url = url
         self.spec_id = spec_id
         self.cache_ttl = cache_ttl
+        self.artifact_path = artifact_path
+        self.search_backend = search_backend
+        self.search_db_path = search_db_path
+        # Render bounds of schema tool calls that do not pass their own
+        self.schema_max_depth = schema_max_depth
+        self.schema_max_bytes = schema_max_bytes
+        self.warm_entries = warm_entries
         
-        self.loader = SpecLoader(url)
+        self.loader = create_spec_loader(url)
+        # Compiled artifacts shared with other server processes, when enabled
+        self.shared_cache = SharedSpecCache(shared_cache_dir, url, spec_id, cache_ttl) if shared_cache_dir else None
         self.processor = SpecProcessor(spec_id)
         self.search_engine = SearchEngine(spec_id)
+        # Optional indexed backend; fuzzy scanning is used when none is configured
+        self.index_engine = self._create_index_engine(search_backend, search_db_path)
         self.cache = SimpleCache[Dict[str, Any]](cache_ttl)
+        # Rendered schemas, filled on demand and ahead of time by the prefetcher
+        self.render_cache = RenderCache[SchemaRenderResult](render_cache_bytes)
+        self.prefetcher = SchemaPrefetcher(self.render_cache, prefetch_workers) if prefetch_workers > 0 else None
+        # Operation search results as catalog positions, keyed by query hash
+        self.search_cache = RenderCache[List[int]](SEARCH_CACHE_BYTES)
+        # Access frequencies persisted across restarts, for warm starts
+        self.hot_set = HotSet(hot_set_path) if hot_set_path else None
         
         self._catalog: Optional[SpecCatalogEntry] = None
         self._spec: Optional[Dict[str, Any]] = None
+        self._artifact: Optional[SpecArtifact] = None
+        self._router: Optional[PathRouter] = None
+        self._facets: Optional[FacetIndex] = None
+        self._completions: Optional[CompletionIndex] = None
+        # Near-miss suggestions for exact lookups, keyed by identifier kind
+        self._suggestions: Dict[str, BKTree] = {}
+        # (path, METHOD) -> position in the catalog operations
+        self._operation_positions: Dict[Tuple[str, str], int] = {}
+        self._schemas_by_name: Dict[str, SpecSchemaEntry] = {}
+        # Property, parameter and enum names -> schemas and operations
+        self._field_index: Optional[FieldIndex] = None
+        self._fingerprint: Optional[str] = None
+        self._warmed = {"schemas": 0, "queries": 0}
+        self._schema_graph: Optional[SchemaGraph] = None
+        # Catalog entries collected while the spec was streamed in
+        self._streamed_catalog: Optional[CatalogBuilder] = None
+        # Tools run on a thread pool; serialize (re)initialization between them
+        self._init_lock = threading.RLock()
+        self._ready = False
+        # Bumped on refresh so renders of the previous spec are never served
+        self._generation = 0
+        # Reloads local spec files when they change (file:// URLs and plain paths only)
+        self.watcher = (
+            SpecWatcher(self.loader.path, self.refresh, watch_interval)
+            if self.loader.path and watch_interval > 0 else None
+        )
+        self._reloads = 0
+    
+    def _create_index_engine(self, search_backend: str, search_db_path: Optional[str]):
+        """Create the configured indexed search backend, if any."""
+        if search_backend == 'fts':
+            if FtsSearchEngine.is_available():
+                return FtsSearchEngine(self.spec_id, search_db_path or ':memory:')
+            logger.warning("SQLite FTS5 trigram tokenizer not available, using fuzzy search")
+        elif search_backend == 'tfidf':
+            if TfidfSearchEngine.is_available():
+                return TfidfSearchEngine(self.spec_id)
+            logger.warning("numpy is not installed, using fuzzy search")
+        elif search_backend != 'fuzzy':
+            logger.warning(f"Unknown search backend '{search_backend}', using fuzzy search")
+        return None
     
     def initialize(self) -> None:
         """Initialize the service by loading and processing the spec."""
+        with self._init_lock:
+            if self._ready:
+                # Another thread finished initializing while this one waited
+                return
+            self._initialize()
+    
+    def is_ready(self) -> bool:
+        """Whether the spec is loaded, without triggering a load."""
+        return self._ready
+    
+    def _ensure_initialized(self) -> None:
+        """Initialize on first use."""
+        if not self._ready:
+            self.initialize()
+    
+    def _initialize(self) -> None:
+        if self.watcher:
+            # Started before the first load, so changes made while loading are seen
+            self.watcher.start()
+        self._build()
+        if self.hot_set:
+            threading.Thread(target=self._warm_up, args=(self._generation,), name='hot-set-warmup', daemon=True).start()
+    
+    def _build(self, force_refresh: bool = False) -> None:
+        """Load the spec (or artifact) and build the catalog and indexes."""
         try:
-            self._load_spec()
-            self._build_catalog()
+            artifact_path = None
+            if self.artifact_path and os.path.exists(self.artifact_path):
+                artifact_path = self.artifact_path
+            elif self.shared_cache:
+                artifact_path = self._get_shared_artifact(force_refresh)
+            if artifact_path:
+                self._load_artifact(artifact_path)
+            else:
+                self._load_spec()
+                self._build_catalog()
+            self._router = PathRouter.from_operations(
+                (op.path, op.method) for op in self._catalog.operations
+            )
+            self._facets = FacetIndex(self._catalog.operations)
+            self._completions = CompletionIndex.from_catalog(self._catalog)
+            self._suggestions = {
+                'operation_id': BKTree(op.operation_id for op in self._catalog.operations),
+                'schema': BKTree(schema.name for schema in self._catalog.schemas),
+            }
+            if self.index_engine:
+                self.index_engine.index_catalog(self._catalog)
+            self._operation_positions = {
+                (op.path, op.method): position for position, op in enumerate(self._catalog.operations)
+            }
+            self._schemas_by_name = {schema.name: schema for schema in self._catalog.schemas}
+            self._fingerprint = catalog_fingerprint(
+                self._catalog, type(self.index_engine).__name__ if self.index_engine else 'fuzzy'
+            )
+            self._ready = True
             logger.info("OpenAPI service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAPI service: {e}")
             raise
     
     def refresh(self) -> None:
-        """Refresh the specification from the URL."""
+        """
+        Refresh the specification from its source.
+        
+        The new spec is loaded and indexed in the background while tool calls
+        keep being served from the current one, then swapped in at once. If
+        loading fails, the current spec stays in place.
+        """
+        with self._init_lock:
+            self._refresh()
+    
+    def _refresh(self) -> None:
+        if self.watcher:
+            self.watcher.start()
         try:
-            self.cache.clear()
-            self._spec = None
-            self._catalog = None
-            self.initialize()
+            staged = copy.copy(self)
+            staged.loader = create_spec_loader(self.url)
+            staged.cache = SimpleCache[Dict[str, Any]](self.cache_ttl)
+            staged.index_engine = self._create_index_engine(self.search_backend, self.search_db_path)
+            staged._artifact = None
+            staged._streamed_catalog = None
+            staged._generation = self._generation + 1
+            staged._build(force_refresh=True)
+            
+            # The replaced state is still referenced here, so nothing is freed during the
+            # update and, under the GIL, tool calls see either the old spec or the new one.
+            # The old artifact mapping and index connection are left to the garbage
+            # collector so calls still using them can finish.
+            replaced = {name: self.__dict__[name] for name in _SPEC_STATE}
+            self.__dict__.update({name: staged.__dict__[name] for name in _SPEC_STATE})
+            del replaced
+            self.render_cache.clear()
+            self.search_cache.clear()
+            self._reloads += 1
             logger.info("OpenAPI service refreshed successfully")
         except Exception as e:
             logger.error(f"Failed to refresh OpenAPI service: {e}")
             raise
+        if self.hot_set:
+            threading.Thread(target=self._warm_up, args=(self._generation,), name='hot-set-warmup', daemon=True).start()
+    
+    def _warm_up(self, generation: int) -> None:
+        """Fill the caches with the most frequently used entries of earlier runs."""
+        try:
+            n = self.warm_entries
+            for key, positions in self.hot_set.query_results(self._fingerprint, n).items():
+                self.search_cache.put(key, positions, _positions_size(positions))
+                self._warmed["queries"] += 1
+            
+            hot_operations = set(self.hot_set.top('operations', n))
+            operations = [
+                op for op in self._catalog.operations if self.hot_set.key(f"{op.method} {op.path}") in hot_operations
+            ]
+            hot_schemas = set(self.hot_set.top('schemas', n))
+            schema_names = [schema.name for schema in self._catalog.schemas if self.hot_set.key(schema.name) in hot_schemas]
+            for op in operations:
+                operation = self.find_operation_by_path_and_method(op.path, op.method, record=False)
+                if operation:
+                    rendered = self.render_operations([operation])[0]
+                    schema_names.extend(referenced_schema_names(rendered))
+            
+            for schema_name in dict.fromkeys(schema_names):
+                if generation != self._generation:
+                    return
+                key = (generation, schema_name, self.schema_max_depth, self.schema_max_bytes)
+                if key in self.render_cache:
+                    continue
+                rendered = self._render_schema(schema_name, self.schema_max_depth, self.schema_max_bytes)
+                if rendered is not None and self.render_cache.put(key, rendered, rendered.size, prefetched=True):
+                    self._warmed["schemas"] += 1
+            logger.info(
+                f"Warmed caches from the hot set ({self._warmed['schemas']} schemas, {self._warmed['queries']} searches)"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to warm caches from the hot set: {e}")
+    
+    def _get_shared_artifact(self, force_refresh: bool) -> Optional[str]:
+        """Get the artifact from the cross-process cache, or None to load the spec directly."""
+        try:
+            return self.shared_cache.get_artifact_path(force_refresh)
+        except OSError as e:
+            logger.warning(f"Shared spec cache unavailable, loading spec directly: {e}")
+            return None
+    
+    def _load_artifact(self, artifact_path: str) -> None:
+        """Memory-map a precompiled spec artifact instead of fetching the spec."""
+        self._artifact = SpecArtifact(artifact_path)
+        self._spec = self._artifact.get_spec_view()
+        self._catalog = self._artifact.get_catalog()
+        self._schema_graph = self._artifact.get_schema_graph()
+        self._field_index = self._artifact.get_field_index()
+        logger.info(f"Loaded catalog from artifact {artifact_path}")
     
     def _load_spec(self) -> None:
         """Load and cache the OpenAPI specification."""
@@ -60,9 +315,15 @@ class OpenAPIService:
             self._spec = cached_spec
             logger.info("Using cached OpenAPI specification")
         else:
-            self._spec = self.loader.get_processed_spec()
+            builder = CatalogBuilder(self.processor)
+            self._spec = self.loader.get_processed_spec(builder.add_path_item, builder.add_schema)
+            # The callbacks only fire when the spec is actually fetched
+            self._streamed_catalog = None if builder.is_empty else builder
             self.cache.set('spec', self._spec)
             logger.info("Loaded and cached OpenAPI specification")
+        raw_spec = self.loader.get_raw_spec()
+        self._schema_graph = SchemaGraph.from_spec(raw_spec)
+        self._field_index = FieldIndex.from_spec(self._spec, raw_spec.get('components', {}).get('schemas', {}))
     
     def _build_catalog(self) -> None:
         """Build the catalog from the specification."""
@@ -74,55 +335,290 @@ class OpenAPIService:
             # Reconstruct catalog from cached data
             self._catalog = SpecCatalogEntry(**cached_catalog)
             logger.info("Using cached catalog")
+        elif self._streamed_catalog:
+            description = self._spec.get('info', {}).get('description', '')
+            self._catalog = self._streamed_catalog.build(description)
+            self._streamed_catalog = None
+            self.cache.set('catalog', self._catalog.model_dump())
+            logger.info("Built and cached catalog")
         else:
             self._catalog = self.processor.build_catalog(self._spec)
             self.cache.set('catalog', self._catalog.model_dump())
             logger.info("Built and cached catalog")
     
-    def search_operations(self, query: str) -> List[LoadOperationResult]:
-        """Search for operations matching the query."""
-        if not self._catalog or not self._spec:
-            self.initialize()
+    def search_operations(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None
+    ) -> List[LoadOperationResult]:
+        """
+        Search for operations matching the query.
+
+        Args:
+            method: HTTP method filter (comma-separated alternatives)
+            tag: Tag filter (comma-separated alternatives, case-insensitive)
+            path_prefix: Path prefix filter (comma-separated alternatives)
+        """
+        self._ensure_initialized()
         
-        # Search operations
-        matching_operations = self.search_engine.search_operations(
-            self._catalog.operations, query
+        query_key = json.dumps([' '.join(query.casefold().split()), limit, offset, method, tag, path_prefix])
+        if self.hot_set:
+            query_key = self.hot_set.key(query_key)
+        positions = self.search_cache.get(query_key)
+        if positions is None:
+            positions = self._search_positions(query, limit, offset, method, tag, path_prefix)
+            self.search_cache.put(query_key, positions, _positions_size(positions))
+        if self.hot_set:
+            self.hot_set.record_key('queries', query_key, self._fingerprint, positions)
+        return self._operation_results(positions)
+    
+    def search_operations_multi(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None
+    ) -> Tuple[List[List[LoadOperationResult]], List[Tuple[LoadOperationResult, float, List[int]]]]:
+        """
+        Search for operations matching any of several queries in one pass.
+        
+        The facet filter is applied once, all queries are scored together by
+        the search backend, and the per-query rankings are merged with
+        reciprocal rank fusion. A blank query matches every operation, like
+        an empty query of search_operations.
+        
+        Returns:
+            The ranked operations of each query, and the merged ranking as
+            (operation, fused score, indexes of the queries matching it)
+        """
+        self._ensure_initialized()
+        
+        ranked: List[List[int]] = [[] for _ in queries]
+        mask = self._facets.filter(method, tag, path_prefix)
+        if mask != 0:
+            candidates = self._facets.positions(mask) if mask is not None else None
+            texts = [query for query in queries if query.strip()]
+            scored = []
+            if texts:
+                engine = self.index_engine
+                if engine:
+                    scored = engine.search_operations_multi(texts, limit, candidates)
+                else:
+                    scored = self.search_engine.search_operations_multi(
+                        self._catalog.operations, texts, limit, candidates
+                    )
+            # A blank query matches every operation in catalog order, as in search_operations
+            everything = list(range(len(self._catalog.operations)) if candidates is None else candidates)[:limit]
+            matches = iter(scored)
+            ranked = [
+                [position for position, _ in next(matches)] if query.strip() else everything
+                for query in queries
+            ]
+        
+        fused: Dict[int, float] = {}
+        matched_queries: Dict[int, List[int]] = {}
+        for query_index, positions in enumerate(ranked):
+            for rank, position in enumerate(positions):
+                fused[position] = fused.get(position, 0.0) + 1.0 / (RRF_K + rank + 1)
+                matched_queries.setdefault(position, []).append(query_index)
+        order = sorted(fused, key=lambda position: (-fused[position], position))
+        
+        results = {}
+        for position in order:
+            result = self._operation_result(position)
+            if result:
+                results[position] = result
+        per_query = [[results[p] for p in positions if p in results] for positions in ranked]
+        merged = [
+            (results[p], fused[p], matched_queries[p]) for p in order if p in results
+        ]
+        logger.info(f"Multi-query search of {len(queries)} queries matched {len(merged)} operations")
+        return per_query, merged
+    
+    def _operation_results(self, positions: List[int]) -> List[LoadOperationResult]:
+        """Full operations at catalog positions."""
+        results = [self._operation_result(position) for position in positions]
+        return [result for result in results if result]
+    
+    def _operation_result(self, position: int) -> Optional[LoadOperationResult]:
+        op = self._catalog.operations[position]
+        # Find the full operation data
+        op_data = self.processor.find_operation_by_path_and_method(
+            self._spec, op.path, op.method.lower()
         )
+        if not op_data:
+            return None
+        return LoadOperationResult(
+            path=op.path,
+            method=op.method,
+            operation=op_data['operation'],
+            spec_id=self.spec_id,
+            uri=f"apis://{self.spec_id}/operations/{op.operation_id}"
+        )
+    
+    def _search_positions(
+        self,
+        query: str,
+        limit: Optional[int],
+        offset: int,
+        method: Optional[str],
+        tag: Optional[str],
+        path_prefix: Optional[str]
+    ) -> List[int]:
+        """Catalog positions of the ranked operations matching a query and filters."""
+        # Narrow the catalog with the facet bitsets before scoring
+        mask = self._facets.filter(method, tag, path_prefix)
+        if mask == 0:
+            return []
         
-        # Convert to LoadOperationResult
-        results = []
-        for op in matching_operations:
-            # Find the full operation data
-            op_data = self.processor.find_operation_by_path_and_method(
-                self._spec, op.path, op.method.lower()
+        # Search operations
+        if self.index_engine:
+            candidates = self._facets.positions(mask) if mask is not None else None
+            matching_operations = self.index_engine.search_operations(query, limit, offset, candidates)
+        else:
+            operations = self._catalog.operations
+            if mask is not None:
+                operations = self._facets.select(mask, operations)
+            matching_operations = _paginate(
+                self.search_engine.search_operations(operations, query),
+                limit,
+                offset
             )
-            if op_data:
-                results.append(LoadOperationResult(
-                    path=op.path,
-                    method=op.method,
-                    operation=op_data['operation'],
-                    spec_id=self.spec_id,
-                    uri=f"apis://{self.spec_id}/operations/{op.operation_id}"
-                ))
+        return [self._operation_positions[(op.path, op.method)] for op in matching_operations]
+    
+    def search_schemas(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[SpecSchemaEntry]:
+        """Search for schemas matching the query."""
+        self._ensure_initialized()
+        
+        if self.index_engine:
+            return self.index_engine.search_schemas(query, limit, offset)
+        return _paginate(
+            self.search_engine.search_schemas(self._catalog.schemas, query),
+            limit,
+            offset
+        )
+    
+    def search_operations_by_field(
+        self,
+        kind: str,
+        name: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None
+    ) -> List[Tuple[LoadOperationResult, List[Dict[str, Any]]]]:
+        """
+        Find the operations taking a parameter, or accepting an enum value in a parameter.
+        
+        Args:
+            kind: 'parameters' or 'enums'
+            name: Parameter name or enum value (case- and separator-insensitive)
         
+        Returns:
+            (operation, matching parameters) pairs in catalog order
+        """
+        self._ensure_initialized()
+        
+        mask = self._facets.filter(method, tag, path_prefix)
+        matches = []
+        for key, postings in self._field_index.operations_with(kind, name).items():
+            operation_method, path = key.split(' ', 1)
+            position = self._operation_positions.get((path, operation_method))
+            if position is None or (mask is not None and not mask >> position & 1):
+                continue
+            matches.append((position, postings))
+        matches.sort(key=lambda match: match[0])
+        
+        results = []
+        for position, postings in _paginate(matches, limit, offset):
+            op = self._catalog.operations[position]
+            operation = self.find_operation_by_path_and_method(op.path, op.method, record=False)
+            if operation:
+                results.append((operation, [
+                    {k: v for k, v in posting.items() if k != 'operation'} for posting in postings
+                ]))
         return results
     
-    def search_schemas(self, query: str) -> List[SpecSchemaEntry]:
-        """Search for schemas matching the query."""
-        if not self._catalog:
-            self.initialize()
+    def search_schemas_by_field(
+        self,
+        kind: str,
+        name: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Tuple[SpecSchemaEntry, List[Dict[str, Any]]]]:
+        """
+        Find the schemas declaring a property, or an enum value, at any nesting level.
+        
+        Args:
+            kind: 'properties' or 'enums'
+            name: Property name, dotted property path suffix or enum value
         
-        return self.search_engine.search_schemas(self._catalog.schemas, query)
+        Returns:
+            (schema, matching property paths) pairs
+        """
+        self._ensure_initialized()
+        
+        matches = [
+            (self._schemas_by_name[schema_name], [
+                {k: v for k, v in posting.items() if k != 'schema'} for posting in postings
+            ])
+            for schema_name, postings in self._field_index.schemas_with(kind, name).items()
+            if schema_name in self._schemas_by_name
+        ]
+        return _paginate(matches, limit, offset)
+    
+    def complete_identifier(
+        self,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Complete the prefix of an operationId, schema name or path template."""
+        self._ensure_initialized()
+        
+        return self._completions.complete(prefix, kind, limit)
+    
+    def suggest_identifiers(self, kind: str, name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Suggest the operationIds or schema names closest to a name that was not found.
+        
+        Args:
+            kind: 'operation_id' or 'schema'
+        """
+        self._ensure_initialized()
+        
+        return [
+            {"name": value, "distance": edit_distance}
+            for value, edit_distance in self._suggestions[kind].search(name, limit=limit)
+        ]
     
     def find_operation_by_id(self, operation_id: str) -> Optional[LoadOperationResult]:
         """Find an operation by its operationId."""
-        if not self._spec:
-            self.initialize()
+        self._ensure_initialized()
         
-        op_data = self.processor.find_operation_by_id(self._spec, operation_id)
+        if self._artifact:
+            location = self._artifact.locate_operation(operation_id)
+            op_data = self.processor.find_operation_by_path_and_method(
+                self._spec, *location
+            ) if location else None
+        else:
+            op_data = self.processor.find_operation_by_id(self._spec, operation_id)
         if not op_data:
             return None
         
+        if self.hot_set:
+            self.hot_set.record('operations', f"{op_data['method'].upper()} {op_data['path']}")
         return LoadOperationResult(
             path=op_data['path'],
             method=op_data['method'],
@@ -134,19 +630,37 @@ class OpenAPIService:
     def find_operation_by_path_and_method(
         self, 
         path: str, 
-        method: str
+        method: str,
+        record: bool = True
     ) -> Optional[LoadOperationResult]:
-        """Find an operation by path and method."""
-        if not self._spec:
-            self.initialize()
+        """
+        Find an operation by path and method.
+        
+        The path may be either the template (e.g. '/cc-ui/v1/stacks/{stackName}')
+        or a concrete path (e.g. '/cc-ui/v1/stacks/prod-stack').
+        
+        Args:
+            record: Count the access in the hot set
+        """
+        self._ensure_initialized()
         
         op_data = self.processor.find_operation_by_path_and_method(
             self._spec, path, method
         )
         if not op_data:
-            return None
+            route = self.resolve_path(path, method)
+            if not route:
+                return None
+            path = route.path
+            op_data = self.processor.find_operation_by_path_and_method(
+                self._spec, path, method
+            )
+            if not op_data:
+                return None
         
         operation_id = op_data['operation'].get('operationId', '')
+        if self.hot_set and record:
+            self.hot_set.record('operations', f"{method.upper()} {path}")
         return LoadOperationResult(
             path=path,
             method=method.upper(),
@@ -155,15 +669,30 @@ class OpenAPIService:
             uri=f"apis://{self.spec_id}/operations/{operation_id}"
         )
     
+    def resolve_path(self, path: str, method: Optional[str] = None) -> Optional[RouteMatch]:
+        """Resolve a concrete request path to its operation template and path parameters."""
+        self._ensure_initialized()
+        
+        return self._router.resolve(path, method)
+    
+    def detect_pagination(self, path: str) -> Optional[PaginationSpec]:
+        """Get how the GET operation behind a concrete request path paginates, if it does."""
+        route = self.resolve_path(path, 'GET')
+        if not route:
+            return None
+        operation = self.find_operation_by_path_and_method(route.path, 'GET', record=False)
+        return detect_pagination(operation.operation) if operation else None
+    
     def find_schema_by_name(self, schema_name: str) -> Optional[LoadSchemaResult]:
         """Find a schema by name."""
-        if not self._spec:
-            self.initialize()
+        self._ensure_initialized()
         
         schema_data = self.processor.find_schema_by_name(self._spec, schema_name)
         if not schema_data:
             return None
         
+        if self.hot_set:
+            self.hot_set.record('schemas', schema_name)
         return LoadSchemaResult(
             name=schema_name,
             description=schema_data.get('description', ''),
@@ -171,9 +700,126 @@ class OpenAPIService:
             uri=f"apis://{self.spec_id}/schemas/{schema_name}"
         )
     
+    def get_schema_graph(self) -> SchemaGraph:
+        """Get the schema reference graph."""
+        self._ensure_initialized()
+        
+        if self._schema_graph is None:
+            raise ValueError("Schema graph is not available; recompile the spec artifact")
+        return self._schema_graph
+    
+    def render_schema(
+        self,
+        schema_name: str,
+        max_depth: int = 2,
+        max_bytes: Optional[int] = None
+    ) -> Optional[SchemaRenderResult]:
+        """Render a schema from the raw spec with bounded nesting depth and size."""
+        self._ensure_initialized()
+        
+        key = (self._generation, schema_name, max_depth, max_bytes)
+        rendered = self.render_cache.get(key)
+        if rendered is None:
+            rendered = self._render_schema(schema_name, max_depth, max_bytes)
+            if rendered is not None:
+                self.render_cache.put(key, rendered, rendered.size)
+        return rendered
+    
+    def _render_schema(self, schema_name: str, max_depth: int, max_bytes: Optional[int]) -> Optional[SchemaRenderResult]:
+        if self._artifact:
+            raw_schemas = self._artifact.get_raw_schemas()
+        else:
+            raw_schemas = self.loader.get_raw_spec().get('components', {}).get('schemas', {})
+        return SchemaRenderer(raw_schemas).render(schema_name, max_depth, max_bytes)
+    
+    def prefetch_schemas(self, schema_names: List[str]) -> None:
+        """
+        Render schemas and their direct dependencies in the background.
+        
+        Called after an operation is loaded, so the schema loads that usually
+        follow (with the default render bounds) are served from the render cache.
+        """
+        if not self.prefetcher or not self._ready:
+            return
+        
+        max_depth, max_bytes = self.schema_max_depth, self.schema_max_bytes
+        names = dict.fromkeys(schema_names)
+        if self._schema_graph is not None:
+            for schema_name in schema_names:
+                names.update(dict.fromkeys(self._schema_graph.dependencies(schema_name, 1)))
+        generation = self._generation
+        for schema_name in names:
+            def render(schema_name: str = schema_name):
+                if generation != self._generation:
+                    return None
+                rendered = self._render_schema(schema_name, max_depth, max_bytes)
+                return (rendered, rendered.size) if rendered is not None else None
+            self.prefetcher.schedule((generation, schema_name, max_depth, max_bytes), render)
+    
     def get_components_schemas(self) -> Dict[str, Any]:
         """Get all schemas from components/schemas."""
-        if not self._spec:
-            self.initialize()
+        self._ensure_initialized()
         
         return self._spec.get('components', {}).get('schemas', {})
+    
+    def render_operation(self, operation: LoadOperationResult) -> Dict[str, Any]:
+        """Render the tool output for an operation, using the artifact when available."""
+        return self.render_operations([operation])[0]
+    
+    def render_operations(self, operations: List[LoadOperationResult]) -> List[Dict[str, Any]]:
+        """
+        Render the tool output for several operations.
+        
+        Components and their property index are looked up once and shared by
+        all operations that are not precompiled in the artifact.
+        """
+        components_schemas = None
+        property_index = None
+        rendered_operations = []
+        for operation in operations:
+            rendered = None
+            if self._artifact:
+                rendered = self._artifact.get_rendered_operation(operation.path, operation.method)
+            if rendered is None:
+                if components_schemas is None:
+                    components_schemas = self.get_components_schemas()
+                    property_index = index_component_properties(components_schemas) if len(operations) > 1 else None
+                rendered = create_safe_operation_output(operation.operation, components_schemas, property_index)
+            rendered_operations.append(rendered)
+        return rendered_operations
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Report whether the spec is loaded, without triggering a load."""
+        catalog = self._catalog if self._ready else None
+        return {
+            "ready": self._ready,
+            "source": "artifact" if self._artifact else "spec",
+            "reloads": self._reloads,
+            # Namespaces of the merged documents of a federated spec
+            "documents": [namespace for namespace, _ in self.loader.documents] if hasattr(self.loader, 'documents') else None,
+            # Duplicate strings and subtrees dropped while materializing the spec
+            "spec_memory": self.loader.memory_stats or None,
+            "watching": self.loader.path if self.watcher else None,
+            "operations": len(catalog.operations) if catalog else 0,
+            "schemas": len(catalog.schemas) if catalog else 0,
+            "render_cache": self.render_cache.snapshot(),
+            "prefetch": self.prefetcher.snapshot() if self.prefetcher else None,
+            "search_cache": self.search_cache.snapshot(),
+            "hot_set": {**self.hot_set.snapshot(), "warmed": dict(self._warmed)} if self.hot_set else None,
+        }
+    
+    def close(self) -> None:
+        """Release the artifact mapping, search index connections, prefetch and watcher threads, and save the hot set."""
+        if self.watcher:
+            self.watcher.stop()
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+        if self.hot_set:
+            self.hot_set.save()
+        with self._init_lock:
+            self._ready = False
+            if self._artifact:
+                self._artifact.close()
+                self._artifact = None
+            if self.index_engine and hasattr(self.index_engine, 'close'):
+                self.index_engine.close()
@@ -0,0 +1,140 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+import logging
+
+from .artifact import ARTIFACT_FORMAT_VERSION, compile_spec_artifact
+from .federation import create_spec_loader
+from .watcher import file_stamp
+from ..utils.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'current.json'
+LOCK_NAME = 'lock'
+ARTIFACT_PATTERN = 'spec-*.idx'
+
+
+class SharedSpecCache:
+    """
+    Compiled spec artifacts shared by all server processes of a user.
+
+    Each spec URL gets a directory holding compiled artifacts named by spec
+    hash, a manifest pointing at the current one and a lock file. The first
+    process that finds the manifest missing or older than the TTL fetches
+    and compiles the spec while holding the lock; processes starting at the
+    same time wait on the lock and then memory-map the fresh artifact.
+    Artifacts of superseded spec versions are removed after each compile.
+    """
+
+    def __init__(self, cache_dir: str, url: str, spec_id: str, ttl: int, lock_timeout: float = 300):
+        self.url = url
+        self.spec_id = spec_id
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        url_key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+        self.directory = os.path.join(os.path.expanduser(cache_dir), url_key)
+        # Local spec files are recompiled whenever they change, regardless of the TTL
+        self._source_path = create_spec_loader(url).path
+        self._manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        self._lock = FileLock(os.path.join(self.directory, LOCK_NAME), lock_timeout)
+
+    def get_artifact_path(self, force_refresh: bool = False) -> Optional[str]:
+        """
+        Get the path of a fresh compiled artifact, compiling it if needed.
+
+        Args:
+            force_refresh: Refetch the spec even if the cached artifact is fresh
+
+        Returns:
+            str: Artifact path, or None if the lock could not be acquired in time
+        """
+        seen = self._read_manifest()
+        if not force_refresh:
+            path = self._fresh_artifact(seen)
+            if path:
+                logger.info(f"Using shared spec cache {path}")
+                return path
+
+        if not self._lock.acquire():
+            logger.warning(f"Timed out waiting for shared spec cache lock in {self.directory}")
+            return None
+        try:
+            # Another process may have compiled the spec while this one waited for the lock
+            manifest = self._read_manifest()
+            compiled_meanwhile = manifest is not None and (
+                seen is None or manifest.get('fetched_at') != seen.get('fetched_at')
+            )
+            if manifest and (compiled_meanwhile or not force_refresh):
+                path = self._fresh_artifact(manifest)
+                if path:
+                    logger.info(f"Using shared spec cache {path} compiled by another process")
+                    return path
+            return self._compile()
+        finally:
+            self._lock.release()
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _fresh_artifact(self, manifest: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not manifest or time.time() - manifest.get('fetched_at', 0) > self.ttl:
+            return None
+        if manifest.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            # Compiled by a version of the server with another artifact format
+            return None
+        if self._source_path and manifest.get('source_stamp') != list(file_stamp(self._source_path) or []):
+            return None
+        path = os.path.join(self.directory, manifest.get('artifact', ''))
+        return path if os.path.isfile(path) else None
+
+    def _compile(self) -> str:
+        tmp_path = os.path.join(self.directory, f'compiling-{os.getpid()}.tmp')
+        # Taken before reading, so a change during the compile leaves the artifact stale
+        source_stamp = file_stamp(self._source_path) if self._source_path else None
+        metadata = compile_spec_artifact(create_spec_loader(self.url), tmp_path, self.spec_id)
+        artifact_name = f"spec-{metadata['spec_hash'][:16]}-v{ARTIFACT_FORMAT_VERSION}.idx"
+        artifact_path = os.path.join(self.directory, artifact_name)
+        if os.path.exists(artifact_path):
+            # Unchanged spec; keep the file other processes may have mapped
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, artifact_path)
+
+        manifest = {
+            'artifact': artifact_name,
+            'spec_hash': metadata['spec_hash'],
+            'spec_version': metadata['spec_version'],
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'source_url': self.url,
+            'source_stamp': list(source_stamp) if source_stamp else None,
+            'fetched_at': time.time(),
+        }
+        fd, manifest_tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(manifest_tmp, self._manifest_path)
+        logger.info(f"Compiled shared spec cache {artifact_path} (spec version {metadata['spec_version']})")
+
+        self._remove_stale(artifact_name)
+        return artifact_path
+
+    def _remove_stale(self, current: str) -> None:
+        """Remove artifacts of other spec versions (processes that mapped them keep their view)."""
+        for path in glob.glob(os.path.join(self.directory, ARTIFACT_PATTERN)):
+            if os.path.basename(path) == current:
+                continue
+            try:
+                os.remove(path)
+                logger.info(f"Removed stale shared spec cache {path}")
+            except OSError as e:
+                # Windows refuses to delete mapped files; a later compile retries
+                logger.debug(f"Could not remove stale artifact {path}: {e}")
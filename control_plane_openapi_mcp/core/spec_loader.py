@@ -1,25 +1,288 @@
+import json
+import mmap
+import os
+import sys
 import requests
-import jsonref
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, IO, Optional, Set
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 import logging
 
+from ..utils.compression import REQUESTS_ACCEPT_ENCODING
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Callback invoked with (name, raw value) as each path item or component schema is parsed
+SectionCallback = Callable[[str, Dict[str, Any]], None]
+
+# Strings up to this length are interned with sys.intern; longer ones are only deduplicated within the spec
+INTERN_MAX_LENGTH = 64
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def local_spec_path(source: str) -> Optional[str]:
+    """Filesystem path of a file:// URL or plain path, or None for HTTP(S) sources."""
+    if source.startswith('file://'):
+        return url2pathname(urlparse(source).path)
+    if '://' in source:
+        return None
+    return os.path.abspath(os.path.expanduser(source))
+
+
+def unescape_pointer_token(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def escape_pointer_token(token: str) -> str:
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def parse_spec_stream(
+    stream: IO[bytes],
+    on_path_item: Optional[SectionCallback] = None,
+    on_schema: Optional[SectionCallback] = None
+) -> Dict[str, Any]:
+    """
+    Parse an OpenAPI document from a byte stream.
+
+    With ijson installed the document is parsed incrementally, so the raw
+    response body and its decoded text are never held in memory alongside
+    the parsed objects, and the callbacks fire as soon as each path item or
+    component schema has been read. Without ijson the stream is parsed in
+    one go and the callbacks fire afterwards.
+
+    Args:
+        stream: Binary file-like object with the JSON document
+        on_path_item: Called with (path, path item) for every entry of 'paths'
+        on_schema: Called with (name, schema) for every entry of 'components.schemas'
+
+    Returns:
+        The parsed (raw, non-dereferenced) specification
+    """
+    if ijson is None:
+        spec = json.load(stream)
+        for path, path_item in spec.get('paths', {}).items():
+            if on_path_item and isinstance(path_item, dict):
+                on_path_item(path, path_item)
+        for name, schema in spec.get('components', {}).get('schemas', {}).items():
+            if on_schema and isinstance(schema, dict):
+                on_schema(name, schema)
+        return spec
+
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    keys = [None, None, None]
+    for _, event, value in ijson.parse(stream, use_float=True):
+        if event == 'map_key':
+            # The json module shares repeated keys by itself; ijson creates a string per occurrence
+            value = sys.intern(value)
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if event != 'end_map':
+                continue
+            if depth == 2 and keys[0] == 'paths' and on_path_item:
+                on_path_item(keys[1], builder.value['paths'][keys[1]])
+            elif depth == 3 and keys[0] == 'components' and keys[1] == 'schemas' and on_schema:
+                on_schema(keys[2], builder.value['components']['schemas'][keys[2]])
+        elif event == 'map_key' and depth <= 3:
+            keys[depth - 1] = value
+    return builder.value
+
+
+def intern_spec(spec: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Deduplicate the strings and scalar-only subtrees of a parsed spec in place.
+
+    Short strings (types, formats, media types, names) are interned with
+    sys.intern, longer ones such as repeated descriptions are shared within
+    the spec, and identical dicts and lists holding only scalars (e.g.
+    {"type": "string", "format": "date-time"}) are replaced by one shared
+    instance. The spec must be treated as read-only afterwards.
+
+    Returns:
+        dict with the number of duplicate 'strings' and 'subtrees' dropped and
+        the approximate 'bytes_saved'
+    """
+    strings: Dict[str, str] = {}
+    leaves: Dict[Any, Any] = {}
+    stats = {'strings': 0, 'subtrees': 0, 'bytes_saved': 0}
+
+    def canonical(value: Any) -> Any:
+        if isinstance(value, str):
+            shared = strings.get(value)
+            if shared is None:
+                shared = sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+                strings[shared] = shared
+            if shared is not value:
+                stats['strings'] += 1
+                stats['bytes_saved'] += sys.getsizeof(value)
+            return shared
+        if isinstance(value, dict):
+            is_leaf = True
+            for key, item in value.items():
+                shared = canonical(item)
+                if shared is not item:
+                    value[key] = shared
+                is_leaf = is_leaf and isinstance(shared, _SCALARS)
+            if not is_leaf:
+                return value
+            # Types are part of the key so that 1, 1.0 and True stay distinct
+            leaf_key = ('d',) + tuple((key, type(item), item) for key, item in value.items())
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                value[i] = canonical(item)
+            if not all(isinstance(item, _SCALARS) for item in value):
+                return value
+            leaf_key = ('l',) + tuple((type(item), item) for item in value)
+        else:
+            return value
+        shared = leaves.setdefault(leaf_key, value)
+        if shared is not value:
+            stats['subtrees'] += 1
+            stats['bytes_saved'] += sys.getsizeof(value)
+        return shared
+
+    canonical(spec)
+    return stats
+
+
+def dereference_spec(spec: Dict[str, Any], stats: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Resolve local $ref pointers into plain Python objects.
+
+    Every referenced target is materialized once and shared by all of its
+    references, and subtrees without references are shared with the raw
+    spec instead of copied, so the result costs little more memory than the
+    raw spec. References that would recurse into a target still being
+    resolved are left as {"$ref": ...} so the result stays acyclic and
+    JSON-serializable.
+
+    Args:
+        stats: If given, 'shared_subtrees' and 'bytes_saved' are added for
+            the containers shared with the raw spec
+    """
+    resolved: Dict[str, Any] = {}
+    shared = {'shared_subtrees': 0, 'bytes_saved': 0}
+    in_progress: Set[str] = set()
+
+    def lookup(ref: str) -> Any:
+        node: Any = spec
+        for token in ref[2:].split('/'):
+            token = unescape_pointer_token(token)
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        return node
+
+    def resolve(ref: str) -> Any:
+        if ref in resolved:
+            return resolved[ref]
+        if ref in in_progress:
+            return {'$ref': ref}
+        in_progress.add(ref)
+        try:
+            value = visit(lookup(ref))
+        except (KeyError, IndexError, ValueError):
+            logger.warning(f"Unresolvable reference {ref}")
+            value = {'$ref': ref}
+        in_progress.discard(ref)
+        resolved[ref] = value
+        return value
+
+    def visit(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                return resolve(ref)
+            copy = None
+            for i, (key, value) in enumerate(node.items()):
+                result = visit(value)
+                if copy is None and result is not value:
+                    # First resolved reference below this node; copy what came before it
+                    copy = dict(list(node.items())[:i])
+                if copy is not None:
+                    copy[key] = result
+        elif isinstance(node, list):
+            copy = None
+            for i, item in enumerate(node):
+                result = visit(item)
+                if copy is None and result is not item:
+                    copy = node[:i]
+                if copy is not None:
+                    copy.append(result)
+        else:
+            return node
+        if copy is not None:
+            return copy
+        shared['shared_subtrees'] += 1
+        shared['bytes_saved'] += sys.getsizeof(node)
+        return node
+
+    # Resolve components first so the entries under components and the targets
+    # of references to them are the same objects
+    components = {}
+    for kind, definitions in spec.get('components', {}).items():
+        if isinstance(definitions, dict):
+            components[kind] = {
+                name: resolve(f"#/components/{kind}/{escape_pointer_token(name)}")
+                for name in definitions
+            }
+        else:
+            components[kind] = visit(definitions)
+
+    processed = {key: visit(value) for key, value in spec.items() if key != 'components'}
+    if 'components' in spec:
+        processed['components'] = components
+    if stats is not None:
+        for key, value in shared.items():
+            stats[key] = stats.get(key, 0) + value
+    return processed
+
 
 class SpecLoader:
-    """Loads and processes OpenAPI specifications from URL."""
+    """Loads and processes OpenAPI specifications from a URL or local file."""
     
     def __init__(self, url: str):
         self.url = url
+        # Set for file:// URLs and plain paths
+        self.path = local_spec_path(url)
+        # Duplicates dropped while materializing the last spec
+        self.memory_stats: Dict[str, int] = {}
         self._raw_spec: Optional[Dict[str, Any]] = None
         self._processed_spec: Optional[Dict[str, Any]] = None
     
-    def fetch_spec(self) -> Dict[str, Any]:
-        """Fetch OpenAPI specification from URL."""
+    def fetch_spec(
+        self,
+        on_path_item: Optional[SectionCallback] = None,
+        on_schema: Optional[SectionCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch OpenAPI specification from URL.
+        
+        The response body is parsed as it streams in; see parse_spec_stream
+        for the callbacks.
+        """
+        if self.path:
+            return self._read_file(on_path_item, on_schema)
         try:
-            response = requests.get(self.url, timeout=30)
-            response.raise_for_status()
-            self._raw_spec = response.json()
+            with requests.get(
+                self.url,
+                timeout=30,
+                stream=True,
+                headers={'Accept': 'application/json', 'Accept-Encoding': REQUESTS_ACCEPT_ENCODING}
+            ) as response:
+                response.raise_for_status()
+                logger.debug(f"Spec response Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+                # Let urllib3 undo any Content-Encoding while streaming
+                response.raw.decode_content = True
+                self._raw_spec = parse_spec_stream(response.raw, on_path_item, on_schema)
             logger.info(f"Successfully fetched OpenAPI spec from {self.url}")
             return self._raw_spec
         except requests.RequestException as e:
@@ -29,47 +292,69 @@ class SpecLoader:
             logger.error(f"Failed to parse JSON from {self.url}: {e}")
             raise
     
+    def _read_file(
+        self,
+        on_path_item: Optional[SectionCallback],
+        on_schema: Optional[SectionCallback]
+    ) -> Dict[str, Any]:
+        """Parse a local spec file through a read-only memory map."""
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise ValueError("Spec file is empty")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    self._raw_spec = parse_spec_stream(mapped, on_path_item, on_schema)
+            logger.info(f"Successfully read OpenAPI spec from {self.path}")
+            return self._raw_spec
+        except OSError as e:
+            logger.error(f"Failed to read OpenAPI spec from {self.path}: {e}")
+            raise
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON from {self.path}: {e}")
+            raise
+    
     def process_spec(self) -> Dict[str, Any]:
         """Process the spec by dereferencing $ref pointers."""
         if not self._raw_spec:
             raise ValueError("No spec loaded. Call fetch_spec() first.")
         
         try:
-            # Dereference all $ref pointers
-            self._processed_spec = jsonref.loads(
-                jsonref.dumps(self._raw_spec)
+            self.memory_stats = intern_spec(self._raw_spec)
+            self._processed_spec = dereference_spec(self._raw_spec, self.memory_stats)
+            logger.info(
+                f"Successfully processed OpenAPI spec (shared {self.memory_stats['strings']} strings, "
+                f"{self.memory_stats['subtrees'] + self.memory_stats['shared_subtrees']} subtrees, "
+                f"~{self.memory_stats['bytes_saved'] // 1024} KiB saved)"
             )
-            
-            # Convert any remaining JsonRef objects to plain dict/list
-            self._processed_spec = self._deep_jsonref_to_dict(self._processed_spec)
-            
-            logger.info("Successfully processed OpenAPI spec")
             return self._processed_spec
         except Exception as e:
             logger.error(f"Failed to process OpenAPI spec: {e}")
             raise
     
-    def _deep_jsonref_to_dict(self, obj):
-        """Recursively convert JsonRef objects to plain Python objects."""
-        if isinstance(obj, jsonref.JsonRef):
-            # Force resolution and convert to dict
-            return self._deep_jsonref_to_dict(dict(obj))
-        elif isinstance(obj, dict):
-            return {k: self._deep_jsonref_to_dict(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_jsonref_to_dict(item) for item in obj]
-        else:
-            return obj
+    def get_raw_spec(self) -> Dict[str, Any]:
+        """Get the raw specification with its $ref pointers intact."""
+        if not self._raw_spec:
+            self.fetch_spec()
+        return self._raw_spec
     
-    def get_processed_spec(self) -> Dict[str, Any]:
-        """Get the processed specification."""
+    def get_processed_spec(
+        self,
+        on_path_item: Optional[SectionCallback] = None,
+        on_schema: Optional[SectionCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the processed specification.
+        
+        The callbacks are passed to fetch_spec when the spec still has to be fetched.
+        """
         if not self._processed_spec:
-            self.fetch_spec()
+            if not self._raw_spec:
+                self.fetch_spec(on_path_item, on_schema)
             self.process_spec()
         return self._processed_spec
     
     def refresh(self) -> Dict[str, Any]:
-        """Refresh the specification from the URL."""
+        """Refresh the specification from its source."""
         self._raw_spec = None
         self._processed_spec = None
         return self.get_processed_spec()
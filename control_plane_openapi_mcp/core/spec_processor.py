@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from .models import SpecCatalogEntry, SpecOperationEntry, SpecSchemaEntry
 import logging
 
@@ -30,31 +30,40 @@ class SpecProcessor:
         paths = spec.get('paths', {})
         
         for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
-                continue
-                
-            for method, operation in path_item.items():
-                if method in ['parameters', '$ref'] or not isinstance(operation, dict):
-                    continue
-                
-                # Skip deprecated operations
-                if operation.get('deprecated', False):
-                    deprecated_count += 1
-                    logger.debug(f"Skipping deprecated operation: {method.upper()} {path} ({operation.get('operationId', 'no-id')})")
-                    continue
-                
-                operations.append(SpecOperationEntry(
-                    path=path,
-                    method=method.upper(),
-                    description=operation.get('description', ''),
-                    operation_id=operation.get('operationId'),
-                    summary=operation.get('summary', ''),
-                    tags=operation.get('tags', [])
-                ))
+            entries, deprecated = self.operations_from_path_item(path, path_item)
+            operations.extend(entries)
+            deprecated_count += deprecated
         
         logger.info(f"Extracted {len(operations)} operations ({deprecated_count} deprecated operations excluded)")
         return operations
     
+    def operations_from_path_item(self, path: str, path_item: Any) -> Tuple[List[SpecOperationEntry], int]:
+        """Extract the non-deprecated operations of a single path item, plus the deprecated count."""
+        operations = []
+        deprecated_count = 0
+        if not isinstance(path_item, dict):
+            return operations, deprecated_count
+            
+        for method, operation in path_item.items():
+            if method in ['parameters', '$ref'] or not isinstance(operation, dict):
+                continue
+            
+            # Skip deprecated operations
+            if operation.get('deprecated', False):
+                deprecated_count += 1
+                logger.debug(f"Skipping deprecated operation: {method.upper()} {path} ({operation.get('operationId', 'no-id')})")
+                continue
+            
+            operations.append(SpecOperationEntry(
+                path=path,
+                method=method.upper(),
+                description=operation.get('description', ''),
+                operation_id=operation.get('operationId'),
+                summary=operation.get('summary', ''),
+                tags=operation.get('tags', [])
+            ))
+        return operations, deprecated_count
+    
     def _extract_schemas(self, spec: Dict[str, Any]) -> List[SpecSchemaEntry]:
         """Extract schemas from the OpenAPI spec."""
         schemas = []
@@ -62,15 +71,22 @@ class SpecProcessor:
         schema_definitions = components.get('schemas', {})
         
         for name, schema in schema_definitions.items():
-            if isinstance(schema, dict):
-                schemas.append(SpecSchemaEntry(
-                    name=name,
-                    description=schema.get('description', '')
-                ))
+            entry = self.schema_entry(name, schema)
+            if entry:
+                schemas.append(entry)
         
         logger.info(f"Extracted {len(schemas)} schemas")
         return schemas
     
+    def schema_entry(self, name: str, schema: Any) -> Optional[SpecSchemaEntry]:
+        """Build the catalog entry of a single component schema."""
+        if not isinstance(schema, dict):
+            return None
+        return SpecSchemaEntry(
+            name=name,
+            description=schema.get('description', '')
+        )
+    
     def find_operation_by_id(self, spec: Dict[str, Any], operation_id: str) -> Optional[Dict[str, Any]]:
         """Find an operation by its operationId, excluding deprecated operations."""
         paths = spec.get('paths', {})
@@ -127,3 +143,45 @@ class SpecProcessor:
         if schema and isinstance(schema, dict):
             return schema
         return None
+
+
+class CatalogBuilder:
+    """
+    Builds a catalog incrementally while the spec is still being parsed.
+    
+    Pass add_path_item and add_schema as the SpecLoader section callbacks so
+    catalog entries are extracted from each section as soon as it is read.
+    """
+    
+    def __init__(self, processor: SpecProcessor):
+        self.processor = processor
+        self._operations: List[SpecOperationEntry] = []
+        self._schemas: List[SpecSchemaEntry] = []
+        self._deprecated_count = 0
+    
+    def add_path_item(self, path: str, path_item: Dict[str, Any]) -> None:
+        operations, deprecated = self.processor.operations_from_path_item(path, path_item)
+        self._operations.extend(operations)
+        self._deprecated_count += deprecated
+    
+    def add_schema(self, name: str, schema: Dict[str, Any]) -> None:
+        entry = self.processor.schema_entry(name, schema)
+        if entry:
+            self._schemas.append(entry)
+    
+    @property
+    def is_empty(self) -> bool:
+        return not self._operations and not self._schemas
+    
+    def build(self, description: str = '') -> SpecCatalogEntry:
+        """Build the catalog entry from everything added so far."""
+        logger.info(
+            f"Extracted {len(self._operations)} operations ({self._deprecated_count} deprecated operations excluded) "
+            f"and {len(self._schemas)} schemas while streaming"
+        )
+        return SpecCatalogEntry(
+            spec_id=self.processor.spec_id,
+            description=description,
+            operations=list(self._operations),
+            schemas=list(self._schemas)
+        )
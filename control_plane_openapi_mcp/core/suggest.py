@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from Levenshtein import distance
+
+logger = logging.getLogger(__name__)
+
+# Default edit distance within which near-misses are suggested
+DEFAULT_MAX_DISTANCE = 2
+
+
+class _BKNode:
+    """A BK-tree node; children are keyed by their edit distance to this node."""
+
+    __slots__ = ('key', 'values', 'children')
+
+    def __init__(self, key: str, value: str):
+        self.key = key
+        # Original spellings folding to this key
+        self.values: List[str] = [value]
+        self.children: Dict[int, '_BKNode'] = {}
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over identifiers for typo-tolerant lookups.
+
+    Identifiers are compared case-insensitively by Levenshtein distance. The
+    triangle inequality lets a search for words within distance k descend
+    only into children whose edge distance lies within k of the query's
+    distance to the node, so a lookup visits a small part of the tree.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self._root: Optional[_BKNode] = None
+        self._size = 0
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: str) -> None:
+        if not value:
+            return
+        key = value.casefold()
+        if self._root is None:
+            self._root = _BKNode(key, value)
+            self._size += 1
+            return
+
+        node = self._root
+        while True:
+            edge = distance(key, node.key)
+            if edge == 0:
+                if value not in node.values:
+                    node.values.append(value)
+                return
+            child = node.children.get(edge)
+            if child is None:
+                node.children[edge] = _BKNode(key, value)
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int = DEFAULT_MAX_DISTANCE, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Find the identifiers closest to a word.
+
+        Returns:
+            Up to limit (identifier, distance) pairs within max_distance, closest first
+        """
+        if self._root is None:
+            return []
+
+        key = word.casefold()
+        matches: List[Tuple[int, str]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            node_distance = distance(key, node.key)
+            if node_distance <= max_distance:
+                matches.extend((node_distance, value) for value in node.values)
+            low, high = node_distance - max_distance, node_distance + max_distance
+            stack.extend(child for edge, child in node.children.items() if low <= edge <= high)
+
+        matches.sort()
+        return [(value, node_distance) for node_distance, value in matches[:limit]]
@@ -0,0 +1,310 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+from .models import SpecCatalogEntry, SpecOperationEntry, SpecSchemaEntry
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Common words in natural-language questions that carry no relevance signal
+STOP_WORDS = frozenset({
+    'a', 'all', 'an', 'and', 'any', 'are', 'by', 'can', 'do', 'does', 'for', 'from',
+    'get', 'how', 'i', 'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or', 'show', 'the',
+    'to', 'what', 'which', 'with',
+})
+
+# Relative weight of each field's terms in an operation document
+OPERATION_FIELD_WEIGHTS = (
+    ('operation_id', 2.0),
+    ('summary', 2.0),
+    ('tags', 1.0),
+    ('path', 1.0),
+    ('description', 1.0),
+)
+SCHEMA_FIELD_WEIGHTS = (
+    ('name', 2.0),
+    ('description', 1.0),
+)
+
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words, breaking camelCase identifiers apart."""
+    return [
+        word for word in _WORD.findall(_CAMEL_BOUNDARY.sub(' ', text).lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def extract_features(text: str, weight: float = 1.0, counts: Optional[Counter] = None) -> Counter:
+    """Accumulate weighted word and character trigram features for text."""
+    counts = counts if counts is not None else Counter()
+    for word in tokenize(text):
+        counts['w:' + word] += weight
+        padded = f' {word} '
+        for i in range(len(padded) - 2):
+            # Character trigrams carry less weight than whole words
+            counts['c:' + padded[i:i + 3]] += weight * 0.25
+    return counts
+
+
+class TfidfMatrix:
+    """Sparse (CSR-style) L2-normalized TF-IDF matrix over a set of documents."""
+
+    def __init__(self, documents: Sequence[Counter]):
+        document_frequency: Counter = Counter()
+        for features in documents:
+            document_frequency.update(features.keys())
+
+        self.vocabulary: Dict[str, int] = {
+            feature: column for column, feature in enumerate(sorted(document_frequency))
+        }
+        n_documents = len(documents)
+        self.idf = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for feature, column in self.vocabulary.items():
+            self.idf[column] = math.log((1 + n_documents) / (1 + document_frequency[feature])) + 1.0
+
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+        for row, features in enumerate(documents):
+            weights = [
+                (self.vocabulary[feature], (1.0 + math.log(tf)) if tf >= 1 else tf)
+                for feature, tf in features.items()
+            ]
+            for column, tf in weights:
+                rows.append(row)
+                columns.append(column)
+                values.append(tf * float(self.idf[column]))
+
+        self.n_documents = n_documents
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.columns = np.asarray(columns, dtype=np.int32)
+        self.values = np.asarray(values, dtype=np.float32)
+
+        # L2-normalize each document row
+        norms = np.sqrt(np.bincount(self.rows, weights=self.values ** 2, minlength=n_documents))
+        norms[norms == 0] = 1.0
+        self.values = (self.values / norms[self.rows]).astype(np.float32)
+
+        # Entries are stored row by row; row r owns entries row_start[r]:row_start[r + 1]
+        self.row_start = np.zeros(n_documents + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=n_documents), out=self.row_start[1:])
+
+    def vectorize(self, features: Counter) -> Optional['np.ndarray']:
+        """Turn query features into a dense, L2-normalized TF-IDF vector."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for feature, tf in features.items():
+            column = self.vocabulary.get(feature)
+            if column is not None:
+                vector[column] = ((1.0 + math.log(tf)) if tf >= 1 else tf) * self.idf[column]
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def entries_of(self, rows: Optional['np.ndarray']) -> Optional['np.ndarray']:
+        """Indexes of the stored entries of the given document rows (None for all rows)."""
+        if rows is None:
+            return None
+        starts = self.row_start[rows]
+        lengths = self.row_start[rows + 1] - starts
+        # Each row's entries are a contiguous run; lay the runs out back to back
+        run_offsets = np.cumsum(lengths) - lengths
+        return np.repeat(starts - run_offsets, lengths) + np.arange(int(lengths.sum()))
+
+    def score(self, vector: 'np.ndarray', rows: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """
+        Cosine similarity of documents with a query vector (sparse-dense product).
+
+        Only the entries of the given rows are multiplied when rows are given;
+        the other documents score 0.
+        """
+        entries = self.entries_of(rows)
+        if entries is None:
+            return np.bincount(
+                self.rows,
+                weights=self.values * vector[self.columns],
+                minlength=self.n_documents
+            )
+        return np.bincount(
+            self.rows[entries],
+            weights=self.values[entries] * vector[self.columns[entries]],
+            minlength=self.n_documents
+        )
+
+    def score_many(self, vectors: 'np.ndarray', rows: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """
+        Cosine similarities of documents with several query vectors at once.
+
+        The document entries (of the given rows, if any) in any query's columns
+        are gathered once and scored against all queries together, giving a
+        query-by-document matrix.
+        """
+        n_queries = vectors.shape[0]
+        touched = np.flatnonzero(vectors.any(axis=0))
+        entries = self.entries_of(rows)
+        if entries is None:
+            entries = np.flatnonzero(np.isin(self.columns, touched))
+        else:
+            entries = entries[np.isin(self.columns[entries], touched)]
+        weights = self.values[entries] * vectors[:, self.columns[entries]]
+        cells = np.arange(n_queries)[:, None] * self.n_documents + self.rows[entries]
+        return np.bincount(
+            cells.ravel(),
+            weights=weights.ravel(),
+            minlength=n_queries * self.n_documents
+        ).reshape(n_queries, self.n_documents)
+
+    def top_k(self, vector: 'np.ndarray', k: int, rows: Optional['np.ndarray'] = None) -> List[Tuple[int, float]]:
+        """Return (row, score) pairs of the k best matching documents (among rows, if given), best first."""
+        return self.rank(self.score(vector, rows), k)
+
+    @staticmethod
+    def rank(scores: 'np.ndarray', k: int) -> List[Tuple[int, float]]:
+        """Return (row, score) pairs of the k best scores, best first."""
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size == 0:
+            return []
+        k = min(k, candidates.size)
+        if k < candidates.size:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(row), float(scores[row])) for row in order]
+
+
+class TfidfSearchEngine:
+    """TF-IDF vector search over operations and schemas for natural-language queries."""
+
+    def __init__(self, spec_id: str):
+        if np is None:
+            raise ImportError("The tfidf search backend requires numpy (pip install 'control-plane-openapi-mcp[vector]')")
+        self.spec_id = spec_id
+        self._operations: List[SpecOperationEntry] = []
+        self._schemas: List[SpecSchemaEntry] = []
+        self._operation_matrix: Optional[TfidfMatrix] = None
+        self._schema_matrix: Optional[TfidfMatrix] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether numpy is installed."""
+        return np is not None
+
+    def index_catalog(self, catalog: SpecCatalogEntry) -> None:
+        """Build the TF-IDF matrices for the catalog."""
+        self._operations = catalog.operations
+        self._schemas = catalog.schemas
+        self._operation_matrix = TfidfMatrix([self._operation_features(op) for op in self._operations])
+        self._schema_matrix = TfidfMatrix([self._schema_features(schema) for schema in self._schemas])
+        logger.info(
+            f"Built TF-IDF index ({len(self._operation_matrix.vocabulary)} operation features, "
+            f"{len(self._schema_matrix.vocabulary)} schema features)"
+        )
+
+    @staticmethod
+    def _operation_features(operation: SpecOperationEntry) -> Counter:
+        fields = {
+            'operation_id': operation.operation_id or '',
+            'summary': operation.summary or '',
+            'tags': ' '.join(operation.tags),
+            'path': operation.path.replace('{', ' ').replace('}', ' '),
+            'description': operation.description or '',
+        }
+        counts: Counter = Counter()
+        for field, weight in OPERATION_FIELD_WEIGHTS:
+            extract_features(fields[field], weight, counts)
+        return counts
+
+    @staticmethod
+    def _schema_features(schema: SpecSchemaEntry) -> Counter:
+        fields = {'name': schema.name, 'description': schema.description or ''}
+        counts: Counter = Counter()
+        for field, weight in SCHEMA_FIELD_WEIGHTS:
+            extract_features(fields[field], weight, counts)
+        return counts
+
+    def search_operations(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        candidates: Optional[Sequence[int]] = None
+    ) -> List[SpecOperationEntry]:
+        """
+        Search operations by TF-IDF cosine similarity.
+
+        Args:
+            candidates: Catalog positions to restrict the search to (all operations if None)
+        """
+        if not query.strip():
+            operations = self._operations if candidates is None else [self._operations[p] for p in candidates]
+            return operations[offset:offset + limit] if limit else operations[offset:]
+
+        vector = self._operation_matrix.vectorize(extract_features(query))
+        if vector is None:
+            return []
+
+        k = offset + limit if limit else len(self._operations)
+        ranked = self._operation_matrix.top_k(vector, k, self._candidate_rows(candidates))
+        result = [self._operations[row] for row, _ in ranked[offset:]]
+        logger.info(f"TF-IDF found {len(result)} operations matching '{query}'")
+        return result
+
+    def search_operations_multi(
+        self,
+        queries: Sequence[str],
+        limit: int,
+        candidates: Optional[Sequence[int]] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Rank operations for several queries with one query-by-document product.
+
+        Returns:
+            Per query, (catalog position, score) pairs of the best matches, best first
+        """
+        vectors = [self._operation_matrix.vectorize(extract_features(query)) for query in queries]
+        matched = [i for i, vector in enumerate(vectors) if vector is not None]
+        ranked: List[List[Tuple[int, float]]] = [[] for _ in queries]
+        if matched:
+            scores = self._operation_matrix.score_many(
+                np.stack([vectors[i] for i in matched]), self._candidate_rows(candidates)
+            )
+            for row, i in enumerate(matched):
+                ranked[i] = self._operation_matrix.rank(scores[row], limit)
+        return ranked
+
+    @staticmethod
+    def _candidate_rows(candidates: Optional[Sequence[int]]) -> Optional['np.ndarray']:
+        """Distinct catalog positions to score, so filtered-out operations are never multiplied."""
+        if candidates is None:
+            return None
+        return np.unique(np.fromiter(candidates, dtype=np.int64))
+
+    def search_schemas(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[SpecSchemaEntry]:
+        """Search schemas by TF-IDF cosine similarity."""
+        if not query.strip():
+            return self._schemas[offset:offset + limit] if limit else self._schemas[offset:]
+
+        vector = self._schema_matrix.vectorize(extract_features(query))
+        if vector is None:
+            return []
+
+        k = offset + limit if limit else len(self._schemas)
+        ranked = self._schema_matrix.top_k(vector, k)
+        result = [self._schemas[row] for row, _ in ranked[offset:]]
+        logger.info(f"TF-IDF found {len(result)} schemas matching '{query}'")
+        return result
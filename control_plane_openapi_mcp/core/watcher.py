@@ -0,0 +1,67 @@
+import os
+import threading
+from typing import Callable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (modification time in ns, size) of a file
+FileStamp = Tuple[int, int]
+
+
+def file_stamp(path: str) -> Optional[FileStamp]:
+    """Modification time and size of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SpecWatcher:
+    """
+    Watches a local spec file for changes by polling its modification time and size.
+
+    A change is reported only once the file has stayed the same for one
+    polling interval, so a spec that is still being written is not loaded
+    half-way. The callback runs on the watcher thread.
+    """
+
+    def __init__(self, path: str, on_change: Callable[[], None], interval: float):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self.changes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching, unless already started; changes are relative to the file as it is now."""
+        if self._thread:
+            return
+        baseline = file_stamp(self.path)
+        self._thread = threading.Thread(target=self._run, args=(baseline,), name='spec-watcher', daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.path} for changes every {self.interval}s")
+
+    def _run(self, last: Optional[FileStamp]) -> None:
+        pending: Optional[FileStamp] = None
+        while not self._stop.wait(self.interval):
+            stamp = file_stamp(self.path)
+            if stamp == last or stamp is None:
+                pending = None
+                continue
+            if stamp != pending:
+                # Still being written; wait for it to settle
+                pending = stamp
+                continue
+            last, pending = stamp, None
+            self.changes += 1
+            logger.info(f"Spec file {self.path} changed, reloading")
+            try:
+                self.on_change()
+            except Exception as e:
+                logger.warning(f"Failed to reload changed spec file {self.path}: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
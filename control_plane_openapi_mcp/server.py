@@ -1,6 +1,17 @@
+import argparse
+import asyncio
 import logging
-from .config import mcp
+import signal
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from .config import (
+    mcp, OPENAPI_URL, SPEC_ID, SPEC_ARTIFACT_PATH,
+    MCP_TRANSPORT, MCP_HOST, MCP_PORT, MCP_SHUTDOWN_TIMEOUT
+)
+from .core.artifact import compile_spec_artifact
+from .core.federation import create_spec_loader
 from .tools import *  # Import all tools to register them
+from .tools import openapi_service, run_blocking, session_client_count, shutdown
 from .prompts import *  # Import all prompts to register them
 
 # Setup logging
@@ -12,11 +23,116 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def compile_spec(url: str, output: str) -> None:
+    """Fetch the OpenAPI spec and compile it into a memory-mappable index artifact."""
+    metadata = compile_spec_artifact(create_spec_loader(url), output, SPEC_ID)
+    logger.info(f"Wrote spec artifact {output} (spec hash {metadata['spec_hash'][:12]})")
+
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> JSONResponse:
+    """Liveness probe for the HTTP transports."""
+    return JSONResponse({
+        "status": "ok",
+        "spec": openapi_service.get_status(),
+        "session_clients": session_client_count(),
+    })
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready(request: Request) -> JSONResponse:
+    """Readiness probe: 503 until the shared spec state has been loaded."""
+    status = openapi_service.get_status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+async def _warm_up() -> None:
+    try:
+        await run_blocking(openapi_service.initialize)
+        logger.info("Shared spec state loaded")
+    except Exception as e:
+        # Tools retry the load on first use
+        logger.error(f"Failed to preload the OpenAPI spec: {e}")
+
+
+async def serve_http(transport: str, host: str, port: int) -> None:
+    """
+    Serve many clients from one process over streamable HTTP or SSE.
+
+    The spec, catalog, search index and caches are loaded once and shared by
+    all sessions; credentials for call_control_plane_api come with each
+    session's requests. On SIGINT/SIGTERM in-flight requests get
+    MCP_SHUTDOWN_TIMEOUT seconds to finish before resources are released.
+    """
+    import uvicorn
+
+    app = mcp.streamable_http_app() if transport == "streamable-http" else mcp.sse_app()
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        timeout_graceful_shutdown=MCP_SHUTDOWN_TIMEOUT,
+    )
+    server = uvicorn.Server(config)
+
+    def request_exit(signum, frame):
+        server.should_exit = True
+
+    # uvicorn re-raises the stop signal once it has drained; handle it here so
+    # shutdown completes instead of surfacing as KeyboardInterrupt
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, request_exit)
+    warm_up = asyncio.create_task(_warm_up())
+    try:
+        logger.info(f"Serving MCP over {transport} on http://{host}:{port}")
+        await server.serve()
+    finally:
+        warm_up.cancel()
+        await shutdown()
+        logger.info("MCP server stopped")
+
+
 def main():
     """Main entry point for the MCP server."""
+    parser = argparse.ArgumentParser(prog="control-plane-openapi-mcp")
+    subparsers = parser.add_subparsers(dest="command")
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="Compile the OpenAPI spec into a precompiled index artifact"
+    )
+    compile_parser.add_argument(
+        "--output", "-o",
+        default=SPEC_ARTIFACT_PATH or "control-plane-spec.idx",
+        help="Artifact output path (default: $SPEC_ARTIFACT_PATH or ./control-plane-spec.idx)"
+    )
+    compile_parser.add_argument(
+        "--url",
+        default=OPENAPI_URL,
+        help="OpenAPI spec URL, file:// URL or local path (default: $OPENAPI_SPEC_SOURCE or derived from CONTROL_PLANE_URL)"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http", "sse"],
+        default=MCP_TRANSPORT,
+        help="MCP transport (default: $MCP_TRANSPORT or stdio)"
+    )
+    parser.add_argument("--host", default=MCP_HOST, help="HTTP bind address (default: $MCP_HOST or 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=MCP_PORT, help="HTTP port (default: $MCP_PORT or 8000)")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        compile_spec(args.url, args.output)
+        return
+
     try:
         logger.info("Starting Control Plane OpenAPI MCP server...")
-        mcp.run(transport='stdio')
+        if args.transport == "stdio":
+            mcp.run(transport='stdio')
+        else:
+            mcp.settings.host = args.host
+            mcp.settings.port = args.port
+            asyncio.run(serve_http(args.transport, args.host, args.port))
     except Exception as e:
         logger.error(f"Failed to start MCP server: {e}")
         raise
@@ -1,20 +1,76 @@
+import asyncio
+import base64
+import functools
+import hashlib
 import json
 import logging
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from .config import mcp, OPENAPI_URL, CACHE_TTL, SPEC_ID
+from mcp.server.fastmcp import Context
+
+from .config import (
+    mcp, CONTROL_PLANE_URL, OPENAPI_URL, CACHE_TTL, SPEC_ID, SPEC_ARTIFACT_PATH, SHARED_SPEC_CACHE_DIR,
+    SEARCH_BACKEND, SEARCH_DB_PATH, SCHEMA_MAX_DEPTH, SCHEMA_MAX_BYTES, SCHEMA_RENDER_CACHE_BYTES,
+    SCHEMA_PREFETCH_WORKERS, HOT_SET_PATH, HOT_SET_WARM_ENTRIES, SPEC_WATCH_INTERVAL, OUTPUT_TOKEN_BUDGET, TOOL_WORKERS,
+    API_RATE_LIMIT, API_RATE_BURST, API_MAX_RETRIES, API_REQUEST_DEADLINE, API_MAX_CONCURRENCY,
+    API_BREAKER_ERROR_RATE, API_BREAKER_COOLDOWN, AUTO_PAGINATE_MAX_ITEMS, AUTO_PAGINATE_CONCURRENCY,
+    MCP_HTTP_SHARED_CREDENTIALS
+)
+from .core.pagination import PageFetchError, collect_pages
 from .core.service import OpenAPIService
-from .utils.client import api_client
-from .utils.schema_extractor import create_safe_operation_output
+from .utils.client import ApiClient, api_client
+from .utils.output import OutputShaper
+from .utils.schema_extractor import referenced_schema_names
+from .utils.resilience import ApiUnavailableError, ResiliencePolicy
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize the OpenAPI service
-openapi_service = OpenAPIService(OPENAPI_URL, SPEC_ID, CACHE_TTL)
+openapi_service = OpenAPIService(
+    OPENAPI_URL,
+    SPEC_ID,
+    CACHE_TTL,
+    artifact_path=SPEC_ARTIFACT_PATH or None,
+    search_backend=SEARCH_BACKEND,
+    search_db_path=SEARCH_DB_PATH,
+    shared_cache_dir=SHARED_SPEC_CACHE_DIR or None,
+    render_cache_bytes=SCHEMA_RENDER_CACHE_BYTES,
+    prefetch_workers=SCHEMA_PREFETCH_WORKERS,
+    schema_max_depth=SCHEMA_MAX_DEPTH,
+    schema_max_bytes=SCHEMA_MAX_BYTES,
+    hot_set_path=HOT_SET_PATH or None,
+    warm_entries=HOT_SET_WARM_ENTRIES,
+    watch_interval=SPEC_WATCH_INTERVAL
+)
+
+# Shared output pipeline keeping tool responses within a token budget
+output_shaper = OutputShaper(OUTPUT_TOKEN_BUDGET)
+
+# Bounded pool for blocking work (spec loading, index builds, searching and rendering),
+# so the event loop stays free to serve other in-flight tool calls
+tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="openapi-tool")
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking function on the tool executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(tool_executor, functools.partial(func, *args, **kwargs))
 
 # Initialize API client (optional - only for call_control_plane_api tool)
+api_client.set_resilience_policy(ResiliencePolicy(
+    rate_limit=API_RATE_LIMIT,
+    burst=API_RATE_BURST,
+    max_retries=API_MAX_RETRIES,
+    deadline=API_REQUEST_DEADLINE,
+    breaker_error_rate=API_BREAKER_ERROR_RATE,
+    breaker_cooldown=API_BREAKER_COOLDOWN,
+    max_concurrency=API_MAX_CONCURRENCY
+))
 api_client_available = False
 try:
     api_client.initialize()
@@ -24,14 +80,96 @@ except Exception as e:
     logger.debug(f"API client initialization failed: {e}")
     logger.info("API client not available - only OpenAPI exploration tools will work")
 
+# Per-credential API clients of HTTP sessions, sharing the global client's resilience state
+MAX_SESSION_CLIENTS = 256
+_session_clients: "OrderedDict[Tuple[str, str], ApiClient]" = OrderedDict()
+# Close tasks of evicted session clients, referenced until they finish
+_closing: Set[asyncio.Task] = set()
+
+SESSION_CREDENTIALS_HELP = (
+    "Send Facets credentials with each request as HTTP Basic auth "
+    "or the X-Facets-Username and X-Facets-Token headers"
+)
+
+
+def _request_credentials(ctx: Optional[Context]) -> Tuple[bool, Optional[Tuple[str, str]]]:
+    """
+    Get the credentials sent with the current HTTP request.
+
+    Returns:
+        tuple: whether the call arrived over HTTP, and (username, token) if the request carried them
+    """
+    try:
+        request = ctx.request_context.request if ctx else None
+    except ValueError:
+        request = None
+    if request is None:
+        return False, None
+
+    headers = request.headers
+    username, token = headers.get('x-facets-username'), headers.get('x-facets-token')
+    if username and token:
+        return True, (username, token)
+    authorization = headers.get('authorization', '')
+    if authorization.lower().startswith('basic '):
+        try:
+            username, _, token = base64.b64decode(authorization[6:]).decode('utf-8').partition(':')
+        except ValueError:
+            return True, None
+        if username and token:
+            return True, (username, token)
+    return True, None
+
+
+def _api_client_for(ctx: Optional[Context]) -> Optional[ApiClient]:
+    """Get the API client for the calling session, or None if it has no usable credentials."""
+    is_http, credentials = _request_credentials(ctx)
+    if credentials is None:
+        if is_http and not MCP_HTTP_SHARED_CREDENTIALS:
+            return None
+        return api_client if api_client_available else None
+
+    username, token = credentials
+    key = (username, hashlib.sha256(token.encode('utf-8')).hexdigest())
+    client = _session_clients.get(key)
+    if client is None:
+        client = api_client.for_credentials(api_client.cp_url or CONTROL_PLANE_URL, username, token)
+        _session_clients[key] = client
+        if len(_session_clients) > MAX_SESSION_CLIENTS:
+            _, evicted = _session_clients.popitem(last=False)
+            task = asyncio.get_running_loop().create_task(evicted.aclose())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+    else:
+        _session_clients.move_to_end(key)
+    return client
+
+
+def session_client_count() -> int:
+    """Number of per-session API clients currently pooled."""
+    return len(_session_clients)
+
+
+async def shutdown() -> None:
+    """Release HTTP clients, worker threads and spec resources."""
+    for client in list(_session_clients.values()):
+        await client.aclose()
+    _session_clients.clear()
+    if _closing:
+        await asyncio.gather(*_closing, return_exceptions=True)
+    await api_client.aclose()
+    tool_executor.shutdown(wait=False, cancel_futures=True)
+    openapi_service.close()
+    logger.info("Released tool resources")
+
 
 @mcp.resource(uri="resource://control_plane_api_knowledge", name="Control Plane API Knowledge Base")
-def call_always_for_instruction() -> str:
-    return FIRST_STEP_get_api_script_guide()
+async def call_always_for_instruction() -> str:
+    return await FIRST_STEP_get_api_script_guide()
 
 
 @mcp.tool()
-def FIRST_STEP_get_api_script_guide() -> str:
+async def FIRST_STEP_get_api_script_guide() -> str:
     """
     <important>ALWAYS Call this tool first before calling any other tool of this mcp.</important>
     Loads the API script generation guide that contains comprehensive instructions for creating 
@@ -49,14 +187,14 @@ def FIRST_STEP_get_api_script_guide() -> str:
         with open(guide_path, 'r', encoding='utf-8') as f:
             guide_content = f.read()
         
-        return json.dumps({
+        return await run_blocking(output_shaper.render, {
             "success": True,
             "message": "API script guide loaded successfully.",
             "instructions": "Inform User: API script guide loaded successfully.",
             "data": {
                 "api_script_guide.md": guide_content
             }
-        }, indent=2)
+        })
     
     except FileNotFoundError:
         return json.dumps({
@@ -74,7 +212,7 @@ def FIRST_STEP_get_api_script_guide() -> str:
 
 
 @mcp.tool()
-def refresh_api_catalog() -> str:
+async def refresh_api_catalog() -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Refresh the API catalog by fetching the latest OpenAPI specification.
@@ -83,7 +221,7 @@ def refresh_api_catalog() -> str:
         str: Success message confirming the catalog has been refreshed.
     """
     try:
-        openapi_service.refresh()
+        await run_blocking(openapi_service.refresh)
         return json.dumps({
             "success": True,
             "message": "API catalog refreshed successfully"
@@ -97,7 +235,16 @@ def refresh_api_catalog() -> str:
 
 
 @mcp.tool()
-def search_api_operations(query: str) -> str:
+async def search_api_operations(
+    query: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    max_tokens: Optional[int] = None,
+    method: Optional[str] = None,
+    tag: Optional[str] = None,
+    path_prefix: Optional[str] = None,
+    mode: str = "text"
+) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Search for operations across the OpenAPI specification using fuzzy matching.
@@ -106,29 +253,110 @@ def search_api_operations(query: str) -> str:
     
     Args:
         query (str): Search query to match against operation summaries, descriptions, tags, and operation IDs.
+            Pass an empty query with filters to list every operation matching the filters.
+            In "parameter" and "enum" mode, the exact parameter name or enum value to look up.
+        limit (int, optional): Maximum number of operations to return (default: all matches).
+        offset (int): Number of ranked matches to skip, for paging through results.
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+        method (str, optional): Only operations with this HTTP method, e.g. "GET" or "POST,PUT".
+        tag (str, optional): Only operations with this tag (case-insensitive, comma-separated alternatives).
+        path_prefix (str, optional): Only operations under this path, e.g. "/cc-ui/v1/clusters".
+            A trailing "/" matches whole path segments only.
+        mode (str): "text" (default) for fuzzy search, "parameter" for the operations taking a parameter
+            named query (e.g. "clusterId", case- and separator-insensitive), or "enum" for the operations
+            with a parameter accepting the enum value query.
     
     Returns:
-        str: JSON string containing matching operations with their details.
+        str: JSON string containing matching operations with their details; in "parameter" and "enum"
+            mode each operation lists the matching parameters under "matches".
     """
     try:
-        operations = openapi_service.search_operations(query)
+        if mode == "text":
+            operations = await run_blocking(
+                openapi_service.search_operations, query, limit, offset, method, tag, path_prefix
+            )
+            found = [(op, None) for op in operations]
+        elif mode in ("parameter", "enum"):
+            found = await run_blocking(
+                openapi_service.search_operations_by_field,
+                "parameters" if mode == "parameter" else "enums",
+                query, limit, offset, method, tag, path_prefix
+            )
+        else:
+            raise ValueError(f"Unknown search mode '{mode}'; expected text, parameter or enum")
         # Simplified serialization to avoid JsonRef issues
         serialized_operations = []
-        for op in operations:
-            serialized_operations.append({
-                "path": op.path,
-                "method": op.method,
-                "spec_id": op.spec_id,
-                "uri": op.uri,
-                "operation_summary": op.operation.get('summary', ''),
-                "operation_description": op.operation.get('description', ''),
-                "operation_id": op.operation.get('operationId', ''),
-                "tags": op.operation.get('tags', [])
-            })
+        for op, matches in found:
+            serialized = _serialize_operation_summary(op)
+            if matches is not None:
+                serialized["matches"] = matches
+            serialized_operations.append(serialized)
 
+        return await run_blocking(output_shaper.render, {
+            "operations": serialized_operations
+        }, max_tokens)
+    except Exception as e:
+        logger.error(f"Failed to search API operations: {e}")
         return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
+@mcp.tool()
+async def search_api_operations_multi(
+    queries: List[str],
+    limit: int = 10,
+    max_tokens: Optional[int] = None,
+    method: Optional[str] = None,
+    tag: Optional[str] = None,
+    path_prefix: Optional[str] = None
+) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Search for operations matching any of several queries in a single call.
+    
+    Use this instead of repeated search_api_operations calls when exploring a topic from several
+    angles (e.g. ["list clusters", "cluster health", "delete cluster"]). All queries are scored
+    together and the results are merged into one deduplicated ranking.
+    
+    Args:
+        queries (List[str]): Search queries, each matched like the query of search_api_operations
+            (a blank query matches all operations).
+        limit (int): Maximum number of operations per query (default: 10).
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+        method (str, optional): Only operations with this HTTP method, e.g. "GET" or "POST,PUT".
+        tag (str, optional): Only operations with this tag (case-insensitive, comma-separated alternatives).
+        path_prefix (str, optional): Only operations under this path, e.g. "/cc-ui/v1/clusters".
+    
+    Returns:
+        str: JSON string with "queries" (the ranked operation references of each query) and
+            "operations" (every matching operation once, best first across all queries, with the
+            indexes of the queries it matched under "matched_queries")
+    """
+    try:
+        if not queries:
+            raise ValueError("At least one query is required")
+        per_query, merged = await run_blocking(
+            openapi_service.search_operations_multi, queries, limit, method, tag, path_prefix
+        )
+        serialized_operations = []
+        for op, score, matched_queries in merged:
+            serialized = _serialize_operation_summary(op)
+            serialized["score"] = round(score, 4)
+            serialized["matched_queries"] = matched_queries
+            serialized_operations.append(serialized)
+
+        return await run_blocking(output_shaper.render, {
+            "queries": [
+                {
+                    "query": query,
+                    "results": [op.operation.get('operationId') or f"{op.method} {op.path}" for op in operations]
+                }
+                for query, operations in zip(queries, per_query)
+            ],
             "operations": serialized_operations
-        }, indent=2)
+        }, max_tokens)
     except Exception as e:
         logger.error(f"Failed to search API operations: {e}")
         return json.dumps({
@@ -137,23 +365,62 @@ def search_api_operations(query: str) -> str:
         })
 
 
+def _serialize_operation_summary(op) -> dict:
+    """Simplified serialization to avoid JsonRef issues."""
+    return {
+        "path": op.path,
+        "method": op.method,
+        "spec_id": op.spec_id,
+        "uri": op.uri,
+        "operation_summary": op.operation.get('summary', ''),
+        "operation_description": op.operation.get('description', ''),
+        "operation_id": op.operation.get('operationId', ''),
+        "tags": op.operation.get('tags', [])
+    }
+
+
 @mcp.tool()
-def search_api_schemas(query: str) -> str:
+async def search_api_schemas(
+    query: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    max_tokens: Optional[int] = None,
+    mode: str = "text"
+) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Search for schemas across the OpenAPI specification using fuzzy matching.
     
     Args:
         query (str): Search query to match against schema names and descriptions.
+            In "property" and "enum" mode, the exact property name or enum value to look up.
+        limit (int, optional): Maximum number of schemas to return (default: all matches).
+        offset (int): Number of ranked matches to skip, for paging through results.
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+        mode (str): "text" (default) for fuzzy search, "property" for the schemas with a property named query
+            at any nesting level (e.g. "releaseTraceId" or a dotted suffix like "release.traceId",
+            case- and separator-insensitive), or "enum" for the schemas with a property accepting the enum value query.
     
     Returns:
-        str: JSON string containing matching schemas with their details.
+        str: JSON string containing matching schemas with their details; in "property" and "enum" mode
+            each schema lists the matching property paths under "matches".
     """
     try:
-        schemas = openapi_service.search_schemas(query)
-        return json.dumps({
-            "schemas": [schema.model_dump() for schema in schemas]
-        }, indent=2)
+        if mode == "text":
+            schemas = await run_blocking(openapi_service.search_schemas, query, limit, offset)
+            serialized_schemas = [schema.model_dump() for schema in schemas]
+        elif mode in ("property", "enum"):
+            found = await run_blocking(
+                openapi_service.search_schemas_by_field,
+                "properties" if mode == "property" else "enums",
+                query, limit, offset
+            )
+            serialized_schemas = [{**schema.model_dump(), "matches": matches} for schema, matches in found]
+        else:
+            raise ValueError(f"Unknown search mode '{mode}'; expected text, property or enum")
+        return await run_blocking(output_shaper.render, {
+            "schemas": serialized_schemas
+        }, max_tokens)
     except Exception as e:
         logger.error(f"Failed to search API schemas: {e}")
         return json.dumps({
@@ -162,25 +429,57 @@ def search_api_schemas(query: str) -> str:
         })
 
 
-def _format_operation_response(operation) -> str:
+@mcp.tool()
+async def complete_api_identifier(
+    prefix: str,
+    kind: Optional[str] = None,
+    limit: int = 20
+) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Complete the start of an operationId, schema name or path template, e.g. "getStack" or "/cc-ui/v1/clusters/".
+    Cheaper than a search when the beginning of the identifier is known.
+    
+    Args:
+        prefix (str): Start of the identifier (case-insensitive).
+        kind (str, optional): "operation_id", "schema" or "path" (default: paths for prefixes starting with "/",
+            otherwise operation IDs and schema names).
+        limit (int): Maximum number of completions to return (default: 20).
+    
+    Returns:
+        str: JSON string containing the completions, their total number and the number of completions
+            per next word or path segment ("branches"), for narrowing the prefix further.
+    """
+    try:
+        result = await run_blocking(openapi_service.complete_identifier, prefix, kind, limit)
+        return json.dumps(result)
+    except Exception as e:
+        logger.error(f"Failed to complete identifier: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
+def _format_operation_response(
+    operation,
+    path_parameters: Optional[dict] = None,
+    max_tokens: Optional[int] = None
+) -> str:
     """
     Helper method to format operation response with safe serialization.
     
     Args:
         operation: The operation object to format
+        path_parameters: Parameters extracted from a concrete request path, if any
+        max_tokens: Token budget for the response
     
     Returns:
         str: JSON string containing the formatted operation
     """
     if operation:
-        # Get components schemas for matching inline schemas
-        components_schemas = openapi_service.get_components_schemas()
-
         # Create a safe serializable version with schema names included
-        safe_operation_data = create_safe_operation_output(
-            operation.operation,
-            components_schemas
-        )
+        safe_operation_data = openapi_service.render_operation(operation)
 
         # Build the complete response
         safe_operation = {
@@ -190,26 +489,43 @@ def _format_operation_response(operation) -> str:
             "uri": operation.uri,
             "operation": safe_operation_data
         }
-        return json.dumps(safe_operation, indent=2)
+        if path_parameters:
+            safe_operation["path_parameters"] = path_parameters
+        # The schemas of an operation are usually loaded next; render them ahead of time
+        openapi_service.prefetch_schemas(referenced_schema_names(safe_operation_data))
+        return output_shaper.render(safe_operation, max_tokens)
     else:
         return json.dumps(None)
 
 
+def _not_found_response(kind: str, label: str, name: str) -> str:
+    """Error for an exact lookup miss, with the nearest identifiers by edit distance."""
+    return json.dumps({
+        "success": False,
+        "error": f"{label} '{name}' not found",
+        "suggestions": openapi_service.suggest_identifiers(kind, name)
+    })
+
+
 @mcp.tool()
-def load_api_operation_by_operationId(operation_id: str) -> str:
+async def load_api_operation_by_operationId(operation_id: str, max_tokens: Optional[int] = None) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Load a specific operation by its operationId.
     
     Args:
         operation_id (str): The unique operation ID to load.
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
     
     Returns:
-        str: JSON string containing the complete operation details or null if not found.
+        str: JSON string containing the complete operation details, or an error with the closest
+            operation IDs ("suggestions") if not found.
     """
     try:
-        operation = openapi_service.find_operation_by_id(operation_id)
-        return _format_operation_response(operation)
+        operation = await run_blocking(openapi_service.find_operation_by_id, operation_id)
+        if operation is None:
+            return await run_blocking(_not_found_response, 'operation_id', "Operation", operation_id)
+        return await run_blocking(_format_operation_response, operation, max_tokens=max_tokens)
     except Exception as e:
         logger.error(f"Failed to load operation by ID: {e}")
         return json.dumps({
@@ -218,22 +534,40 @@ def load_api_operation_by_operationId(operation_id: str) -> str:
         })
 
 
+def _find_operation_with_parameters(path: str, method: str) -> Tuple[Optional[Any], Optional[Dict[str, str]]]:
+    """
+    Helper method to find an operation by path and method.
+    
+    Returns:
+        tuple: The operation (or None) and, for concrete paths, the extracted path parameters
+    """
+    operation = openapi_service.find_operation_by_path_and_method(path, method)
+    path_parameters = None
+    if operation and operation.path != path:
+        route = openapi_service.resolve_path(path, method)
+        path_parameters = route.path_parameters if route else None
+    return operation, path_parameters
+
+
 @mcp.tool()
-def load_api_operation_by_path_and_method(path: str, method: str) -> str:
+async def load_api_operation_by_path_and_method(path: str, method: str, max_tokens: Optional[int] = None) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Load a specific operation by its path and HTTP method.
     
     Args:
-        path (str): The API endpoint path (e.g., '/cc-ui/v1/stacks/{stackName}').
+        path (str): The API endpoint path, either the template (e.g., '/cc-ui/v1/stacks/{stackName}')
+            or a concrete path (e.g., '/cc-ui/v1/stacks/prod-stack').
         method (str): The HTTP method (GET, POST, PUT, DELETE, etc.).
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
     
     Returns:
         str: JSON string containing the complete operation details or null if not found.
+            For concrete paths the extracted path parameters are included.
     """
     try:
-        operation = openapi_service.find_operation_by_path_and_method(path, method)
-        return _format_operation_response(operation)
+        operation, path_parameters = await run_blocking(_find_operation_with_parameters, path, method)
+        return await run_blocking(_format_operation_response, operation, path_parameters, max_tokens)
     except Exception as e:
         logger.error(f"Failed to load operation by path and method: {e}")
         return json.dumps({
@@ -242,36 +576,80 @@ def load_api_operation_by_path_and_method(path: str, method: str) -> str:
         })
 
 
+def _serialize_schema(schema, max_depth: int, max_bytes: Optional[int]) -> dict:
+    """
+    Helper method to create a safe serializable version of a schema.
+    
+    Nested schemas are expanded up to max_depth levels and the output is cut
+    off once it reaches roughly max_bytes.
+    
+    Args:
+        schema: The schema object to serialize
+        max_depth: Levels of nested object schemas to expand inline
+        max_bytes: Approximate size budget for the rendered schema
+    
+    Returns:
+        dict: The serializable schema
+    """
+    rendered = openapi_service.render_schema(schema.name, max_depth, max_bytes)
+    schema_data = rendered.schema if rendered else schema.schema_data
+    safe_schema = {
+        "name": schema.name,
+        "description": schema.description,
+        "uri": schema.uri,
+        "schema_data": {
+            "type": schema_data.get('type', ''),
+            "description": schema_data.get('description', ''),
+            "properties": schema_data.get('properties', {}),
+            "required": schema_data.get('required', [])
+        }
+    }
+    for key in ('allOf', 'anyOf', 'oneOf', 'items', 'enum'):
+        if key in schema_data:
+            safe_schema["schema_data"][key] = schema_data[key]
+    if rendered:
+        safe_schema["render"] = {
+            "max_depth": max_depth,
+            "max_bytes": max_bytes,
+            "bytes": rendered.size,
+            "truncated": rendered.truncated,
+            "collapsed_schemas": rendered.collapsed
+        }
+    return safe_schema
+
+
 @mcp.tool()
-def load_api_schema_by_schemaName(schema_name: str) -> str:
+async def load_api_schema_by_schemaName(
+    schema_name: str,
+    max_depth: int = SCHEMA_MAX_DEPTH,
+    max_bytes: int = SCHEMA_MAX_BYTES,
+    max_tokens: Optional[int] = None
+) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Load a specific schema by its name.
     
+    Nested schemas are expanded inline up to max_depth levels; deeper ones are returned as
+    {"schemaName": ...} references (marked "recursive" for cycles) that can be loaded separately.
+    
     Args:
         schema_name (str): The name of the schema to load (e.g., 'Stack', 'ErrorDetails').
+        max_depth (int): Levels of nested schemas to expand inline (0 returns only references).
+        max_bytes (int): Approximate size budget; properties beyond it are listed as omitted (0 for no limit).
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
     
     Returns:
-        str: JSON string containing the complete schema details or null if not found.
+        str: JSON string containing the complete schema details, or an error with the closest
+            schema names ("suggestions") if not found.
     """
     try:
-        schema = openapi_service.find_schema_by_name(schema_name)
+        schema = await run_blocking(openapi_service.find_schema_by_name, schema_name)
         if schema:
-            # Create a safe serializable version
-            safe_schema = {
-                "name": schema.name,
-                "description": schema.description,
-                "uri": schema.uri,
-                "schema_data": {
-                    "type": schema.schema_data.get('type', ''),
-                    "description": schema.schema_data.get('description', ''),
-                    "properties": schema.schema_data.get('properties', {}),
-                    "required": schema.schema_data.get('required', [])
-                }
-            }
-            return json.dumps(safe_schema, indent=2)
+            return await run_blocking(
+                lambda: output_shaper.render(_serialize_schema(schema, max_depth, max_bytes), max_tokens)
+            )
         else:
-            return json.dumps(None)
+            return await run_blocking(_not_found_response, 'schema', "Schema", schema_name)
     except Exception as e:
         logger.error(f"Failed to load schema by name: {e}")
         return json.dumps({
@@ -280,59 +658,389 @@ def load_api_schema_by_schemaName(schema_name: str) -> str:
         })
 
 
+def _render_schema_with_dependencies(
+    schema_name: str,
+    depth: int,
+    max_bytes: int,
+    max_tokens: Optional[int]
+) -> str:
+    """
+    Helper method to render a schema and its dependencies from the schema graph.
+    
+    Returns:
+        str: JSON string containing the schema and its dependencies, or null if not found
+    """
+    schema = openapi_service.find_schema_by_name(schema_name)
+    if not schema:
+        return json.dumps(None)
+
+    graph = openapi_service.get_schema_graph()
+    distances = graph.dependencies(schema_name, max(depth, 0))
+    dependencies = []
+    for name in sorted(distances, key=lambda n: (distances[n], n)):
+        dependency = openapi_service.find_schema_by_name(name)
+        if dependency:
+            safe_dependency = _serialize_schema(dependency, 0, max_bytes)
+            safe_dependency["distance"] = distances[name]
+            dependencies.append(safe_dependency)
+
+    return output_shaper.render({
+        "schema": _serialize_schema(schema, 0, max_bytes),
+        "graph": graph.describe(schema_name),
+        "dependencies": dependencies
+    }, max_tokens)
+
+
+@mcp.tool()
+async def load_api_schema_with_dependencies(
+    schema_name: str,
+    depth: int = 1,
+    max_bytes: int = SCHEMA_MAX_BYTES,
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Load a schema together with the schemas it references, up to a given depth, in one call.
+    Each schema is rendered with nested schemas as {"schemaName": ...} references.
+    
+    Args:
+        schema_name (str): The name of the schema to load (e.g., 'Stack').
+        depth (int): How many reference hops to follow (default: 1, direct dependencies only).
+        max_bytes (int): Approximate size budget per schema (0 for no limit).
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+    
+    Returns:
+        str: JSON string containing the schema, its dependencies and their reference graph facts,
+            or null if the schema is not found.
+    """
+    try:
+        return await run_blocking(_render_schema_with_dependencies, schema_name, depth, max_bytes, max_tokens)
+    except Exception as e:
+        logger.error(f"Failed to load schema with dependencies: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
+def _load_batch(
+    operation_ids: List[str],
+    operations: List[Dict[str, str]],
+    schema_names: List[str],
+    include_referenced_schemas: bool,
+    max_depth: int,
+    max_bytes: int,
+    max_tokens: Optional[int]
+) -> str:
+    """
+    Helper method to resolve a batch of operations and schemas into one response.
+    
+    Returns:
+        str: JSON string containing the operations, the schemas (each rendered once) and the misses
+    """
+    found = []
+    not_found = []
+    seen_operations = set()
+    for operation_id in operation_ids:
+        operation = openapi_service.find_operation_by_id(operation_id)
+        if operation is None:
+            not_found.append({
+                "operation_id": operation_id,
+                "suggestions": openapi_service.suggest_identifiers('operation_id', operation_id)
+            })
+        elif (operation.path, operation.method) not in seen_operations:
+            seen_operations.add((operation.path, operation.method))
+            found.append((operation, None))
+    for item in operations:
+        path, method = item.get('path', ''), item.get('method', '')
+        operation, path_parameters = _find_operation_with_parameters(path, method)
+        if operation is None:
+            not_found.append({"path": path, "method": method})
+            continue
+        if (operation.path, operation.method) in seen_operations:
+            continue
+        seen_operations.add((operation.path, operation.method))
+        found.append((operation, path_parameters))
+
+    # Operations share one components lookup; referenced schemas are collected once each
+    rendered_operations = openapi_service.render_operations([operation for operation, _ in found])
+    requested_schemas = list(dict.fromkeys(schema_names))
+    if include_referenced_schemas:
+        for rendered in rendered_operations:
+            requested_schemas.extend(
+                name for name in referenced_schema_names(rendered) if name not in requested_schemas
+            )
+
+    result_operations = []
+    for (operation, path_parameters), rendered in zip(found, rendered_operations):
+        safe_operation = {
+            "path": operation.path,
+            "method": operation.method,
+            "spec_id": operation.spec_id,
+            "uri": operation.uri,
+            "operation": rendered
+        }
+        if path_parameters:
+            safe_operation["path_parameters"] = path_parameters
+        result_operations.append(safe_operation)
+
+    result_schemas = []
+    for schema_name in requested_schemas:
+        schema = openapi_service.find_schema_by_name(schema_name)
+        if schema is None:
+            not_found.append({
+                "schema_name": schema_name,
+                "suggestions": openapi_service.suggest_identifiers('schema', schema_name)
+            })
+        else:
+            result_schemas.append(_serialize_schema(schema, max_depth, max_bytes))
+
+    return output_shaper.render({
+        "operations": result_operations,
+        "schemas": result_schemas,
+        "not_found": not_found
+    }, max_tokens)
+
+
+@mcp.tool()
+async def load_api_batch(
+    operation_ids: Optional[List[str]] = None,
+    operations: Optional[List[Dict[str, str]]] = None,
+    schema_names: Optional[List[str]] = None,
+    include_referenced_schemas: bool = False,
+    max_depth: int = SCHEMA_MAX_DEPTH,
+    max_bytes: int = SCHEMA_MAX_BYTES,
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Load several operations and schemas in one call instead of one load tool call per item.
+    
+    Args:
+        operation_ids (list, optional): Operation IDs to load.
+        operations (list, optional): Operations to load by path and method,
+            e.g. [{"path": "/cc-ui/v1/stacks/{stackName}", "method": "GET"}]; concrete paths are accepted.
+        schema_names (list, optional): Schema names to load.
+        include_referenced_schemas (bool): Also load the request body and response schemas of the loaded operations.
+        max_depth (int): Levels of nested schemas to expand inline (0 returns only references).
+        max_bytes (int): Approximate size budget per schema (0 for no limit).
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+    
+    Returns:
+        str: JSON string containing the "operations" and "schemas" (each included once, however often requested
+            or referenced) and "not_found" items with the closest identifiers as suggestions.
+    """
+    try:
+        return await run_blocking(
+            _load_batch,
+            operation_ids or [],
+            operations or [],
+            schema_names or [],
+            include_referenced_schemas,
+            max_depth,
+            max_bytes,
+            max_tokens
+        )
+    except Exception as e:
+        logger.error(f"Failed to load API batch: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
 @mcp.tool()
-def call_control_plane_api(path: str) -> str:
+async def find_operations_using_schema(
+    schema_name: str,
+    transitive: bool = False,
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Find the operations whose parameters, request body or responses use a schema.
+    
+    Args:
+        schema_name (str): The name of the schema (e.g., 'Stack').
+        transitive (bool): Also include operations that use the schema through other schemas.
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+    
+    Returns:
+        str: JSON string containing the matching operations.
+    """
+    try:
+        graph = await run_blocking(openapi_service.get_schema_graph)
+        if schema_name not in graph:
+            return json.dumps({
+                "success": False,
+                "error": f"Schema '{schema_name}' not found"
+            })
+
+        return await run_blocking(output_shaper.render, {
+            "schema_name": schema_name,
+            "operations": graph.operations_using(schema_name, transitive)
+        }, max_tokens)
+    except Exception as e:
+        logger.error(f"Failed to find operations using schema: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
+def _describe_called_operation(path: str, status_code: int) -> Optional[dict]:
+    """
+    Describe the documented GET operation a concrete API path belongs to.
+    
+    Args:
+        path: The concrete path that was called
+        status_code: HTTP status code of the response
+    
+    Returns:
+        dict: Operation metadata and response schema name, or None if the path is not documented
+    """
+    if not openapi_service.is_ready():
+        # Annotating is best effort; never load (or refetch) the spec for it
+        return None
+    try:
+        route = openapi_service.resolve_path(path, 'GET')
+        if not route:
+            return None
+        operation = openapi_service.find_operation_by_path_and_method(route.path, 'GET', record=False)
+        if not operation:
+            return None
+        rendered = openapi_service.render_operation(operation)
+        responses = rendered.get('responses', {})
+        response = responses.get(str(status_code)) or responses.get('default') or {}
+    except Exception as e:
+        logger.debug(f"Could not resolve operation for {path}: {e}")
+        return None
+
+    info = {
+        "operationId": rendered.get('operationId', ''),
+        "summary": rendered.get('summary', ''),
+        "path_template": route.path,
+        "path_parameters": route.path_parameters,
+    }
+    if isinstance(response, dict) and response.get('schemaName'):
+        info["response_schema"] = response['schemaName']
+    return info
+
+
+async def _fetch_api_json(client: ApiClient, path: str) -> Tuple[int, Any]:
+    """GET an API path and return its status code and JSON (or text) body."""
+    response = await client.get_async(path)
+    try:
+        return response.status_code, response.json()
+    except ValueError:
+        # Response is not JSON
+        return response.status_code, response.text
+
+
+def _api_result(path: str, status_code: int, body: Any) -> dict:
+    """Build the call_control_plane_api result for a response."""
+    if status_code == 200:
+        return {
+            "success": True,
+            "status_code": status_code,
+            "data": body
+        }
+    # Handle error responses
+    return {
+        "success": False,
+        "status_code": status_code,
+        "error": body,
+        "path": path
+    }
+
+
+@mcp.tool()
+async def call_control_plane_api(
+    path: str,
+    max_tokens: Optional[int] = None,
+    auto_paginate: bool = False,
+    max_items: Optional[int] = None,
+    page_size: Optional[int] = None,
+    ctx: Context = None
+) -> str:
     """
     <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
     Make a GET request to the Facets Control Plane API.
     
     Args:
         path (str): API path to call (e.g., '/cc-ui/v1/stacks/my-stack' or 'cc-ui/v1/stacks')
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+        auto_paginate (bool, optional): For paginated list operations, fetch all pages concurrently and
+            return the merged items as "data" (default: False).
+        max_items (int, optional): Cap on the items collected with auto_paginate (default: AUTO_PAGINATE_MAX_ITEMS).
+        page_size (int, optional): Page size requested with auto_paginate (default: 100, capped by the spec).
     
     Returns:
         str: JSON string containing the API response or error information.
+            When the path matches a documented operation, its operationId, path template,
+            path parameters and response schema name are included under "operation".
+            Auto-paginated responses describe the pages fetched under "pagination".
     """
     try:
-        if not api_client_available:
+        client = _api_client_for(ctx)
+        if client is None:
+            is_http, _ = _request_credentials(ctx)
             return json.dumps({
                 "success": False,
                 "error": "API client not initialized. Authentication credentials are required for this tool.",
-                "help": "Set CONTROL_PLANE_URL, FACETS_USERNAME, FACETS_TOKEN environment variables or configure ~/.facets/credentials"
+                "help": SESSION_CREDENTIALS_HELP if is_http else
+                    "Set CONTROL_PLANE_URL, FACETS_USERNAME, FACETS_TOKEN environment variables or configure ~/.facets/credentials"
             })
+        fetch = functools.partial(_fetch_api_json, client)
+
+        pagination = None
+        if auto_paginate:
+            pagination = await run_blocking(openapi_service.detect_pagination, path)
+            if pagination is None:
+                logger.info(f"No pagination parameters declared for {path}; fetching a single response")
 
-        # Make the API call
-        response = api_client.get(path)
-
-        # Handle response
-        if response.status_code == 200:
-            try:
-                response_data = response.json()
-                return json.dumps({
-                    "success": True,
-                    "status_code": response.status_code,
-                    "data": response_data
-                }, indent=2)
-            except ValueError:
-                # Response is not JSON
-                return json.dumps({
-                    "success": True,
-                    "status_code": response.status_code,
-                    "data": response.text
-                }, indent=2)
+        if pagination:
+            collected = await collect_pages(
+                fetch,
+                path,
+                pagination,
+                max_items if max_items and max_items > 0 else AUTO_PAGINATE_MAX_ITEMS,
+                page_size,
+                AUTO_PAGINATE_CONCURRENCY
+            )
+            if 'items' in collected:
+                status_code = 200
+                result = _api_result(path, status_code, collected['items'])
+                result["pagination"] = collected['pagination']
+            else:
+                status_code = collected['status_code']
+                result = _api_result(path, status_code, collected['body'])
         else:
-            # Handle error responses
-            try:
-                error_data = response.json()
-            except ValueError:
-                error_data = response.text
+            # Make the API call
+            status_code, body = await fetch(path)
+            result = _api_result(path, status_code, body)
 
-            return json.dumps({
-                "success": False,
-                "status_code": response.status_code,
-                "error": error_data,
-                "path": path
-            }, indent=2)
+        operation_info = await run_blocking(_describe_called_operation, path, status_code)
+        if operation_info:
+            result["operation"] = operation_info
+        # 'description' fields in API data are real data, not spec metadata
+        return await run_blocking(output_shaper.render, result, max_tokens, False)
 
+    except PageFetchError as e:
+        logger.error(f"Failed to paginate Control Plane API: {e}")
+        return json.dumps({
+            "success": False,
+            "status_code": e.status_code,
+            "error": e.body,
+            "path": e.path
+        })
+    except ApiUnavailableError as e:
+        logger.warning(f"Control Plane API call refused: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "retry_after": round(e.retry_after, 1) if e.retry_after is not None else None,
+            "path": path
+        })
     except Exception as e:
         logger.error(f"Failed to call Control Plane API: {e}")
         return json.dumps({
@@ -340,3 +1048,56 @@ def call_control_plane_api(path: str) -> str:
             "error": str(e),
             "path": path
         })
+
+
+@mcp.tool()
+async def get_control_plane_api_health() -> str:
+    """
+    Report the health of Control Plane API calls made by call_control_plane_api.
+    
+    Returns:
+        str: JSON string with, per control plane, the circuit breaker state, the current
+            adaptive concurrency limit, remaining rate-limit tokens, counters (attempts,
+            retries, rate-limit waits, circuit rejections, ...) and latency percentiles.
+    """
+    try:
+        return json.dumps({
+            "success": True,
+            "api_client_available": api_client_available,
+            "control_planes": api_client.get_resilience_metrics()
+        }, indent=2)
+    except Exception as e:
+        logger.error(f"Failed to get Control Plane API health: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
+
+
+@mcp.tool()
+async def get_output_continuation(cursor: str, max_tokens: Optional[int] = None) -> str:
+    """
+    <important>Make Sure you have Called FIRST_STEP_get_api_script_guide first before this tool.</important>
+    Fetch the remaining items of a list that was truncated to fit a response budget.
+    
+    Args:
+        cursor (str): Cursor from the '_meta.truncated' entry of an earlier response.
+        max_tokens (int, optional): Token budget for the response (default: OUTPUT_TOKEN_BUDGET, 0 for unlimited).
+    
+    Returns:
+        str: JSON string containing the remaining items, possibly with a further cursor.
+    """
+    try:
+        output = await run_blocking(output_shaper.continuation, cursor, max_tokens)
+        if output is None:
+            return json.dumps({
+                "success": False,
+                "error": f"Unknown or expired cursor '{cursor}'"
+            })
+        return output
+    except Exception as e:
+        logger.error(f"Failed to fetch output continuation: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        })
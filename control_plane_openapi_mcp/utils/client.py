@@ -1,10 +1,15 @@
+import asyncio
 import os
 import configparser
+import httpx
 import requests
 from requests.auth import HTTPBasicAuth
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
 
+from .compression import HTTPX_ACCEPT_ENCODING, REQUESTS_ACCEPT_ENCODING
+from .resilience import ControlPlaneGuard, ResiliencePolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +21,41 @@ class ApiClient:
         self.username: Optional[str] = None
         self.token: Optional[str] = None
         self.initialized = False
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Close tasks of replaced async clients, kept until they finish
+        self._closing: Set[asyncio.Task] = set()
+        self.resilience_policy = ResiliencePolicy()
+        # Rate limiter, circuit breaker and concurrency limit per control plane URL
+        self._guards: Dict[str, ControlPlaneGuard] = {}
+    
+    def set_resilience_policy(self, policy: ResiliencePolicy) -> None:
+        """Replace the resilience policy; state and metrics start over."""
+        self.resilience_policy = policy
+        self._guards = {}
+    
+    def get_resilience_metrics(self) -> List[Dict[str, Any]]:
+        """Get resilience metrics for every control plane contacted so far."""
+        return [guard.snapshot() for guard in self._guards.values()]
+    
+    def for_credentials(self, url: str, username: str, token: str) -> 'ApiClient':
+        """Create a client with its own credentials that shares this client's resilience state."""
+        client = ApiClient()
+        client.resilience_policy = self.resilience_policy
+        client._guards = self._guards
+        client.set_client_config(url, username, token)
+        return client
+    
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def _get_guard(self) -> ControlPlaneGuard:
+        guard = self._guards.get(self.cp_url)
+        if guard is None:
+            guard = self._guards.setdefault(self.cp_url, ControlPlaneGuard(self.cp_url, self.resilience_policy))
+        return guard
     
     def set_client_config(self, url: str, username: str, token: str):
         """Set client configuration."""
@@ -23,6 +63,26 @@ class ApiClient:
         self.username = username
         self.token = token
         self.initialized = True
+        # Credentials changed; the pooled async client is recreated on next use
+        previous, self._async_client = self._async_client, None
+        if previous is not None:
+            self._close_replaced_client(previous)
+    
+    def _close_replaced_client(self, client: httpx.AsyncClient) -> None:
+        """Close a replaced async HTTP client, in the background when an event loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        try:
+            if loop is None:
+                asyncio.run(client.aclose())
+            else:
+                task = loop.create_task(client.aclose())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        except Exception as e:
+            logger.debug(f"Failed to close replaced HTTP client: {e}")
     
     def initialize(self) -> Tuple[str, str, str, str]:
         """
@@ -78,6 +138,9 @@ class ApiClient:
         """
         Make a GET request to the Control Plane API.
         
+        Requests are rate limited per control plane and retried with backoff on
+        transport errors and 429/502/503/504 responses (honoring Retry-After).
+        
         Args:
             path: API path (e.g., '/cc-ui/v1/stacks/my-stack')
             timeout: Request timeout in seconds
@@ -87,6 +150,7 @@ class ApiClient:
             
         Raises:
             ValueError: If client not initialized
+            ApiUnavailableError: If the request was refused to protect the control plane
             requests.RequestException: If request fails
         """
         if not self.initialized:
@@ -102,20 +166,80 @@ class ApiClient:
         logger.debug(f"Making GET request to: {url}")
         
         try:
-            response = requests.get(
-                url,
-                auth=auth,
-                timeout=timeout,
+            response = self._get_guard().call(
+                lambda attempt_timeout: requests.get(
+                    url,
+                    auth=auth,
+                    timeout=attempt_timeout,
+                    headers={
+                        'Accept': 'application/json',
+                        'Accept-Encoding': REQUESTS_ACCEPT_ENCODING,
+                        'User-Agent': 'control-plane-openapi-mcp/1.0.0'
+                    }
+                ),
+                timeout,
+                (requests.ConnectionError, requests.Timeout)
+            )
+            
+            logger.info(f"GET {path} -> {response.status_code}")
+            return response
+            
+        except requests.RequestException as e:
+            logger.error(f"Request failed for {path}: {e}")
+            raise
+
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                auth=httpx.BasicAuth(self.username, self.token),
                 headers={
                     'Accept': 'application/json',
+                    'Accept-Encoding': HTTPX_ACCEPT_ENCODING,
                     'User-Agent': 'control-plane-openapi-mcp/1.0.0'
                 }
             )
+        return self._async_client
+    
+    async def get_async(self, path: str, timeout: int = 30) -> httpx.Response:
+        """
+        Make a GET request to the Control Plane API without blocking the event loop.
+        
+        Applies the same rate limiting, retries and circuit breaking as get().
+        
+        Args:
+            path: API path (e.g., '/cc-ui/v1/stacks/my-stack')
+            timeout: Request timeout in seconds
+            
+        Returns:
+            httpx.Response object
             
+        Raises:
+            ValueError: If client not initialized
+            ApiUnavailableError: If the request was refused to protect the control plane
+            httpx.HTTPError: If request fails
+        """
+        if not self.initialized:
+            raise ValueError("Client not initialized. Call initialize() first.")
+        
+        # Ensure path starts with /
+        if not path.startswith('/'):
+            path = f'/{path}'
+        
+        url = f"{self.cp_url}{path}"
+        logger.debug(f"Making async GET request to: {url}")
+        
+        try:
+            client = self._get_async_client()
+            response = await self._get_guard().call_async(
+                lambda attempt_timeout: client.get(url, timeout=attempt_timeout),
+                timeout,
+                (httpx.TransportError,)
+            )
             logger.info(f"GET {path} -> {response.status_code}")
             return response
-            
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed for {path}: {e}")
             raise
 
@@ -0,0 +1,124 @@
+"""
+Content-encoding negotiation and dictionary compression for persisted data.
+"""
+
+import zlib
+from typing import Iterable, List, Optional
+import logging
+
+from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli  # noqa: F401
+    _HAS_BROTLI = True
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # noqa: F401
+        _HAS_BROTLI = True
+    except ImportError:
+        _HAS_BROTLI = False
+
+logger = logging.getLogger(__name__)
+
+# Encodings requests/urllib3 can decode in this environment
+REQUESTS_ACCEPT_ENCODING = ', '.join(_URLLIB3_ACCEPT_ENCODING.split(','))
+
+# Encodings httpx can decode in this environment (it picks up the same optional packages)
+HTTPX_ACCEPT_ENCODING = ', '.join(
+    (['zstd'] if zstandard is not None else [])
+    + (['br'] if _HAS_BROTLI else [])
+    + ['gzip', 'deflate']
+)
+
+# Size of the shared dictionary trained from the data being stored
+DICTIONARY_SIZE = 64 * 1024
+
+# zlib only uses the last 32 KiB of a preset dictionary
+_ZLIB_DICTIONARY_SIZE = 32 * 1024
+
+ZSTD_LEVEL = 9
+ZLIB_LEVEL = 9
+
+
+def _zlib_dictionary(samples: List[bytes]) -> bytes:
+    """Build a preset dictionary for zlib from the leading bytes of the samples."""
+    per_sample = max(_ZLIB_DICTIONARY_SIZE // max(len(samples), 1), 256)
+    dictionary = b''.join(sample[:per_sample] for sample in samples)
+    return dictionary[-_ZLIB_DICTIONARY_SIZE:]
+
+
+class DictionaryCodec:
+    """
+    Compresses many small, similar blobs against a shared dictionary.
+
+    Uses zstd when the zstandard package is installed and falls back to zlib
+    with a preset dictionary otherwise. Compression and decompression
+    contexts are created once and reused for every blob; zlib contexts are
+    primed with the dictionary once and copied per blob.
+    """
+
+    def __init__(self, name: str, dictionary: bytes = b''):
+        if name not in ('zstd', 'zlib', 'none'):
+            raise ValueError(f"Unknown compression codec: {name}")
+        if name == 'zstd' and zstandard is None:
+            raise ValueError("Data is zstd-compressed; install the 'compression' extra to read it")
+        self.name = name
+        self.dictionary = dictionary
+        self._compressor = None
+        self._decompressor = None
+        if name == 'zstd':
+            dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data)
+            self._decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+        elif name == 'zlib':
+            self._compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary) if dictionary \
+                else zlib.compressobj(ZLIB_LEVEL)
+            self._decompressor = zlib.decompressobj(zdict=dictionary) if dictionary \
+                else zlib.decompressobj()
+
+    @classmethod
+    def train(cls, samples: Iterable[bytes], name: Optional[str] = None) -> 'DictionaryCodec':
+        """
+        Create a codec with a dictionary trained on sample blobs.
+
+        Args:
+            samples: Representative blobs, typically the blobs about to be stored
+            name: Codec to use; zstd when available, zlib otherwise
+        """
+        samples = [sample for sample in samples if sample]
+        if name is None:
+            name = 'zstd' if zstandard is not None else 'zlib'
+        if name == 'none' or not samples:
+            return cls(name)
+
+        if name == 'zlib':
+            return cls(name, _zlib_dictionary(samples))
+
+        try:
+            trained = zstandard.train_dictionary(DICTIONARY_SIZE, samples)
+            return cls(name, trained.as_bytes())
+        except zstandard.ZstdError as e:
+            # Training needs a reasonable number of samples; small specs compress fine without
+            logger.debug(f"Could not train zstd dictionary, compressing without one: {e}")
+            return cls(name)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.name == 'zstd':
+            return self._compressor.compress(data)
+        if self.name == 'zlib':
+            compressor = self._compressor.copy()
+            return compressor.compress(data) + compressor.flush()
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.name == 'zstd':
+            return self._decompressor.decompress(data)
+        if self.name == 'zlib':
+            decompressor = self._decompressor.copy()
+            return decompressor.decompress(data) + decompressor.flush()
+        return data
@@ -0,0 +1,81 @@
+"""
+Advisory inter-process file lock.
+"""
+
+import os
+import time
+from typing import Optional
+import logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting process retries the lock
+POLL_INTERVAL = 0.1
+
+
+class FileLock:
+    """
+    Exclusive lock on a file, shared between processes on one host.
+
+    The operating system drops the lock when the holding process exits, so a
+    crashed holder never leaves the lock stuck.
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        self.path = path
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        """
+        Block until the lock is held or the timeout passes.
+
+        Returns:
+            bool: Whether the lock was acquired
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        waited = False
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                self._fd = fd
+                if waited:
+                    logger.debug(f"Acquired lock {self.path} after waiting")
+                return True
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    return False
+                if not waited:
+                    logger.info(f"Waiting for lock {self.path} held by another process")
+                    waited = True
+                time.sleep(POLL_INTERVAL)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
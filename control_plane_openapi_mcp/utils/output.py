@@ -0,0 +1,257 @@
+"""
+Token-budget-aware shaping of tool responses.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to turn token budgets into byte budgets
+CHARS_PER_TOKEN = 4
+
+# Indented output is roughly this much larger than compact output
+PRETTY_OVERHEAD = 1.35
+
+# Keys dropped when the output has to shed descriptive text
+DESCRIPTION_KEYS = frozenset({'description', 'operation_description'})
+
+META_KEY = '_meta'
+
+# Bounds of the continuation store; the least recently used entries are evicted first
+MAX_CONTINUATIONS = 256
+MAX_CONTINUATION_BYTES = 16 * 1024 * 1024
+
+_COMPACT = (',', ':')
+
+Path = Tuple[Any, ...]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of serialized output."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _compact(payload: Any) -> str:
+    # Compact dumps uses the C encoder; indent=2 falls back to the pure-Python one
+    return json.dumps(payload, separators=_COMPACT)
+
+
+def _drop_descriptions(node: Any, property_map: bool = False) -> Any:
+    """
+    Copy of node without description keys (also breaks sharing with cached data).
+
+    The keys of a schema's 'properties' map are property names, not metadata,
+    so a property called 'description' is kept (and still matches 'required').
+    """
+    if isinstance(node, dict):
+        if property_map:
+            return {k: _drop_descriptions(v) for k, v in node.items()}
+        return {
+            k: _drop_descriptions(v, k == 'properties')
+            for k, v in node.items() if k not in DESCRIPTION_KEYS
+        }
+    if isinstance(node, list):
+        return [_drop_descriptions(item) for item in node]
+    return node
+
+
+def _find_lists(node: Any, path: Path = ()) -> List[Tuple[Path, List[Any]]]:
+    found = []
+    if isinstance(node, dict):
+        for key, value in node.items():
+            found.extend(_find_lists(value, path + (key,)))
+    elif isinstance(node, list):
+        found.append((path, node))
+        for index, item in enumerate(node):
+            found.extend(_find_lists(item, path + (index,)))
+    return found
+
+
+def _format_path(path: Path) -> str:
+    return '.'.join(str(part) for part in path) or '$'
+
+
+class OutputShaper:
+    """
+    Shared output pipeline for tool responses.
+
+    Responses are serialized within a per-call token budget, degrading in
+    order: indented JSON, compact JSON, descriptions dropped (spec output
+    only, never API response data), and finally lists truncated with
+    continuation cursors. The remainder of a truncated
+    list is kept for a while and can be fetched with its cursor; the store
+    is bounded by entry count and serialized size.
+    """
+
+    def __init__(
+        self,
+        default_budget_tokens: int,
+        continuation_ttl: int = 900,
+        max_continuations: int = MAX_CONTINUATIONS,
+        max_continuation_bytes: int = MAX_CONTINUATION_BYTES
+    ):
+        self.default_budget_tokens = default_budget_tokens
+        self.continuation_ttl = continuation_ttl
+        self.max_continuations = max_continuations
+        self.max_continuation_bytes = max_continuation_bytes
+        # cursor -> (expiry time, serialized size, entry), least recently used first
+        self._continuations: 'OrderedDict[str, Tuple[float, int, Dict[str, Any]]]' = OrderedDict()
+        self._continuation_bytes = 0
+        self._lock = threading.Lock()
+
+    def render(self, payload: Any, max_tokens: Optional[int] = None, drop_descriptions: bool = True) -> str:
+        """
+        Serialize a tool response within a token budget.
+
+        Args:
+            payload: The JSON-serializable response
+            max_tokens: Budget for this call (default budget when omitted, 0 for unlimited)
+            drop_descriptions: Whether description keys may be dropped to fit; disable for
+                API response data, where 'description' is a real field
+
+        Returns:
+            str: JSON output; dict responses carry a '_meta' entry describing the cost
+        """
+        budget_tokens = self.default_budget_tokens if max_tokens is None else max_tokens
+        budget = budget_tokens * CHARS_PER_TOKEN if budget_tokens and budget_tokens > 0 else None
+
+        compact = _compact(payload)
+        if not isinstance(payload, dict):
+            if budget is None or len(compact) * PRETTY_OVERHEAD <= budget:
+                return json.dumps(payload, indent=2)
+            return compact
+
+        degradations: List[str] = []
+        truncated: List[Dict[str, Any]] = []
+        if budget is not None and len(compact) * PRETTY_OVERHEAD > budget:
+            degradations.append('compact')
+            if len(compact) > budget and drop_descriptions:
+                payload = _drop_descriptions(payload)
+                compact = _compact(payload)
+                degradations.append('descriptions_dropped')
+            if len(compact) > budget:
+                if not drop_descriptions:
+                    # Lists are cut in place; copy so callers' (and cached) data is untouched
+                    payload = json.loads(compact)
+                payload, compact, truncated = self._truncate_lists(payload, compact, budget, drop_descriptions)
+                degradations.append('lists_truncated')
+
+        meta: Dict[str, Any] = {
+            'bytes': len(compact),
+            'estimated_tokens': estimate_tokens(compact),
+            'budget_tokens': budget_tokens if budget is not None else None,
+        }
+        if degradations:
+            meta['degradations'] = degradations
+        if truncated:
+            meta['truncated'] = truncated
+            meta['continuation'] = "Call get_output_continuation with a cursor to fetch the remaining items."
+
+        output = {**payload, META_KEY: meta}
+        if degradations:
+            return _compact(output)
+        return json.dumps(output, indent=2)
+
+    def continuation(self, cursor: str, max_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        Render the remaining items of a truncated list.
+
+        Returns:
+            str: JSON output, or None if the cursor is unknown or expired
+        """
+        with self._lock:
+            stored = self._continuations.get(cursor)
+            if stored is None:
+                return None
+            expires_at, size, entry = stored
+            if time.time() > expires_at:
+                del self._continuations[cursor]
+                self._continuation_bytes -= size
+                return None
+            self._continuations.move_to_end(cursor)
+        return self.render({
+            'path': entry['path'],
+            'offset': entry['offset'],
+            'items': entry['items'],
+        }, max_tokens, entry['drop_descriptions'])
+
+    def _store_continuation(self, entry: Dict[str, Any], size: int) -> Optional[str]:
+        """
+        Keep a continuation, sweeping expired entries and evicting the least recently used.
+
+        Returns:
+            str: Its cursor, or None if it is larger than the whole store
+        """
+        if size > self.max_continuation_bytes or self.max_continuations <= 0:
+            return None
+        cursor = uuid.uuid4().hex[:16]
+        now = time.time()
+        with self._lock:
+            for key in [key for key, (expires_at, _, _) in self._continuations.items() if now > expires_at]:
+                self._continuation_bytes -= self._continuations.pop(key)[1]
+            self._continuations[cursor] = (now + self.continuation_ttl, size, entry)
+            self._continuation_bytes += size
+            while (
+                len(self._continuations) > self.max_continuations
+                or self._continuation_bytes > self.max_continuation_bytes
+            ):
+                _, (_, evicted_size, _) = self._continuations.popitem(last=False)
+                self._continuation_bytes -= evicted_size
+        return cursor
+
+    def _truncate_lists(
+        self,
+        payload: Dict[str, Any],
+        compact: str,
+        budget: int,
+        drop_descriptions: bool = True
+    ) -> Tuple[Dict[str, Any], str, List[Dict[str, Any]]]:
+        """Cut the largest lists down until the payload fits, keeping at least one item each."""
+        truncated: List[Dict[str, Any]] = []
+        done: set = set()
+        # Leave room for the metadata describing the truncation itself
+        budget = max(budget - 512, 0)
+        while len(compact) > budget:
+            candidates = [
+                (path, items) for path, items in _find_lists(payload)
+                if len(items) > 1 and path not in done
+            ]
+            if not candidates:
+                break
+            sized = [(len(_compact(items)), path, items) for path, items in candidates]
+            list_size, path, items = max(sized, key=lambda entry: entry[0])
+            done.add(path)
+
+            overflow = len(compact) - budget
+            keep = len(items)
+            removed = 0
+            while keep > 1 and removed < overflow:
+                keep -= 1
+                removed += len(_compact(items[keep])) + 1
+
+            remainder = items[keep:]
+            # The payload is a private copy at this point, so it can be cut in place
+            del items[keep:]
+            cursor = self._store_continuation({
+                'path': _format_path(path),
+                'offset': keep,
+                'items': remainder,
+                'drop_descriptions': drop_descriptions,
+            }, len(_compact(remainder)))
+            truncated.append({
+                'path': _format_path(path),
+                'returned': keep,
+                'total': keep + len(remainder),
+                'cursor': cursor,
+            })
+            compact = _compact(payload)
+
+        if truncated:
+            logger.info(f"Truncated {len(truncated)} list(s) to fit output budget")
+        return payload, compact, truncated
@@ -0,0 +1,413 @@
+"""
+Rate limiting, retries, circuit breaking and adaptive concurrency for control plane requests.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Type
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying for idempotent requests
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Statuses that signal the control plane is overloaded (shrink concurrency)
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# How often a request waiting for a concurrency slot checks again
+SLOT_POLL_INTERVAL = 0.02
+
+# Latency samples kept for percentiles
+LATENCY_SAMPLES = 512
+
+
+class ApiUnavailableError(Exception):
+    """Raised without contacting the control plane when it is being protected."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ResiliencePolicy:
+    """Tunables of the resilience layer."""
+
+    def __init__(
+        self,
+        rate_limit: float = 10.0,
+        burst: int = 20,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        deadline: float = 60.0,
+        breaker_error_rate: float = 0.5,
+        breaker_min_requests: int = 10,
+        breaker_window: float = 30.0,
+        breaker_cooldown: float = 15.0,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1
+    ):
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Upper bound on the total time of one call, including retries and waits
+        self.deadline = deadline
+        self.breaker_error_rate = breaker_error_rate
+        self.breaker_min_requests = breaker_min_requests
+        self.breaker_window = breaker_window
+        self.breaker_cooldown = breaker_cooldown
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = max(min(min_concurrency, self.max_concurrency), 1)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class ResilienceMetrics:
+    """Counters, gauges and latency samples of one control plane."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, float] = {}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def incr(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {name: round(value, 3) for name, value in self.counters.items()}
+            latencies = sorted(self._latencies)
+        percentiles = {}
+        if latencies:
+            for name, fraction in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+                index = min(int(fraction * len(latencies)), len(latencies) - 1)
+                percentiles[name] = round(latencies[index], 4)
+        return {'counters': counters, 'latency_seconds': percentiles}
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(-self._tokens / self.rate, 0.0)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.burst, self._tokens + elapsed * self.rate)
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker over a sliding time window.
+
+    Opens when at least min_requests outcomes were recorded in the window and
+    the share of failures reaches the threshold. After the cooldown a single
+    probe request is let through; its outcome closes or reopens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, policy: ResiliencePolicy, metrics: ResilienceMetrics):
+        self.policy = policy
+        self.metrics = metrics
+        self.state = self.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        """Raise ApiUnavailableError if requests should not be sent right now."""
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.policy.breaker_cooldown - time.monotonic()
+                if remaining > 0:
+                    self.metrics.incr('circuit_rejections')
+                    raise ApiUnavailableError(
+                        f"Circuit open: control plane error rate is high, retry in {remaining:.1f}s",
+                        retry_after=remaining
+                    )
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info("Circuit half-open, probing control plane")
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self.metrics.incr('circuit_rejections')
+                    raise ApiUnavailableError("Circuit half-open: waiting for probe request", retry_after=1.0)
+                self._probe_in_flight = True
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if success:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                    logger.info("Circuit closed")
+                else:
+                    self._open(now)
+                return
+
+            self._outcomes.append((now, success))
+            while self._outcomes and self._outcomes[0][0] < now - self.policy.breaker_window:
+                self._outcomes.popleft()
+            if self.state == self.CLOSED and len(self._outcomes) >= self.policy.breaker_min_requests:
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if failures / len(self._outcomes) >= self.policy.breaker_error_rate:
+                    self._open(now)
+
+    def abandon_probe(self) -> None:
+        """Forget an in-flight probe whose outcome will never be recorded."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self.metrics.incr('circuit_opened')
+        logger.warning(f"Circuit opened for {self.policy.breaker_cooldown}s")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit: grows by one slot per window of successful
+    requests and halves when the control plane signals overload or times out.
+    """
+
+    def __init__(self, policy: ResiliencePolicy, metrics: ResilienceMetrics):
+        self.policy = policy
+        self.metrics = metrics
+        self.limit = float(policy.max_concurrency)
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, overloaded: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.policy.min_concurrency, self.limit / 2)
+                self.metrics.incr('concurrency_decreases')
+            elif self.limit < self.policy.max_concurrency:
+                self.limit = min(self.policy.max_concurrency, self.limit + 1 / self.limit)
+
+
+class ControlPlaneGuard:
+    """Resilience state for one control plane, shared by sync and async requests."""
+
+    def __init__(self, name: str, policy: ResiliencePolicy):
+        self.name = name
+        self.policy = policy
+        self.metrics = ResilienceMetrics()
+        self.bucket = TokenBucket(policy.rate_limit, policy.burst)
+        self.breaker = CircuitBreaker(policy, self.metrics)
+        self.limiter = AdaptiveConcurrencyLimiter(policy, self.metrics)
+
+    def call(
+        self,
+        send: Callable[[float], Any],
+        timeout: float,
+        retryable_errors: Tuple[Type[BaseException], ...]
+    ) -> Any:
+        """Send a request with send(attempt_timeout), blocking the calling thread while waiting."""
+        deadline = time.monotonic() + self.policy.deadline
+        self.metrics.incr('requests')
+        attempt = 0
+        while True:
+            delay = self._admit(deadline)
+            if delay:
+                time.sleep(delay)
+            if not self.limiter.try_acquire():
+                self.metrics.incr('concurrency_waits')
+                while not self.limiter.try_acquire():
+                    self._check_slot_deadline(deadline)
+                    time.sleep(SLOT_POLL_INTERVAL)
+
+            started = time.monotonic()
+            response, error = None, None
+            try:
+                response = send(self._attempt_timeout(timeout, deadline))
+            except retryable_errors as e:
+                error = e
+            except BaseException:
+                self._complete(started, None, None, attempt, deadline, counted=False)
+                raise
+
+            retry_delay = self._complete(started, response, error, attempt, deadline)
+            if retry_delay is None:
+                if error is not None:
+                    raise error
+                return response
+            attempt += 1
+            time.sleep(retry_delay)
+
+    async def call_async(
+        self,
+        send: Callable[[float], Awaitable[Any]],
+        timeout: float,
+        retryable_errors: Tuple[Type[BaseException], ...]
+    ) -> Any:
+        """Send a request with await send(attempt_timeout) without blocking the event loop."""
+        deadline = time.monotonic() + self.policy.deadline
+        self.metrics.incr('requests')
+        attempt = 0
+        while True:
+            delay = self._admit(deadline)
+            if delay:
+                await asyncio.sleep(delay)
+            if not self.limiter.try_acquire():
+                self.metrics.incr('concurrency_waits')
+                while not self.limiter.try_acquire():
+                    self._check_slot_deadline(deadline)
+                    await asyncio.sleep(SLOT_POLL_INTERVAL)
+
+            started = time.monotonic()
+            response, error = None, None
+            try:
+                response = await send(self._attempt_timeout(timeout, deadline))
+            except retryable_errors as e:
+                error = e
+            except BaseException:
+                self._complete(started, None, None, attempt, deadline, counted=False)
+                raise
+
+            retry_delay = self._complete(started, response, error, attempt, deadline)
+            if retry_delay is None:
+                if error is not None:
+                    raise error
+                return response
+            attempt += 1
+            await asyncio.sleep(retry_delay)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics and state."""
+        return {
+            'control_plane': self.name,
+            'circuit_state': self.breaker.state,
+            'concurrency_limit': int(self.limiter.limit),
+            'in_flight': self.limiter.in_flight,
+            'rate_limit_tokens': round(self.bucket.tokens, 2),
+            **self.metrics.snapshot(),
+        }
+
+    def _admit(self, deadline: float) -> float:
+        """Check the circuit and take a rate-limit token; returns the time to wait."""
+        self.breaker.check()
+        delay = self.bucket.reserve()
+        if delay > 0:
+            self.metrics.incr('rate_limited')
+            self.metrics.incr('rate_limited_wait_seconds', delay)
+            if time.monotonic() + delay > deadline:
+                self.breaker.abandon_probe()
+                raise ApiUnavailableError("Rate limit exceeded for control plane requests", retry_after=delay)
+        return delay
+
+    def _check_slot_deadline(self, deadline: float) -> None:
+        if time.monotonic() >= deadline:
+            self.metrics.incr('concurrency_rejections')
+            self.breaker.abandon_probe()
+            raise ApiUnavailableError("Too many concurrent control plane requests", retry_after=1.0)
+
+    def _attempt_timeout(self, timeout: float, deadline: float) -> float:
+        return max(min(timeout, deadline - time.monotonic()), 0.1)
+
+    def _complete(
+        self,
+        started: float,
+        response: Any,
+        error: Optional[BaseException],
+        attempt: int,
+        deadline: float,
+        counted: bool = True
+    ) -> Optional[float]:
+        """
+        Record the outcome of an attempt.
+
+        Returns:
+            Seconds to wait before retrying, or None if the outcome is final
+        """
+        latency = time.monotonic() - started
+        status = getattr(response, 'status_code', None)
+        failed = error is not None or (status is not None and status >= 500) or status == 429
+        overloaded = error is not None or status in OVERLOAD_STATUSES
+        self.limiter.release(overloaded and counted)
+        if not counted:
+            self.breaker.abandon_probe()
+            return None
+
+        self.breaker.record(not failed)
+        self.metrics.incr('attempts')
+        self.metrics.observe_latency(latency)
+        if error is not None:
+            self.metrics.incr('transport_errors')
+        elif failed:
+            self.metrics.incr('server_errors')
+
+        retryable = error is not None or status in RETRYABLE_STATUSES
+        if not retryable or attempt >= self.policy.max_retries:
+            return None
+
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            delay = retry_after
+            self.metrics.incr('retry_after_honored')
+        else:
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(self.policy.backoff_max, self.policy.backoff_base * 2 ** attempt))
+        if time.monotonic() + delay >= deadline:
+            self.metrics.incr('retries_abandoned')
+            return None
+        self.metrics.incr('retries')
+        logger.info(f"Retrying control plane request in {delay:.2f}s (attempt {attempt + 2})")
+        return delay
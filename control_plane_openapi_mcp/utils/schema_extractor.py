@@ -2,7 +2,7 @@
 Utilities for extracting and matching OpenAPI schemas.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet, List
 
 
 def extract_schema_name_from_ref(ref: str) -> Optional[str]:
@@ -20,9 +20,33 @@ def extract_schema_name_from_ref(ref: str) -> Optional[str]:
     return None
 
 
+def index_component_properties(components_schemas: Dict[str, Any]) -> Dict[FrozenSet[str], str]:
+    """
+    Index object schemas in components by their set of property names.
+    
+    Building the index once lets many inline schemas be matched without
+    scanning all components for each one.
+    
+    Args:
+        components_schemas: All schemas from components/schemas
+    
+    Returns:
+        Mapping of property name sets to the first schema name declaring them
+    """
+    index: Dict[FrozenSet[str], str] = {}
+    for schema_name, schema_def in components_schemas.items():
+        if not isinstance(schema_def, dict):
+            continue
+        if schema_def.get('type') != 'object' or 'properties' not in schema_def:
+            continue
+        index.setdefault(frozenset(schema_def['properties'].keys()), schema_name)
+    return index
+
+
 def match_inline_schema_to_component(
         inline_schema: Dict[str, Any],
-        components_schemas: Dict[str, Any]
+        components_schemas: Dict[str, Any],
+        property_index: Optional[Dict[FrozenSet[str], str]] = None
 ) -> Optional[str]:
     """
     Try to match an inline schema to a named schema in components.
@@ -30,6 +54,7 @@ def match_inline_schema_to_component(
     Args:
         inline_schema: The inline schema definition
         components_schemas: All schemas from components/schemas
+        property_index: Result of index_component_properties, to avoid scanning components
     
     Returns:
         The name of the matching schema or None
@@ -41,6 +66,9 @@ def match_inline_schema_to_component(
     if inline_schema.get('type') != 'object' or 'properties' not in inline_schema:
         return None
 
+    if property_index is not None:
+        return property_index.get(frozenset(inline_schema['properties'].keys()))
+
     inline_props = set(inline_schema['properties'].keys())
 
     # Try to find a matching schema in components
@@ -59,13 +87,18 @@ def match_inline_schema_to_component(
     return None
 
 
-def get_schema_name(schema: Dict[str, Any], components_schemas: Dict[str, Any]) -> Optional[str]:
+def get_schema_name(
+        schema: Dict[str, Any],
+        components_schemas: Dict[str, Any],
+        property_index: Optional[Dict[FrozenSet[str], str]] = None
+) -> Optional[str]:
     """
     Get the schema name from either a $ref or by matching inline schema.
     
     Args:
         schema: The schema object (may contain $ref or be inline)
         components_schemas: All schemas from components/schemas
+        property_index: Result of index_component_properties, to avoid scanning components
     
     Returns:
         The schema name or None
@@ -78,7 +111,7 @@ def get_schema_name(schema: Dict[str, Any], components_schemas: Dict[str, Any])
         return extract_schema_name_from_ref(schema['$ref'])
 
     # Try to match inline schema
-    return match_inline_schema_to_component(schema, components_schemas)
+    return match_inline_schema_to_component(schema, components_schemas, property_index)
 
 
 def enrich_operation_with_schemas(
@@ -131,7 +164,8 @@ def enrich_operation_with_schemas(
 
 def create_safe_operation_output(
         operation: Dict[str, Any],
-        components_schemas: Dict[str, Any]
+        components_schemas: Dict[str, Any],
+        property_index: Optional[Dict[FrozenSet[str], str]] = None
 ) -> Dict[str, Any]:
     """
     Create a safe, serializable operation output with schema names included.
@@ -139,6 +173,7 @@ def create_safe_operation_output(
     Args:
         operation: The full operation dictionary
         components_schemas: All schemas from components/schemas
+        property_index: Result of index_component_properties, shared when rendering many operations
     
     Returns:
         Safe operation dictionary with schema names
@@ -156,7 +191,7 @@ def create_safe_operation_output(
         content = request_body.get('content', {})
         if 'application/json' in content:
             schema = content['application/json'].get('schema', {})
-            schema_name = get_schema_name(schema, components_schemas)
+            schema_name = get_schema_name(schema, components_schemas, property_index)
             if schema_name:
                 request_body_output['schemaName'] = schema_name
 
@@ -173,7 +208,7 @@ def create_safe_operation_output(
             content = response.get('content', {})
             if 'application/json' in content:
                 schema = content['application/json'].get('schema', {})
-                schema_name = get_schema_name(schema, components_schemas)
+                schema_name = get_schema_name(schema, components_schemas, property_index)
                 if schema_name:
                     response_output['schemaName'] = schema_name
 
@@ -190,3 +225,23 @@ def create_safe_operation_output(
         "requestBody": request_body_output,
         "responses": responses_output
     }
+
+
+def referenced_schema_names(rendered_operation: Dict[str, Any]) -> List[str]:
+    """
+    Get the request body and response schema names of a rendered operation.
+    
+    Args:
+        rendered_operation: Output of create_safe_operation_output
+    
+    Returns:
+        The schema names, in order of appearance
+    """
+    names = []
+    request_body = rendered_operation.get('requestBody')
+    if isinstance(request_body, dict) and request_body.get('schemaName'):
+        names.append(request_body['schemaName'])
+    for response in (rendered_operation.get('responses') or {}).values():
+        if isinstance(response, dict) and response.get('schemaName'):
+            names.append(response['schemaName'])
+    return names
@@ -0,0 +1,96 @@
+import copy
+import json
+
+import pytest
+
+
+def _ref(name):
+    return {'$ref': f'#/components/schemas/{name}'}
+
+
+def _json_response(schema):
+    return {'200': {'description': 'OK', 'content': {'application/json': {'schema': schema}}}}
+
+
+SAMPLE_SPEC = {
+    'openapi': '3.0.0',
+    'info': {'title': 'Control Plane', 'version': '1.0', 'description': 'Sample control plane API'},
+    'tags': [{'name': 'Stack'}, {'name': 'Cluster'}],
+    'paths': {
+        '/cc-ui/v1/stacks': {
+            'get': {
+                'operationId': 'getAllStacks',
+                'summary': 'List all stacks',
+                'tags': ['Stack'],
+                'responses': _json_response({'type': 'array', 'items': _ref('Stack')}),
+            },
+            'post': {
+                'operationId': 'createStack',
+                'summary': 'Create a stack',
+                'tags': ['Stack'],
+                'requestBody': {'content': {'application/json': {'schema': _ref('Stack')}}},
+                'responses': _json_response(_ref('Stack')),
+            },
+        },
+        '/cc-ui/v1/stacks/{stackName}': {
+            'parameters': [{'name': 'stackName', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+            'get': {
+                'operationId': 'getStack',
+                'summary': 'Get a stack by name',
+                'tags': ['Stack'],
+                'responses': _json_response(_ref('Stack')),
+            },
+        },
+        '/cc-ui/v1/clusters/{clusterId}': {
+            'get': {
+                'operationId': 'getCluster',
+                'summary': 'Get a cluster',
+                'description': 'Returns the cluster with its release stream',
+                'tags': ['Cluster'],
+                'parameters': [{'name': 'clusterId', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+                'responses': _json_response(_ref('Cluster')),
+            },
+            'delete': {
+                'operationId': 'deleteCluster',
+                'summary': 'Delete a cluster',
+                'tags': ['Cluster'],
+                'parameters': [{'name': 'clusterId', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+                'responses': {'204': {'description': 'Deleted'}},
+            },
+        },
+    },
+    'components': {'schemas': {
+        'Stack': {
+            'type': 'object',
+            'description': 'A stack of resources',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string', 'description': 'Stack name'},
+                'clusters': {'type': 'array', 'items': _ref('Cluster')},
+            },
+        },
+        'Cluster': {
+            'type': 'object',
+            'description': 'A cluster of a stack',
+            'properties': {
+                'id': {'type': 'string'},
+                'stack': _ref('Stack'),
+                'status': _ref('ClusterStatus'),
+            },
+        },
+        'ClusterStatus': {'type': 'string', 'enum': ['RUNNING', 'STOPPED']},
+    }},
+}
+
+
+@pytest.fixture
+def sample_spec():
+    """A small spec with tags, path parameters and a reference cycle (Stack <-> Cluster)."""
+    return copy.deepcopy(SAMPLE_SPEC)
+
+
+@pytest.fixture
+def sample_spec_path(tmp_path, sample_spec):
+    path = tmp_path / 'openapi.json'
+    path.write_text(json.dumps(sample_spec))
+    return str(path)
@@ -0,0 +1,91 @@
+import mmap
+import struct
+
+import pytest
+
+from control_plane_openapi_mcp.core.artifact import (
+    ARTIFACT_FORMAT_VERSION, SpecArtifact, _KeyTable, _pack_table, compile_spec_artifact
+)
+from control_plane_openapi_mcp.core.service import OpenAPIService
+from control_plane_openapi_mcp.core.spec_loader import SpecLoader
+
+
+@pytest.fixture
+def artifact_path(tmp_path, sample_spec_path):
+    path = str(tmp_path / 'spec.idx')
+    compile_spec_artifact(SpecLoader(sample_spec_path), path, 'test')
+    return path
+
+
+@pytest.fixture
+def artifact(artifact_path):
+    artifact = SpecArtifact(artifact_path)
+    yield artifact
+    artifact.close()
+
+
+def test_round_trip_catalog_and_lookups(artifact, sample_spec):
+    catalog = artifact.get_catalog()
+    assert [op.operation_id for op in catalog.operations] == [
+        'getAllStacks', 'createStack', 'getStack', 'getCluster', 'deleteCluster'
+    ]
+    assert artifact.locate_operation('getCluster') == ('/cc-ui/v1/clusters/{clusterId}', 'GET')
+    assert artifact.locate_operation('missing') is None
+    assert artifact.index['spec_version'] == '1.0'
+
+    view = artifact.get_spec_view()
+    # Key tables keep the spec's order for iteration and answer lookups in place
+    assert list(view['paths']) == list(sample_spec['paths'])
+    assert '/cc-ui/v1/stacks' in view['paths'] and '/nope' not in view['paths']
+    assert view['paths']['/cc-ui/v1/stacks']['get']['operationId'] == 'getAllStacks'
+    assert view['components']['schemas']['ClusterStatus']['enum'] == ['RUNNING', 'STOPPED']
+    assert artifact.get_raw_schemas()['Cluster']['properties']['stack'] == {'$ref': '#/components/schemas/Stack'}
+    assert artifact.get_rendered_operation('/cc-ui/v1/stacks/{stackName}', 'get') is not None
+    assert artifact.get_rendered_operation('/nope', 'get') is None
+
+
+def test_prebuilt_indexes(artifact):
+    assert artifact.get_schema_graph() is not None
+    field_index = artifact.get_field_index()
+    assert set(field_index.operations_with('parameters', 'clusterId')) == {
+        'GET /cc-ui/v1/clusters/{clusterId}', 'DELETE /cc-ui/v1/clusters/{clusterId}'
+    }
+
+
+def test_key_table_lookup_of_unsorted_keys(tmp_path):
+    items = {'b': [1, 2], 'a': [3, 4], 'ä': [5, 6], 'ab': 'value'}
+    packed, descriptor = _pack_table(items, 0)
+    path = tmp_path / 'table'
+    path.write_bytes(packed)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        table = _KeyTable(buffer, descriptor)
+        assert list(table) == ['b', 'a', 'ä', 'ab']
+        assert table['a'] == [3, 4] and table['ä'] == [5, 6]
+        assert table.read_value('ab') == b'value'
+        assert 'c' not in table and table.get('c') is None
+
+
+def test_rejects_other_files_and_versions(tmp_path, artifact_path):
+    not_artifact = tmp_path / 'other.idx'
+    not_artifact.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError, match='not a spec artifact'):
+        SpecArtifact(str(not_artifact))
+
+    data = bytearray(open(artifact_path, 'rb').read())
+    struct.pack_into('<I', data, 8, ARTIFACT_FORMAT_VERSION + 1)
+    old_version = tmp_path / 'old.idx'
+    old_version.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match='Unsupported artifact format version'):
+        SpecArtifact(str(old_version))
+
+
+def test_service_answers_the_same_from_artifact_and_spec(artifact_path, sample_spec_path):
+    from_spec = OpenAPIService(sample_spec_path, 'test')
+    from_artifact = OpenAPIService('unused', 'test', artifact_path=artifact_path)
+    for service in (from_spec, from_artifact):
+        assert service.find_operation_by_id('deleteCluster').method == 'DELETE'
+        operation = service.find_operation_by_path_and_method('/cc-ui/v1/stacks/prod', 'GET')
+        assert operation.path == '/cc-ui/v1/stacks/{stackName}'
+        assert service.find_schema_by_name('Cluster').name == 'Cluster'
+    assert from_spec.render_operation(from_spec.find_operation_by_id('getCluster')) == \
+        from_artifact.render_operation(from_artifact.find_operation_by_id('getCluster'))
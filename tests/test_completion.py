@@ -0,0 +1,53 @@
+import pytest
+
+from control_plane_openapi_mcp.core.completion import CompletionIndex
+
+
+@pytest.fixture
+def index():
+    return CompletionIndex({
+        'operation_id': ['getStack', 'getStackOutputs', 'getStacks', 'getCluster', 'deleteStack'],
+        'schema': ['StackDTO', 'Stack_Summary', 'ClusterDTO'],
+        'path': ['/cc-ui/v1/stacks', '/cc-ui/v1/stacks/{stackName}', '/cc-ui/v1/clusters/{clusterId}'],
+    })
+
+
+def test_completes_identifiers_case_insensitively(index):
+    result = index.complete('getstack')
+    assert result['total'] == 3
+    assert [c['value'] for c in result['completions']] == ['getStack', 'getStackOutputs', 'getStacks']
+    assert [(b['prefix'], b['count']) for b in result['branches']] == [
+        ('getStack', 1), ('getStackOutputs', 1), ('getStacks', 1)
+    ]
+
+
+def test_prefix_spans_operations_and_schemas_with_limit(index):
+    result = index.complete('stack', limit=1)
+    assert result['total'] == 2
+    assert result['completions'] == [{'value': 'Stack_Summary', 'kind': 'schema'}]
+    assert [(b['prefix'], b['count']) for b in result['branches']] == [('Stack_Summary', 1), ('StackDTO', 1)]
+
+
+def test_paths_branch_at_segments(index):
+    result = index.complete('/cc-ui/v1/')
+    assert result['total'] == 3
+    assert all(c['kind'] == 'path' for c in result['completions'])
+    assert [(b['prefix'], b['count']) for b in result['branches']] == [
+        ('/cc-ui/v1/clusters/', 1), ('/cc-ui/v1/stacks', 2)
+    ]
+
+
+def test_unknown_kind_and_no_match(index):
+    with pytest.raises(ValueError, match='Unknown identifier kind'):
+        index.complete('get', kind='tag')
+    assert index.complete('zzz') == {'prefix': 'zzz', 'total': 0, 'completions': [], 'branches': []}
+    assert index.complete('get', kind='schema')['total'] == 0
+
+
+def test_from_catalog(sample_spec_path):
+    from control_plane_openapi_mcp.core.service import OpenAPIService
+    service = OpenAPIService(sample_spec_path, 'test')
+    service.initialize()
+    index = CompletionIndex.from_catalog(service._catalog)
+    assert [c['value'] for c in index.complete('getc')['completions']] == ['getCluster']
+    assert index.complete('/cc-ui/v1/s')['total'] == 2
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from control_plane_openapi_mcp.utils.compression import DictionaryCodec
+
+
+BLOBS = [
+    json.dumps({'operationId': f'getStack{i}', 'summary': 'Get a stack by name', 'tags': ['Stack']}).encode()
+    for i in range(50)
+]
+
+
+@pytest.mark.parametrize('name', ['zlib', 'none'])
+def test_round_trip(name):
+    codec = DictionaryCodec.train(BLOBS, name)
+    compressed = [codec.compress(blob) for blob in BLOBS]
+    assert [codec.decompress(blob) for blob in compressed] == BLOBS
+
+
+def test_dictionary_shrinks_small_blobs():
+    plain = DictionaryCodec('zlib')
+    trained = DictionaryCodec.train(BLOBS, 'zlib')
+    assert sum(len(trained.compress(blob)) for blob in BLOBS) < sum(len(plain.compress(blob)) for blob in BLOBS)
+
+
+def test_reused_contexts_give_identical_output():
+    codec = DictionaryCodec.train(BLOBS, 'zlib')
+    assert codec.compress(BLOBS[0]) == codec.compress(BLOBS[0])
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        DictionaryCodec('lz4')
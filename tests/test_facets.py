@@ -0,0 +1,31 @@
+from control_plane_openapi_mcp.core.facets import FacetIndex, iter_bits
+from control_plane_openapi_mcp.core.models import SpecOperationEntry
+
+
+OPERATIONS = [
+    SpecOperationEntry(path='/cc-ui/v1/clusters', method='GET', operation_id='listClusters', tags=['Cluster']),
+    SpecOperationEntry(path='/cc-ui/v1/clusters', method='POST', operation_id='createCluster', tags=['Cluster']),
+    SpecOperationEntry(path='/cc-ui/v1/stacks/{stackName}', method='GET', operation_id='getStack', tags=['Stack']),
+]
+
+
+def test_iter_bits():
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(0)) == []
+
+
+def test_facet_filters():
+    facets = FacetIndex(OPERATIONS)
+    assert facets.filter() is None
+    assert facets.positions(facets.filter(method='get')) == [0, 2]
+    assert facets.positions(facets.filter(tag='cluster', method='POST,PUT')) == [1]
+    assert facets.positions(facets.filter(path_prefix='/cc-ui/v1/stacks')) == [2]
+    assert facets.filter(tag='unknown') == 0
+
+
+def test_partial_path_prefix_and_tag_names():
+    facets = FacetIndex(OPERATIONS)
+    assert facets.positions(facets.filter(path_prefix='/cc-ui/v1/clus')) == [0, 1]
+    assert facets.filter(path_prefix='/cc-ui/v1/clus/') == 0
+    assert [op.operation_id for op in facets.select(facets.filter(tag='STACK'), OPERATIONS)] == ['getStack']
+    assert facets.tag_names() == ['Cluster', 'Stack']
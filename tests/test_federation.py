@@ -0,0 +1,84 @@
+from control_plane_openapi_mcp.core.federation import merge_specs, split_sources
+
+
+def document(schemas, paths=None):
+    return {
+        'openapi': '3.0.0',
+        'info': {'title': 'api', 'version': '1'},
+        'paths': paths or {},
+        'components': {'schemas': schemas},
+    }
+
+
+def ref(name):
+    return {'$ref': f'#/components/schemas/{name}'}
+
+
+def test_split_sources():
+    assert split_sources(' a.json, ,b.json ') == ['a.json', 'b.json']
+
+
+def test_identical_components_are_kept_once():
+    shared = {'Id': {'type': 'string'}}
+    merged = merge_specs([('a', document(dict(shared))), ('b', document(dict(shared)))])
+    assert merged['components']['schemas'] == shared
+
+
+def test_rename_cascades_to_referencing_components():
+    first = document({
+        'Status': {'type': 'string', 'enum': ['UP']},
+        'Cluster': {'type': 'object', 'properties': {'status': ref('Status')}},
+        'Stack': {'type': 'object', 'properties': {'cluster': ref('Cluster')}},
+        'Other': {'type': 'integer'},
+    })
+    second = document({
+        'Status': {'type': 'string', 'enum': ['UP', 'DOWN']},
+        'Cluster': {'type': 'object', 'properties': {'status': ref('Status')}},
+        'Stack': {'type': 'object', 'properties': {'cluster': ref('Cluster')}},
+        'Other': {'type': 'integer'},
+    }, paths={'/stacks': {'get': {'responses': {'200': {'content': {
+        'application/json': {'schema': ref('Stack')}
+    }}}}}})
+
+    merged = merge_specs([('main', first), ('ops', second)])
+    schemas = merged['components']['schemas']
+
+    # Status differs; Cluster and Stack differ only through references to it
+    assert set(schemas) == {'Status', 'Cluster', 'Stack', 'Other', 'ops.Status', 'ops.Cluster', 'ops.Stack'}
+    assert schemas['ops.Cluster']['properties']['status'] == ref('ops.Status')
+    assert schemas['ops.Stack']['properties']['cluster'] == ref('ops.Cluster')
+    assert schemas['Cluster']['properties']['status'] == ref('Status')
+    response = merged['paths']['/stacks']['get']['responses']['200']['content']['application/json']
+    assert response['schema'] == ref('ops.Stack')
+
+
+def test_first_document_wins_operations_and_operation_ids_are_namespaced():
+    first = document({}, paths={'/a': {'get': {'operationId': 'list', 'summary': 'first'}}})
+    second = document({}, paths={
+        '/a': {'get': {'operationId': 'list', 'summary': 'second'}},
+        '/b': {'get': {'operationId': 'list'}},
+    })
+    merged = merge_specs([('one', first), ('two', second)])
+    assert merged['paths']['/a']['get']['summary'] == 'first'
+    assert merged['paths']['/b']['get']['operationId'] == 'two.list'
+
+
+def test_federated_loader_merges_local_documents(tmp_path, sample_spec_path):
+    import json
+    from control_plane_openapi_mcp.core.federation import FederatedSpecLoader, create_spec_loader
+    from control_plane_openapi_mcp.core.service import OpenAPIService
+
+    releases = tmp_path / 'releases.json'
+    releases.write_text(json.dumps(document(
+        {'Stack': {'type': 'object', 'properties': {'release': {'type': 'string'}}}},
+        paths={'/cc-ui/v1/releases': {'get': {'operationId': 'getAllStacks', 'responses': {}}}},
+    )))
+    sources = f'{sample_spec_path}, {releases}'
+    loader = create_spec_loader(sources)
+    assert isinstance(loader, FederatedSpecLoader)
+
+    service = OpenAPIService(sources, 'test')
+    assert service.find_operation_by_id('releases.getAllStacks').path == '/cc-ui/v1/releases'
+    assert service.find_operation_by_id('getAllStacks').path == '/cc-ui/v1/stacks'
+    assert service.find_schema_by_name('releases.Stack') is not None
+    assert service.get_status()['documents'] == ['openapi', 'releases']
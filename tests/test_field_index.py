@@ -0,0 +1,45 @@
+from control_plane_openapi_mcp.core.field_index import FieldIndex, normalize_field_name
+
+
+def test_normalize_field_name():
+    assert normalize_field_name('release_trace-id') == normalize_field_name('releaseTraceId')
+
+
+def test_properties_are_indexed_with_paths():
+    schemas = {
+        'Release': {'type': 'object', 'properties': {
+            'traceId': {'type': 'string'},
+            'steps': {'type': 'array', 'items': {'type': 'object', 'properties': {
+                'status': {'type': 'string', 'enum': ['DONE', 'FAILED']},
+            }}},
+        }},
+    }
+    index = FieldIndex.from_spec({'paths': {}}, schemas)
+    assert index.lookup('properties', 'trace_id') == [{'schema': 'Release', 'path': 'traceId', 'type': 'string'}]
+    assert index.lookup('properties', 'steps.status') == []
+    assert [p['path'] for p in index.lookup('properties', 'steps[].status')] == ['steps[].status']
+    assert index.schemas_with('enums', 'failed') == {
+        'Release': [{'schema': 'Release', 'path': 'steps[].status', 'value': 'FAILED'}]
+    }
+
+
+def test_operation_parameters_override_path_item_parameters():
+    spec = {'paths': {'/stacks/{name}': {
+        'parameters': [
+            {'name': 'name', 'in': 'path', 'required': False},
+            {'name': 'verbose', 'in': 'query'},
+        ],
+        'get': {'parameters': [
+            {'name': 'name', 'in': 'path', 'required': True},
+            {'name': 'name', 'in': 'query'},
+        ]},
+        'delete': {},
+    }}}
+    index = FieldIndex.from_spec(spec, {})
+    operations = index.operations_with('parameters', 'name')
+    assert operations['GET /stacks/{name}'] == [
+        {'operation': 'GET /stacks/{name}', 'parameter': 'name', 'in': 'path', 'required': True},
+        {'operation': 'GET /stacks/{name}', 'parameter': 'name', 'in': 'query', 'required': False},
+    ]
+    assert len(operations['DELETE /stacks/{name}']) == 1
+    assert set(index.operations_with('parameters', 'verbose')) == {'GET /stacks/{name}', 'DELETE /stacks/{name}'}
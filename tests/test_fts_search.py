@@ -0,0 +1,91 @@
+import pytest
+
+from control_plane_openapi_mcp.core.fts_search import FtsSearchEngine, build_match_expression, short_terms
+from control_plane_openapi_mcp.core.models import SpecCatalogEntry, SpecOperationEntry, SpecSchemaEntry
+
+pytestmark = pytest.mark.skipif(not FtsSearchEngine.is_available(), reason='SQLite without FTS5 trigram tokenizer')
+
+
+def things(count=20):
+    return SpecCatalogEntry(
+        spec_id='test',
+        operations=[
+            SpecOperationEntry(
+                path=f"/api/v{1 if i < 10 else 2}/things/{i}",
+                method='GET',
+                operation_id=f'getThing{i}',
+                summary=f'Get thing {i}',
+                tags=['Things'],
+            )
+            for i in range(count)
+        ],
+        schemas=[SpecSchemaEntry(name='IdDTO'), SpecSchemaEntry(name='ThingDTO', description='A thing')],
+    )
+
+
+RELEASES = SpecCatalogEntry(
+    spec_id='test',
+    operations=[SpecOperationEntry(path='/api/v1/releases', method='GET', operation_id='listReleases')],
+)
+
+
+@pytest.fixture
+def engine():
+    engine = FtsSearchEngine('test', ':memory:')
+    engine.index_catalog(things())
+    yield engine
+    engine.close()
+
+
+def test_match_expression_and_short_terms():
+    assert build_match_expression('Get id') == '"get"'
+    assert build_match_expression('a 1') is None
+    assert short_terms('get thing 3 v2 v2 things') == ['3', 'v2']
+
+
+def test_ranks_by_trigrams(engine):
+    assert engine.search_operations('thing', limit=1)[0].operation_id.startswith('getThing')
+    assert engine.search_schemas('thingdto')[0].name == 'ThingDTO'
+
+
+def test_short_terms_rank_matching_operations_first(engine):
+    assert [op.operation_id for op in engine.search_operations('get thing 3', limit=2)] == ['getThing3', 'getThing13']
+    assert {op.operation_id for op in engine.search_operations('v2')} == {f'getThing{i}' for i in range(10, 20)}
+    assert [schema.name for schema in engine.search_schemas('id')] == ['IdDTO']
+
+
+def test_candidates_and_pagination(engine):
+    assert [op.operation_id for op in engine.search_operations('get thing 3', candidates=[1, 2, 13], limit=1)] == \
+        ['getThing13']
+    first, second = engine.search_operations('thing', limit=1), engine.search_operations('thing', limit=1, offset=1)
+    assert first != second
+
+
+def test_blank_query_lists_operations(engine):
+    assert len(engine.search_operations('')) == 20
+    assert [op.operation_id for op in engine.search_operations('', limit=2, candidates=[5, 6, 7])] == \
+        ['getThing5', 'getThing6']
+
+
+def test_multi_query_ranks_each_query(engine):
+    ranked = engine.search_operations_multi(['get thing 3', 'v2'], 2, candidates=list(range(15)))
+    assert [position for position, _ in ranked[0]] == [3, 13]
+    assert [position for position, _ in ranked[1]] == [10, 11]
+
+
+def test_index_is_scoped_by_catalog(tmp_path):
+    db_path = str(tmp_path / 'search.sqlite3')
+    first = FtsSearchEngine('test', db_path)
+    first.index_catalog(things())
+    second = FtsSearchEngine('test', db_path)
+    second.index_catalog(RELEASES)
+
+    # Processes serving different catalogs only see their own rows in the shared file
+    assert [op.operation_id for op in second.search_operations('get')] == []
+    assert [op.operation_id for op in second.search_operations('releases')] == ['listReleases']
+    assert len(first.search_operations('things')) == 20
+
+    reopened = FtsSearchEngine('test', db_path)
+    reopened.index_catalog(things())
+    assert reopened.catalog_hash == first.catalog_hash
+    assert reopened.search_operations('get thing 3', limit=1)[0].operation_id == 'getThing3'
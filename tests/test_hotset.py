@@ -0,0 +1,71 @@
+import json
+
+from control_plane_openapi_mcp.core.hotset import DECAY, HotSet, catalog_fingerprint
+from control_plane_openapi_mcp.core.models import SpecCatalogEntry, SpecOperationEntry
+
+
+def test_counts_persist_with_decay_under_salted_hashes(tmp_path):
+    path = str(tmp_path / 'hotset.json')
+    hot_set = HotSet(path, save_interval=3600)
+    for _ in range(3):
+        hot_set.record('schemas', 'Stack')
+    hot_set.record('schemas', 'Cluster')
+    hot_set.save()
+
+    content = open(path).read()
+    assert 'Stack' not in content and 'Cluster' not in content
+
+    restarted = HotSet(path)
+    assert restarted.key('Stack') == hot_set.key('Stack')
+    assert restarted.top('schemas', 1) == [hot_set.key('Stack')]
+    assert restarted._counts['schemas'][hot_set.key('Stack')] == 3 * DECAY
+    assert restarted.snapshot() == {'operations': 0, 'schemas': 2, 'queries': 0}
+
+
+def test_rarely_used_entries_fade_out(tmp_path):
+    path = tmp_path / 'hotset.json'
+    path.write_text(json.dumps({'version': 1, 'salt': 'x', 'schemas': {'old': 0.6, 'hot': 10}}))
+    hot_set = HotSet(str(path))
+    assert hot_set.top('schemas', 5) == ['hot']
+
+
+def test_query_results_are_reused_only_for_the_same_catalog(tmp_path):
+    path = str(tmp_path / 'hotset.json')
+    hot_set = HotSet(path)
+    hot_set.record_key('queries', 'q1', 'fingerprint-a', [3, 1])
+    hot_set.record_key('queries', 'q2', 'fingerprint-a', list(range(1000)))
+    hot_set.save()
+
+    restarted = HotSet(path)
+    assert restarted.query_results('fingerprint-a', 10) == {'q1': [3, 1]}
+    assert restarted.query_results('fingerprint-b', 10) == {}
+
+
+def test_saves_only_the_most_frequent_entries(tmp_path):
+    path = str(tmp_path / 'hotset.json')
+    hot_set = HotSet(path, max_entries=1)
+    hot_set.record('operations', 'GET /a')
+    hot_set.record('operations', 'GET /b')
+    hot_set.record('operations', 'GET /b')
+    hot_set.save()
+    assert list(json.load(open(path))['operations']) == [hot_set.key('GET /b')]
+
+
+def test_ignores_unreadable_or_other_version_files(tmp_path):
+    path = tmp_path / 'hotset.json'
+    path.write_text('{not json')
+    assert HotSet(str(path)).snapshot()['schemas'] == 0
+    path.write_text(json.dumps({'version': 0, 'salt': 'x', 'schemas': {'k': 5}}))
+    assert HotSet(str(path)).snapshot()['schemas'] == 0
+
+
+def test_catalog_fingerprint_tracks_catalog_and_backend():
+    catalog = SpecCatalogEntry(
+        spec_id='test', operations=[SpecOperationEntry(path='/a', method='GET', operation_id='getA')]
+    )
+    changed = SpecCatalogEntry(
+        spec_id='test', operations=[SpecOperationEntry(path='/a', method='GET', operation_id='listA')]
+    )
+    assert catalog_fingerprint(catalog, 'fuzzy') == catalog_fingerprint(catalog, 'fuzzy')
+    assert catalog_fingerprint(catalog, 'fuzzy') != catalog_fingerprint(catalog, 'FtsSearchEngine')
+    assert catalog_fingerprint(catalog) != catalog_fingerprint(changed)
@@ -0,0 +1,106 @@
+import json
+import time
+
+from control_plane_openapi_mcp.utils.output import META_KEY, OutputShaper, estimate_tokens
+
+
+def payload(count=200):
+    return {'items': [{'id': i, 'name': f'item-{i}', 'description': 'x' * 40} for i in range(count)]}
+
+
+def test_small_payload_is_indented_with_meta():
+    output = OutputShaper(1000).render({'a': 1})
+    assert output.startswith('{\n')
+    meta = json.loads(output)[META_KEY]
+    assert 'degradations' not in meta
+    assert meta['budget_tokens'] == 1000
+
+
+def test_non_dict_payload_has_no_meta():
+    assert json.loads(OutputShaper(1000).render([1, 2])) == [1, 2]
+
+
+def test_degrades_to_fit_budget():
+    shaper = OutputShaper(1000)
+    output = shaper.render(payload())
+    result = json.loads(output)
+    meta = result[META_KEY]
+    assert meta['degradations'] == ['compact', 'descriptions_dropped', 'lists_truncated']
+    assert estimate_tokens(output) <= 1000
+    assert 'description' not in result['items'][0]
+
+    truncated = meta['truncated'][0]
+    assert truncated['path'] == 'items'
+    assert truncated['total'] == 200
+    assert truncated['returned'] == len(result['items'])
+
+
+def test_zero_budget_is_unlimited():
+    result = json.loads(OutputShaper(1000).render(payload(), max_tokens=0))
+    assert len(result['items']) == 200
+    assert result[META_KEY]['budget_tokens'] is None
+
+
+def test_continuation_returns_remaining_items():
+    shaper = OutputShaper(1000)
+    first = json.loads(shaper.render(payload()))
+    cursor = first[META_KEY]['truncated'][0]['cursor']
+    rest = json.loads(shaper.continuation(cursor, max_tokens=0))
+    assert rest['offset'] == len(first['items'])
+    assert [item['id'] for item in rest['items']] == list(range(len(first['items']), 200))
+    assert shaper.continuation('unknown') is None
+
+
+def test_continuations_are_bounded_least_recently_used_first():
+    shaper = OutputShaper(1000, max_continuations=2)
+    cursors = [json.loads(shaper.render(payload()))[META_KEY]['truncated'][0]['cursor'] for _ in range(3)]
+    assert shaper.continuation(cursors[0], max_tokens=0) is None
+    assert shaper.continuation(cursors[2], max_tokens=0) is not None
+
+
+def test_continuations_are_bounded_by_bytes():
+    shaper = OutputShaper(1000, max_continuation_bytes=100)
+    result = json.loads(shaper.render(payload()))
+    assert result[META_KEY]['truncated'][0]['cursor'] is None
+
+
+def test_expired_continuations_are_swept_on_set():
+    shaper = OutputShaper(1000, continuation_ttl=0)
+    cursor = json.loads(shaper.render(payload()))[META_KEY]['truncated'][0]['cursor']
+    time.sleep(0.01)
+    shaper.render(payload())
+    assert cursor not in shaper._continuations
+    assert len(shaper._continuations) == 1
+
+
+def test_schema_properties_named_description_are_kept():
+    schema = {
+        'description': 'A release',
+        'required': ['description'],
+        'properties': {
+            'description': {'type': 'string', 'description': 'Release notes'},
+            'properties': {'type': 'object', 'properties': {'description': {'type': 'string'}}},
+        },
+    }
+    result = json.loads(OutputShaper(100).render({'schema': schema, 'padding': 'x' * 400}))
+    assert 'descriptions_dropped' in result[META_KEY]['degradations']
+    rendered = result['schema']
+    assert 'description' not in rendered
+    assert rendered['required'] == ['description']
+    assert rendered['properties']['description'] == {'type': 'string'}
+    assert rendered['properties']['properties']['properties'] == {'description': {'type': 'string'}}
+
+
+def test_api_data_keeps_descriptions():
+    shaper = OutputShaper(1000)
+    data = payload()
+    result = json.loads(shaper.render({'data': data['items']}, drop_descriptions=False))
+    meta = result[META_KEY]
+    assert meta['degradations'] == ['compact', 'lists_truncated']
+    assert result['data'][0]['description'] == 'x' * 40
+    # The caller's data is not cut in place
+    assert len(data['items']) == 200
+
+    rest = json.loads(shaper.continuation(meta['truncated'][0]['cursor'], max_tokens=100))
+    assert 'descriptions_dropped' not in rest[META_KEY]['degradations']
+    assert rest['items'][0]['description'] == 'x' * 40
@@ -0,0 +1,138 @@
+import asyncio
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from control_plane_openapi_mcp.core.pagination import (
+    PageFetchError, PaginationSpec, collect_pages, detect_pagination, extract_page
+)
+
+
+def fake_server(style, total=95, cap=None, default_size=20, totals=True, fail_page=None):
+    """Page fetcher serving `total` items, capping the page size at `cap`."""
+    data = list(range(total))
+    requests = []
+
+    async def fetch(path):
+        requests.append(path)
+        query = dict(parse_qsl(urlsplit(path).query))
+        size = int(query.get('size', default_size))
+        if cap:
+            size = min(size, cap)
+        if style == 'page':
+            page = int(query.get('page', 0))
+            if page == fail_page:
+                return 500, {'error': 'boom'}
+            start = page * size
+        elif style == 'offset':
+            start = int(query.get('offset', 0))
+        else:
+            start = int(query.get('cursor', 0))
+        body = {'content': data[start:start + size]}
+        if totals:
+            body['totalElements'] = total
+            body['totalPages'] = -(-total // size)
+        if style == 'cursor' and start + size < total:
+            body['nextCursor'] = str(start + size)
+        return 200, body
+
+    return fetch, requests
+
+
+def collect(fetch, spec, max_items=1000, page_size=None):
+    return asyncio.run(collect_pages(fetch, '/items', spec, max_items, page_size))
+
+
+@pytest.mark.parametrize('totals', [True, False])
+@pytest.mark.parametrize('size_param', ['size', None])
+def test_short_pages_served_below_requested_size(totals, size_param):
+    fetch, _ = fake_server('page', cap=20, totals=totals)
+    result = collect(fetch, PaginationSpec('page', 'page', size_param))
+    assert result['items'] == list(range(95))
+    assert result['pagination']['page_size'] == 20
+    assert result['pagination']['truncated'] is False
+
+
+@pytest.mark.parametrize('totals', [True, False])
+def test_offsets_follow_capped_page_size(totals):
+    fetch, _ = fake_server('offset', cap=30, totals=totals)
+    result = collect(fetch, PaginationSpec('offset', 'offset', 'size'))
+    assert result['items'] == list(range(95))
+    assert result['pagination']['page_size'] == 30
+
+
+def test_uncapped_pages_use_requested_size():
+    fetch, requests = fake_server('page')
+    result = collect(fetch, PaginationSpec('page', 'page', 'size'), page_size=40)
+    assert result['items'] == list(range(95))
+    assert result['pagination']['page_size'] == 40
+    assert len(requests) == 3
+
+
+def test_single_short_page_with_totals_needs_one_request():
+    fetch, requests = fake_server('page', total=7)
+    result = collect(fetch, PaginationSpec('page', 'page', 'size'))
+    assert result['items'] == list(range(7))
+    assert len(requests) == 1
+
+
+def test_truncated_when_known_total_exceeds_items():
+    fetch, _ = fake_server('page', cap=20)
+    result = collect(fetch, PaginationSpec('page', 'page', 'size'), max_items=50)
+    assert len(result['items']) == 50
+    assert result['pagination']['truncated'] is True
+    assert result['pagination']['total_items'] == 95
+
+
+def test_cursor_pages_are_followed():
+    fetch, _ = fake_server('cursor', totals=False)
+    result = collect(fetch, PaginationSpec('cursor', 'cursor', 'size'), page_size=25)
+    assert result['items'] == list(range(95))
+    assert result['pagination']['truncated'] is False
+
+
+def test_failed_page_raises():
+    fetch, _ = fake_server('page', fail_page=2)
+    with pytest.raises(PageFetchError) as excinfo:
+        collect(fetch, PaginationSpec('page', 'page', 'size'), page_size=20)
+    assert excinfo.value.status_code == 500
+
+
+def test_detect_pagination_styles():
+    def operation(*names, **schemas):
+        return {'parameters': [
+            {'name': name, 'in': 'query', 'schema': schemas.get(name, {})} for name in names
+        ]}
+
+    spec = detect_pagination(operation('page', 'size', page={'minimum': 1}, size={'maximum': 50}))
+    assert (spec.style, spec.param, spec.size_param, spec.first_page, spec.max_page_size) == \
+        ('page', 'page', 'size', 1, 50)
+    assert detect_pagination(operation('offset', 'limit')).style == 'offset'
+    assert detect_pagination(operation('pageToken', 'pageSize')).style == 'cursor'
+    assert detect_pagination(operation('name')) is None
+
+
+def test_extract_page():
+    assert extract_page([1, 2])['items'] == [1, 2]
+    page = extract_page({'results': [1], 'total': 9, 'nextToken': 'abc'})
+    assert (page['items'], page['total_items'], page['next_cursor']) == ([1], 9, 'abc')
+    assert extract_page({'value': 1}) is None
+
+
+def test_echoed_cursor_stops_paging():
+    requests = []
+
+    async def fetch(path):
+        requests.append(path)
+        cursor = dict(parse_qsl(urlsplit(path).query)).get('after')
+        # Answers every request with the first cursor again
+        return 200, {'items': [cursor or 'first'], 'nextCursor': 'abc'}
+
+    result = collect(fetch, PaginationSpec('cursor', 'after'), max_items=100)
+    assert result['items'] == ['first', 'abc']
+    assert len(requests) == 2
+    assert result['pagination']['truncated'] is False
+
+
+def test_bare_cursor_field_is_not_a_next_cursor():
+    assert extract_page({'items': [1], 'cursor': 'abc'})['next_cursor'] is None
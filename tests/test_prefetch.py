@@ -0,0 +1,87 @@
+import threading
+
+from control_plane_openapi_mcp.core.prefetch import RenderCache, SchemaPrefetcher
+
+
+def test_render_cache_evicts_least_recently_used_by_bytes():
+    cache = RenderCache(10)
+    assert cache.put('a', 'A', 4) and cache.put('b', 'B', 4)
+    assert cache.get('a') == 'A'
+    cache.put('c', 'C', 4)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert not cache.put('big', 'X', 11)
+    assert cache.get('b') is None
+    snapshot = cache.snapshot()
+    assert (snapshot['entries'], snapshot['bytes'], snapshot['evictions']) == (2, 8, 1)
+    assert (snapshot['hits'], snapshot['misses']) == (1, 1)
+
+
+def test_prefetched_entries_count_a_hit_once():
+    cache = RenderCache(100)
+    cache.put('a', 'A', 1, prefetched=True)
+    cache.get('a')
+    cache.get('a')
+    assert cache.snapshot()['prefetch_hits'] == 1
+
+
+def test_prefetcher_renders_into_the_cache_and_skips_known_keys():
+    cache = RenderCache(100)
+    prefetcher = SchemaPrefetcher(cache, workers=1)
+    release = threading.Event()
+    calls = []
+
+    def render():
+        calls.append(1)
+        release.wait(5)
+        return 'Stack', 5
+
+    prefetcher.schedule('Stack', render)
+    # Already being rendered
+    prefetcher.schedule('Stack', render)
+    release.set()
+    prefetcher._executor.shutdown(wait=True)
+
+    assert cache.get('Stack') == 'Stack'
+    assert len(calls) == 1
+    snapshot = prefetcher.snapshot()
+    assert (snapshot['scheduled'], snapshot['rendered'], snapshot['skipped'], snapshot['pending']) == (1, 1, 1, 0)
+    assert snapshot['hit_rate'] == 1.0
+
+    # Scheduling after shutdown is a no-op
+    prefetcher.schedule('Cluster', render)
+    assert prefetcher.snapshot()['pending'] == 0
+
+
+def test_prefetcher_drops_requests_beyond_max_pending_and_counts_failures():
+    cache = RenderCache(100)
+    prefetcher = SchemaPrefetcher(cache, workers=1, max_pending=1)
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError('boom')
+
+    prefetcher.schedule('a', fail)
+    prefetcher.schedule('b', lambda: ('B', 1))
+    release.set()
+    prefetcher._executor.shutdown(wait=True)
+    snapshot = prefetcher.snapshot()
+    assert (snapshot['dropped'], snapshot['failed'], snapshot['rendered']) == (1, 1, 0)
+    assert 'a' not in cache and 'b' not in cache
+
+
+def test_service_prefetches_schemas_and_their_dependencies(sample_spec_path):
+    from control_plane_openapi_mcp.core.service import OpenAPIService
+
+    service = OpenAPIService(sample_spec_path, 'test')
+    # Not loaded yet: nothing is scheduled
+    service.prefetch_schemas(['Cluster'])
+    assert service.prefetcher.scheduled == 0
+
+    service.initialize()
+    service.prefetch_schemas(['Cluster'])
+    service.prefetcher._executor.shutdown(wait=True)
+    assert service.prefetcher.rendered == 3
+    assert service.render_schema('Stack').schema['properties']['name']['type'] == 'string'
+    assert service.render_cache.snapshot()['prefetch_hits'] == 1
+    service.close()
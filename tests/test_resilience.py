@@ -0,0 +1,102 @@
+import pytest
+
+from control_plane_openapi_mcp.utils.resilience import (
+    AdaptiveConcurrencyLimiter, ApiUnavailableError, CircuitBreaker, ResilienceMetrics, ResiliencePolicy,
+    TokenBucket, parse_retry_after
+)
+
+
+def breaker(cooldown=60.0):
+    policy = ResiliencePolicy(breaker_error_rate=0.5, breaker_min_requests=4, breaker_cooldown=cooldown)
+    return CircuitBreaker(policy, ResilienceMetrics())
+
+
+def test_breaker_opens_at_error_rate():
+    circuit = breaker()
+    for success in (True, False, True):
+        circuit.record(success)
+    assert circuit.state == CircuitBreaker.CLOSED
+    circuit.record(False)
+    assert circuit.state == CircuitBreaker.OPEN
+    with pytest.raises(ApiUnavailableError) as excinfo:
+        circuit.check()
+    assert excinfo.value.retry_after > 0
+    assert circuit.metrics.counters['circuit_rejections'] == 1
+
+
+def test_breaker_stays_closed_below_min_requests():
+    circuit = breaker()
+    for _ in range(3):
+        circuit.record(False)
+    assert circuit.state == CircuitBreaker.CLOSED
+
+
+def open_breaker(cooldown=0.0):
+    circuit = breaker(cooldown)
+    for _ in range(4):
+        circuit.record(False)
+    assert circuit.state == CircuitBreaker.OPEN
+    return circuit
+
+
+def test_half_open_lets_one_probe_through():
+    circuit = open_breaker()
+    circuit.check()
+    assert circuit.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(ApiUnavailableError):
+        circuit.check()
+
+
+def test_successful_probe_closes_circuit():
+    circuit = open_breaker()
+    circuit.check()
+    circuit.record(True)
+    assert circuit.state == CircuitBreaker.CLOSED
+    circuit.check()
+
+
+def test_failed_probe_reopens_circuit():
+    circuit = open_breaker()
+    circuit.check()
+    circuit.record(False)
+    assert circuit.state == CircuitBreaker.OPEN
+    assert circuit.metrics.counters['circuit_opened'] == 2
+
+
+def test_abandoned_probe_allows_another():
+    circuit = open_breaker()
+    circuit.check()
+    circuit.abandon_probe()
+    circuit.check()
+
+
+def test_token_bucket_bursts_then_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+    assert bucket.tokens < 0
+
+
+def test_token_bucket_disabled():
+    bucket = TokenBucket(rate=0, burst=1)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+def test_concurrency_limit_halves_on_overload_and_grows_back():
+    limiter = AdaptiveConcurrencyLimiter(ResiliencePolicy(max_concurrency=4), ResilienceMetrics())
+    assert all(limiter.try_acquire() for _ in range(4))
+    assert not limiter.try_acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2
+    for _ in range(3):
+        limiter.release(overloaded=False)
+    assert 2 < limiter.limit <= 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('not a date') is None
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
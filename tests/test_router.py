@@ -0,0 +1,66 @@
+from control_plane_openapi_mcp.core.router import PathRouter, split_path
+
+
+def make_router():
+    return PathRouter.from_operations([
+        ('/cc-ui/v1/stacks/{stackName}', 'GET'),
+        ('/cc-ui/v1/stacks/{stackName}', 'DELETE'),
+        ('/cc-ui/v1/stacks/summary', 'GET'),
+        ('/cc-ui/v1/stacks/{stackName}/clusters/{clusterId}', 'GET'),
+        ('/cc-ui/v1/stacks/{name}/releases', 'POST'),
+    ])
+
+
+def test_split_path_ignores_query_and_empty_segments():
+    assert split_path('/a//b/?x=1#frag') == ['a', 'b']
+
+
+def test_literal_segment_wins_over_parameter():
+    match = make_router().resolve('/cc-ui/v1/stacks/summary', 'GET')
+    assert match.path == '/cc-ui/v1/stacks/summary'
+    assert match.path_parameters == {}
+
+
+def test_falls_back_to_parameter_when_literal_lacks_method():
+    match = make_router().resolve('/cc-ui/v1/stacks/summary', 'DELETE')
+    assert match.path == '/cc-ui/v1/stacks/{stackName}'
+    assert match.path_parameters == {'stackName': 'summary'}
+
+
+def test_extracts_parameters_named_by_matched_template():
+    router = make_router()
+    match = router.resolve('/cc-ui/v1/stacks/prod/clusters/c-1', 'get')
+    assert match.method == 'GET'
+    assert match.path_parameters == {'stackName': 'prod', 'clusterId': 'c-1'}
+
+    match = router.resolve('/cc-ui/v1/stacks/prod/releases', 'POST')
+    assert match.path == '/cc-ui/v1/stacks/{name}/releases'
+    assert match.path_parameters == {'name': 'prod'}
+
+
+def test_unknown_path_or_method():
+    router = make_router()
+    assert router.resolve('/cc-ui/v1/stacks/prod/unknown', 'GET') is None
+    assert router.resolve('/cc-ui/v1/stacks/prod/releases', 'GET') is None
+    assert router.resolve('/cc-ui/v1/stacks/prod/releases').method == 'POST'
+
+
+def test_size_counts_routes():
+    assert len(make_router()) == 5
+
+
+def test_called_operation_is_described_only_once_the_spec_is_loaded(monkeypatch, sample_spec_path):
+    from control_plane_openapi_mcp import tools
+    from control_plane_openapi_mcp.core.service import OpenAPIService
+
+    service = OpenAPIService(sample_spec_path, 'test')
+    monkeypatch.setattr(tools, 'openapi_service', service)
+    assert tools._describe_called_operation('/cc-ui/v1/clusters/c-1', 200) is None
+    assert not service.is_ready()
+
+    service.initialize()
+    info = tools._describe_called_operation('/cc-ui/v1/clusters/c-1', 200)
+    assert info['operationId'] == 'getCluster'
+    assert info['path_parameters'] == {'clusterId': 'c-1'}
+    assert info['response_schema'] == 'Cluster'
+    assert tools._describe_called_operation('/cc-ui/v1/unknown', 200) is None
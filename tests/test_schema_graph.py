@@ -0,0 +1,46 @@
+from control_plane_openapi_mcp.core.schema_graph import SchemaGraph
+
+
+def _ref(name):
+    return {'$ref': f'#/components/schemas/{name}'}
+
+
+def test_dependencies_and_dependents(sample_spec):
+    graph = SchemaGraph.from_spec(sample_spec)
+    assert graph.dependencies('Stack') == {'Cluster': 1}
+    assert graph.dependencies('Stack', max_depth=2) == {'Cluster': 1, 'ClusterStatus': 2}
+    assert graph.dependents('ClusterStatus') == {'Cluster', 'Stack'}
+    assert 'Stack' in graph and 'Missing' not in graph
+
+
+def test_cycles_and_depths(sample_spec):
+    sample_spec['components']['schemas']['Page'] = {'type': 'object', 'properties': {'items': _ref('Stack')}}
+    graph = SchemaGraph.from_spec(sample_spec)
+    stack = graph.describe('Stack')
+    assert stack['cycle'] == ['Cluster', 'Stack']
+    assert stack['referenced_by'] == ['Cluster', 'Page']
+    assert graph.describe('ClusterStatus') == {'references': [], 'referenced_by': ['Cluster'], 'depth': 0, 'cycle': []}
+    # Members of a cycle share a depth, one above their deepest outside dependency
+    assert graph.depth['Stack'] == graph.depth['Cluster'] == 1
+    assert graph.depth['Page'] == 2
+    assert graph.describe('Missing') is None
+
+
+def test_operations_using_includes_path_level_parameters(sample_spec):
+    sample_spec['paths']['/cc-ui/v1/stacks/{stackName}']['parameters'][0]['schema'] = _ref('ClusterStatus')
+    graph = SchemaGraph.from_spec(sample_spec)
+    assert [op['operationId'] for op in graph.operations_using('ClusterStatus')] == ['getStack']
+    used = graph.operations_using('ClusterStatus', transitive=True)
+    assert {op['operationId'] for op in used} == {
+        'getAllStacks', 'createStack', 'getStack', 'getCluster'
+    }
+    assert [op['operationId'] for op in used if op['direct']] == ['getStack']
+
+
+def test_skips_deprecated_operations_and_round_trips(sample_spec):
+    sample_spec['paths']['/cc-ui/v1/stacks']['post']['deprecated'] = True
+    graph = SchemaGraph.from_spec(sample_spec)
+    assert 'POST /cc-ui/v1/stacks' not in graph.operations
+    restored = SchemaGraph.from_dict(graph.to_dict())
+    assert restored.describe('Stack') == graph.describe('Stack')
+    assert restored.operations_using('Stack') == graph.operations_using('Stack')
@@ -0,0 +1,50 @@
+import json
+
+from control_plane_openapi_mcp.core.schema_renderer import SchemaRenderer
+
+
+def make_renderer(sample_spec):
+    return SchemaRenderer(sample_spec['components']['schemas'])
+
+
+def test_expands_references_up_to_max_depth(sample_spec):
+    result = make_renderer(sample_spec).render('Stack', max_depth=0)
+    cluster = result.schema['properties']['clusters']['items']
+    assert cluster == {'schemaName': 'Cluster'}
+    assert result.collapsed == ['Cluster']
+    assert not result.truncated
+
+    result = make_renderer(sample_spec).render('Stack', max_depth=1)
+    cluster = result.schema['properties']['clusters']['items']
+    assert cluster['schemaName'] == 'Cluster'
+    # Enums are inlined without counting as a nesting level
+    assert cluster['properties']['status']['enum'] == ['RUNNING', 'STOPPED']
+    assert cluster['properties']['stack'] == {'schemaName': 'Stack', 'recursive': True}
+    assert result.collapsed == []
+
+
+def test_byte_budget_omits_remaining_properties(sample_spec):
+    schemas = sample_spec['components']['schemas']
+    schemas['Wide'] = {
+        'type': 'object',
+        'properties': {f'field{i}': {'type': 'string', 'description': 'x' * 40} for i in range(50)},
+    }
+    result = make_renderer(sample_spec).render('Wide', max_bytes=500)
+    assert result.truncated
+    marker = result.schema['properties']['...']
+    assert marker['omittedCount'] == 50 - (len(result.schema['properties']) - 1)
+    assert marker['omittedProperties'][0] == f'field{50 - marker["omittedCount"]}'
+    # The budget bounds the expanded properties; the omitted-name listing comes on top
+    rendered_fields = len(json.dumps(result.schema['properties'], separators=(',', ':'))) - len(json.dumps(marker))
+    assert rendered_fields < 600
+    assert result.size >= 500
+
+    full = make_renderer(sample_spec).render('Wide')
+    assert not full.truncated and len(full.schema['properties']) == 50
+
+
+def test_unknown_schema(sample_spec):
+    assert make_renderer(sample_spec).render('Missing') is None
+    sample_spec['components']['schemas']['Stack']['properties']['owner'] = {'$ref': '#/components/schemas/Missing'}
+    result = make_renderer(sample_spec).render('Stack')
+    assert result.schema['properties']['owner'] == {'schemaName': 'Missing'}
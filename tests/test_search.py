@@ -0,0 +1,48 @@
+import pytest
+
+from control_plane_openapi_mcp.core.models import SpecOperationEntry
+from control_plane_openapi_mcp.core.search import SearchEngine
+from control_plane_openapi_mcp.core.service import OpenAPIService
+
+
+OPERATIONS = [
+    SpecOperationEntry(path='/cc-ui/v1/clusters', method='GET', operation_id='listClusters', summary='List clusters'),
+    SpecOperationEntry(path='/cc-ui/v1/clusters', method='POST', operation_id='createCluster', summary='Create a cluster'),
+    SpecOperationEntry(path='/cc-ui/v1/stacks/{stackName}', method='GET', operation_id='getStack', summary='Get a stack'),
+]
+
+
+def test_fuzzy_multi_query_scores_each_query():
+    engine = SearchEngine('test')
+    ranked = engine.search_operations_multi(OPERATIONS, ['cluster', 'STACK ', 'cluster', ''], limit=5)
+    assert {position for position, _ in ranked[0]} == {0, 1}
+    assert ranked[1][0][0] == 2
+    # Repeated queries are scored once and share the result; blank queries match nothing here
+    assert ranked[2] == ranked[0]
+    assert ranked[3] == []
+    assert engine.search_operations_multi(OPERATIONS, ['cluster'], limit=5, candidates=[1, 2])[0][0][0] == 1
+
+
+@pytest.fixture
+def service(sample_spec_path):
+    service = OpenAPIService(sample_spec_path, 'test')
+    yield service
+    service.close()
+
+
+def test_service_multi_query_fuses_rankings(service):
+    per_query, merged = service.search_operations_multi(['cluster', 'stack'], limit=3, method='GET')
+    assert all(op.method == 'GET' for results in per_query for op in results)
+    assert per_query[0][0].operation['operationId'] == 'getCluster'
+    matched = {op.operation['operationId']: queries for op, _, queries in merged}
+    assert matched['getCluster'][0] == 0
+    assert 1 in matched['getStack']
+    assert [score for _, score, _ in merged] == sorted((score for _, score, _ in merged), reverse=True)
+
+
+def test_service_blank_query_matches_like_an_empty_single_search(service):
+    per_query, merged = service.search_operations_multi(['  ', 'cluster'], limit=10, tag='Cluster')
+    blank = [op.operation['operationId'] for op in per_query[0]]
+    assert blank == [op.operation['operationId'] for op in service.search_operations('', tag='Cluster')]
+    assert blank == ['getCluster', 'deleteCluster']
+    assert service.search_operations_multi(['cluster'], tag='unknown') == ([[]], [])
@@ -0,0 +1,29 @@
+import asyncio
+import base64
+from types import SimpleNamespace
+
+from control_plane_openapi_mcp import tools
+
+
+def context(username):
+    token = base64.b64encode(f'{username}:secret'.encode()).decode()
+    request = SimpleNamespace(headers={'authorization': f'Basic {token}'})
+    return SimpleNamespace(request_context=SimpleNamespace(request=request))
+
+
+def test_evicted_session_clients_are_closed(monkeypatch):
+    monkeypatch.setattr(tools, 'MAX_SESSION_CLIENTS', 1)
+    monkeypatch.setattr(tools, '_session_clients', type(tools._session_clients)())
+
+    async def scenario():
+        first = tools._api_client_for(context('alice'))
+        assert tools._api_client_for(context('alice')) is first
+        tools._api_client_for(context('bob'))
+        assert tools.session_client_count() == 1
+        # The close task is kept alive until it finishes
+        assert len(tools._closing) == 1
+        await asyncio.gather(*tools._closing)
+        assert not tools._closing
+        await tools._session_clients.popitem()[1].aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from control_plane_openapi_mcp.core import shared_cache
+from control_plane_openapi_mcp.core.shared_cache import SharedSpecCache
+from control_plane_openapi_mcp.utils.file_lock import FileLock
+
+
+@pytest.fixture
+def compiles(monkeypatch):
+    calls = []
+    compile_spec_artifact = shared_cache.compile_spec_artifact
+
+    def counting(*args, **kwargs):
+        calls.append(args[1])
+        return compile_spec_artifact(*args, **kwargs)
+
+    monkeypatch.setattr(shared_cache, 'compile_spec_artifact', counting)
+    return calls
+
+
+def make_cache(tmp_path, sample_spec_path, **kwargs):
+    return SharedSpecCache(str(tmp_path / 'cache'), sample_spec_path, 'test', ttl=3600, **kwargs)
+
+
+def test_second_process_reuses_compiled_artifact(tmp_path, sample_spec_path, compiles):
+    path = make_cache(tmp_path, sample_spec_path).get_artifact_path()
+    assert os.path.isfile(path)
+    assert make_cache(tmp_path, sample_spec_path).get_artifact_path() == path
+    assert len(compiles) == 1
+
+    manifest = json.load(open(os.path.join(os.path.dirname(path), shared_cache.MANIFEST_NAME)))
+    assert manifest['artifact'] == os.path.basename(path)
+    assert manifest['spec_version'] == '1.0'
+
+
+def test_waiter_uses_artifact_compiled_while_it_waited(tmp_path, sample_spec_path, compiles):
+    waiter = make_cache(tmp_path, sample_spec_path)
+    acquire = waiter._lock.acquire
+
+    def acquire_after_other_process_compiled():
+        make_cache(tmp_path, sample_spec_path).get_artifact_path()
+        return acquire()
+
+    waiter._lock.acquire = acquire_after_other_process_compiled
+    assert os.path.isfile(waiter.get_artifact_path())
+    assert len(compiles) == 1
+
+
+def test_recompiles_other_format_versions_and_changed_files(tmp_path, sample_spec, sample_spec_path, compiles):
+    cache = make_cache(tmp_path, sample_spec_path)
+    first = cache.get_artifact_path()
+    manifest = json.load(open(cache._manifest_path))
+    manifest['format_version'] -= 1
+    json.dump(manifest, open(cache._manifest_path, 'w'))
+    assert cache.get_artifact_path() == first
+    assert len(compiles) == 2
+
+    sample_spec['info']['version'] = '2.0'
+    with open(sample_spec_path, 'w') as f:
+        json.dump(sample_spec, f)
+    os.utime(sample_spec_path, (1, 1))
+    second = cache.get_artifact_path()
+    assert second != first and len(compiles) == 3
+    # Artifacts of superseded spec versions are removed
+    assert not os.path.exists(first)
+
+
+def test_gives_up_when_the_lock_is_held(tmp_path, sample_spec_path):
+    cache = make_cache(tmp_path, sample_spec_path, lock_timeout=0.2)
+    holder = FileLock(cache._lock.path)
+    assert holder.acquire()
+    try:
+        assert cache.get_artifact_path() is None
+    finally:
+        holder.release()
+    assert cache.get_artifact_path() is not None
@@ -0,0 +1,79 @@
+import json
+
+from control_plane_openapi_mcp.core.spec_loader import (
+    dereference_spec, escape_pointer_token, intern_spec, unescape_pointer_token
+)
+
+
+def ref(name):
+    return {'$ref': f'#/components/schemas/{name}'}
+
+
+def test_self_reference_is_left_as_ref():
+    spec = {'components': {'schemas': {
+        'Node': {'type': 'object', 'properties': {'next': ref('Node'), 'value': {'type': 'string'}}},
+    }}}
+    processed = dereference_spec(spec)
+    node = processed['components']['schemas']['Node']
+    assert node['properties']['next'] == ref('Node')
+    json.dumps(processed)
+
+
+def test_mutual_references_stay_acyclic():
+    spec = {
+        'paths': {'/a': {'get': {'responses': {'200': {'schema': ref('A')}}}}},
+        'components': {'schemas': {
+            'A': {'type': 'object', 'properties': {'b': ref('B')}},
+            'B': {'type': 'object', 'properties': {'a': ref('A')}},
+        }},
+    }
+    processed = dereference_spec(spec)
+    schemas = processed['components']['schemas']
+    assert schemas['A']['properties']['b']['properties']['a'] == ref('A')
+    # Each target is materialized once and shared by its references
+    assert schemas['A']['properties']['b'] is schemas['B']
+    assert processed['paths']['/a']['get']['responses']['200']['schema'] is schemas['A']
+    json.dumps(processed)
+
+
+def test_unresolvable_reference_is_kept():
+    spec = {'paths': {'/a': {'get': {'schema': ref('Missing')}}}}
+    assert dereference_spec(spec)['paths']['/a']['get']['schema'] == ref('Missing')
+
+
+def test_pointer_tokens_round_trip():
+    assert escape_pointer_token('a/b~c') == 'a~1b~0c'
+    assert unescape_pointer_token('a~1b~0c') == 'a/b~c'
+
+
+def test_unchanged_subtrees_are_shared_with_raw_spec():
+    info = {'title': 'api', 'version': '1'}
+    spec = {'info': info, 'paths': {}, 'components': {'schemas': {'Id': {'type': 'string'}}}}
+    stats = {}
+    processed = dereference_spec(spec, stats)
+    assert processed['info'] is info
+    assert processed['components']['schemas']['Id'] is spec['components']['schemas']['Id']
+    assert stats['shared_subtrees'] > 0
+
+
+def test_intern_shares_scalar_subtrees_and_keeps_values():
+    spec = {
+        'a': {'type': 'string', 'format': 'date-time'},
+        'b': {'type': 'string', 'format': 'date-time'},
+        'c': {'flag': True},
+        'd': {'flag': 1},
+    }
+    expected = json.loads(json.dumps(spec))
+    stats = intern_spec(spec)
+    assert spec == expected
+    assert spec['a'] is spec['b']
+    assert spec['c'] is not spec['d']
+    assert stats['subtrees'] == 1
+
+
+def test_intern_shares_equal_strings():
+    first, second = ''.join(['getSt', 'ack']), ''.join(['get', 'Stack'])
+    assert first is not second
+    spec = {'a': {'operationId': first}, 'b': {'operationId': second}}
+    intern_spec(spec)
+    assert spec['a']['operationId'] is spec['b']['operationId']
@@ -0,0 +1,37 @@
+import random
+
+from Levenshtein import distance
+
+from control_plane_openapi_mcp.core.service import OpenAPIService
+from control_plane_openapi_mcp.core.suggest import BKTree
+
+
+def test_suggests_closest_identifiers_first():
+    tree = BKTree(['getStack', 'getStacks', 'getCluster', 'deleteStack', 'createStack'])
+    assert len(tree) == 5
+    assert tree.search('getstak') == [('getStack', 1), ('getStacks', 2)]
+    assert tree.search('getstak', max_distance=1) == [('getStack', 1)]
+    assert tree.search('getStacks', limit=1) == [('getStacks', 0)]
+    assert tree.search('listReleases') == []
+    assert BKTree().search('anything') == []
+
+
+def test_spellings_folding_to_one_key_share_a_node():
+    tree = BKTree(['StackDTO', 'stackDto', 'StackDTO', ''])
+    assert len(tree) == 1
+    assert tree.search('stackdt') == [('StackDTO', 1), ('stackDto', 1)]
+
+
+def test_matches_a_linear_scan():
+    rng = random.Random(7)
+    words = {''.join(rng.choice('abcde') for _ in range(rng.randint(3, 8))) for _ in range(300)}
+    tree = BKTree(words)
+    for query in ('abc', 'deadbe', 'eeee', 'cabbage'):
+        expected = sorted((distance(query, word), word) for word in words if distance(query, word) <= 2)
+        assert tree.search(query, limit=len(words)) == [(word, d) for d, word in expected]
+
+
+def test_service_suggests_near_miss_identifiers(sample_spec_path):
+    service = OpenAPIService(sample_spec_path, 'test')
+    assert service.suggest_identifiers('operation_id', 'getClustr') == [{'name': 'getCluster', 'distance': 1}]
+    assert service.suggest_identifiers('schema', 'stak')[0] == {'name': 'Stack', 'distance': 1}
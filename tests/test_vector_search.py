@@ -0,0 +1,94 @@
+from collections import Counter
+
+import pytest
+
+from control_plane_openapi_mcp.core.models import SpecCatalogEntry, SpecOperationEntry, SpecSchemaEntry
+from control_plane_openapi_mcp.core.vector_search import TfidfMatrix, TfidfSearchEngine, extract_features, tokenize
+
+np = pytest.importorskip('numpy')
+
+
+CATALOG = SpecCatalogEntry(
+    spec_id='test',
+    operations=[
+        SpecOperationEntry(path='/cc-ui/v1/stacks', method='GET', operation_id='getAllStacks',
+                           summary='List all stacks', tags=['Stack']),
+        SpecOperationEntry(path='/cc-ui/v1/clusters/{clusterId}', method='GET', operation_id='getCluster',
+                           summary='Get a cluster', tags=['Cluster']),
+        SpecOperationEntry(path='/cc-ui/v1/clusters/{clusterId}/deployments', method='POST',
+                           operation_id='triggerDeployment', summary='Deploy a cluster',
+                           description='Starts a release of the cluster', tags=['Deployment']),
+        SpecOperationEntry(path='/cc-ui/v1/users', method='GET', operation_id='listUsers',
+                           summary='List users', tags=['User']),
+    ],
+    schemas=[
+        SpecSchemaEntry(name='ClusterDTO', description='A cluster'),
+        SpecSchemaEntry(name='UserDTO', description='A user account'),
+    ],
+)
+
+
+@pytest.fixture
+def engine():
+    engine = TfidfSearchEngine('test')
+    engine.index_catalog(CATALOG)
+    return engine
+
+
+def test_tokenize_splits_camel_case_and_drops_stop_words():
+    assert tokenize('getAllStacks for the HTTPServer') == ['stacks', 'http', 'server']
+
+
+def test_rows_are_l2_normalized():
+    matrix = TfidfMatrix([extract_features('list stacks'), extract_features('get cluster cluster')])
+    norms = np.sqrt(np.bincount(matrix.rows, weights=matrix.values.astype(np.float64) ** 2))
+    assert norms == pytest.approx([1.0, 1.0], abs=1e-5)
+
+
+def test_unknown_query_vectorizes_to_none():
+    matrix = TfidfMatrix([extract_features('list stacks')])
+    assert matrix.vectorize(Counter({'w:zzz': 1})) is None
+
+
+def test_natural_language_query_ranks_relevant_operation_first(engine):
+    assert engine.search_operations('how do I deploy my cluster', limit=1)[0].operation_id == 'triggerDeployment'
+    assert engine.search_operations('show me the users')[0].operation_id == 'listUsers'
+    assert engine.search_operations('qqqq') == []
+
+
+def test_pagination_and_blank_query(engine):
+    everything = engine.search_operations('cluster')
+    assert engine.search_operations('cluster', limit=1, offset=1) == everything[1:2]
+    assert len(engine.search_operations('')) == 4
+
+
+def test_score_many_matches_score(engine):
+    matrix = engine._operation_matrix
+    vectors = np.stack([matrix.vectorize(extract_features(query)) for query in ('cluster', 'users')])
+    scores = matrix.score_many(vectors)
+    for row, vector in enumerate(vectors):
+        assert scores[row] == pytest.approx(matrix.score(vector), abs=1e-6)
+
+
+def test_schema_search(engine):
+    assert engine.search_schemas('user account')[0].name == 'UserDTO'
+
+
+def test_candidates_restrict_scoring(engine):
+    assert [op.operation_id for op in engine.search_operations('cluster', candidates=[0, 2, 2])] == \
+        ['triggerDeployment']
+    assert engine.search_operations('cluster', candidates=[]) == []
+
+    matrix = engine._operation_matrix
+    vector = matrix.vectorize(extract_features('cluster'))
+    rows = np.array([2, 3])
+    scores = matrix.score(vector, rows)
+    assert scores[1] == 0 and scores[2] == pytest.approx(matrix.score(vector)[2])
+    assert matrix.score_many(vector[None, :], rows)[0] == pytest.approx(scores)
+
+
+def test_multi_query_with_candidates(engine):
+    ranked = engine.search_operations_multi(['cluster', 'users', 'qqqq'], 5, candidates=[1, 3])
+    assert ranked[0][0][0] == 1 and ranked[1][0][0] == 3
+    assert {position for result in ranked for position, _ in result} <= {1, 3}
+    assert ranked[2] == []
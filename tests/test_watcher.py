@@ -0,0 +1,88 @@
+import os
+import threading
+import time
+
+from control_plane_openapi_mcp.core.watcher import SpecWatcher, file_stamp
+
+
+def touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_stamp(tmp_path):
+    path = tmp_path / 'openapi.json'
+    assert file_stamp(str(path)) is None
+    path.write_text('{}')
+    touch(path, 1_000_000_000)
+    assert file_stamp(str(path)) == (1_000_000_000, 2)
+
+
+def test_reports_a_change_once_the_file_settles(tmp_path):
+    path = tmp_path / 'openapi.json'
+    path.write_text('{}')
+    changed = threading.Event()
+    watcher = SpecWatcher(str(path), changed.set, interval=0.1)
+    watcher.start()
+    try:
+        # A file rewritten more often than the interval is still being written
+        deadline = time.monotonic() + 0.5
+        mtime = 2_000_000_000
+        while time.monotonic() < deadline:
+            mtime += 1_000_000
+            touch(path, mtime)
+            time.sleep(0.02)
+        assert not changed.is_set()
+
+        assert changed.wait(2)
+        assert watcher.changes == 1
+        # The reloaded version is the new baseline
+        time.sleep(0.3)
+        assert watcher.changes == 1
+    finally:
+        watcher.stop()
+
+
+def test_ignores_missing_file_and_survives_callback_errors(tmp_path):
+    path = tmp_path / 'openapi.json'
+    path.write_text('{}')
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise ValueError('bad spec')
+
+    watcher = SpecWatcher(str(path), fail, interval=0.05)
+    watcher.start()
+    try:
+        path.unlink()
+        time.sleep(0.2)
+        assert calls == []
+        path.write_text('{"openapi": "3.0.0"}')
+        deadline = time.monotonic() + 2
+        while len(calls) < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        path.write_text('{"openapi": "3.1.0", "x": 1}')
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert len(calls) == 2
+    finally:
+        watcher.stop()
+
+
+def test_service_reloads_changed_spec_file(sample_spec, sample_spec_path):
+    import json
+    from control_plane_openapi_mcp.core.service import OpenAPIService
+
+    service = OpenAPIService(sample_spec_path, 'test', watch_interval=0.05)
+    service.initialize()
+    try:
+        assert service.find_operation_by_id('listReleases') is None
+        sample_spec['paths']['/cc-ui/v1/releases'] = {'get': {'operationId': 'listReleases', 'responses': {}}}
+        with open(sample_spec_path, 'w') as f:
+            json.dump(sample_spec, f)
+        deadline = time.monotonic() + 3
+        while service.get_status()['reloads'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert service.find_operation_by_id('listReleases').path == '/cc-ui/v1/releases'
+    finally:
+        service.close()